@@ -0,0 +1,116 @@
+"""
+Micro-benchmarks of the group reduction kernels against the pandas
+groupby chain report 1 was built with
+
+Usage:
+    python -m benchmarks.bench_kernels [rows]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from xetra.transformers.kernels import JIT_AVAILABLE, group_reduce
+
+
+def make_source(rows: int, seed: int = 42):
+    """
+    Random source rows with 3000 ISINs over 5 days
+    """
+    rng = np.random.default_rng(seed)
+    prices = rng.integers(100, 10000, size=(rows, 3)) / 100
+    return pd.DataFrame(
+        {
+            "ISIN": rng.choice([f"DE000{i:07d}" for i in range(3000)], rows),
+            "Date": rng.choice([f"2021-04-{day:02d}" for day in range(12, 17)], rows),
+            "Time": [f"{m // 60 % 24:02d}:{m % 60:02d}" for m in range(rows)],
+            "StartPrice": prices[:, 0],
+            "MinPrice": prices.min(axis=1),
+            "MaxPrice": prices.max(axis=1),
+            "TradedVolume": rng.integers(0, 5000, rows),
+        }
+    )
+
+
+def groupby_chain(data_frame: pd.DataFrame):
+    """
+    groupby().transform() + groupby().agg() chain as used before the kernels
+    """
+    data_frame = data_frame.copy()
+    by_time = data_frame.sort_values(by=["Time"]).groupby(["ISIN", "Date"])
+    data_frame["open"] = by_time["StartPrice"].transform("first")
+    data_frame["close"] = by_time["StartPrice"].transform("last")
+    return data_frame.groupby(["ISIN", "Date"], as_index=False).agg(
+        {
+            "open": "min",
+            "close": "min",
+            "MinPrice": "min",
+            "MaxPrice": "max",
+            "TradedVolume": "sum",
+        }
+    )
+
+
+def kernel(data_frame: pd.DataFrame, use_jit: bool = False):
+    """
+    factorize + lexsort + group_reduce as used by the pandas engine
+    """
+    isin_codes, _ = pd.factorize(data_frame["ISIN"], sort=True)
+    date_codes, _ = pd.factorize(data_frame["Date"], sort=True)
+    time_codes, _ = pd.factorize(data_frame["Time"], sort=True)
+    order = np.lexsort((time_codes, date_codes, isin_codes))
+    return group_reduce(
+        [isin_codes[order], date_codes[order]],
+        data_frame["StartPrice"].to_numpy()[order],
+        data_frame["MinPrice"].to_numpy()[order],
+        data_frame["MaxPrice"].to_numpy()[order],
+        [data_frame["TradedVolume"].to_numpy()[order]],
+        use_jit=use_jit,
+    )
+
+
+def sorted_kernel(arrays: tuple, use_jit: bool = False):
+    """
+    group_reduce alone on already sorted arrays
+    """
+    keys, first_last, minimum, maximum, volume = arrays
+    return group_reduce(keys, first_last, minimum, maximum, [volume], use_jit)
+
+
+def main():
+    """
+    Runs the benchmarks and prints the best time of 5 repetitions
+    """
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data_frame = make_source(rows)
+    sorted_df = data_frame.sort_values(by=["ISIN", "Date", "Time"])
+    arrays = (
+        [
+            pd.factorize(sorted_df["ISIN"])[0],
+            pd.factorize(sorted_df["Date"])[0],
+        ],
+        sorted_df["StartPrice"].to_numpy(),
+        sorted_df["MinPrice"].to_numpy(),
+        sorted_df["MaxPrice"].to_numpy(),
+        sorted_df["TradedVolume"].to_numpy(),
+    )
+    benchmarks = {
+        "pandas groupby chain": lambda: groupby_chain(data_frame),
+        "factorize + lexsort + kernel": lambda: kernel(data_frame),
+        "kernel on sorted arrays": lambda: sorted_kernel(arrays),
+    }
+    if JIT_AVAILABLE:
+        sorted_kernel(arrays, use_jit=True)  # compiling
+        benchmarks["jit kernel on sorted arrays"] = lambda: sorted_kernel(
+            arrays, use_jit=True
+        )
+    print(f"{rows} rows")
+    for name, function in benchmarks.items():
+        best = min(timeit.repeat(function, number=1, repeat=5))
+        print(f"{name:32s} {best * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Measures the throughput numbers and expansion ratios of the backfill
+planner (the plan section of the config, see XetraPlanConfig)
+
+Parsing and aggregating are measured on random source files, the download
+throughput only if a config file is given (the first source files of
+src_first_extract_date are downloaded from the source bucket).
+
+Usage:
+    python -m benchmarks.bench_plan [rows_per_file] [config.yaml]
+"""
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from xetra.common.storage import get_storage_connector
+from xetra.transformers.engines.pandas_engine import PandasEngine
+from xetra.transformers.lean_dtypes import to_lean_dtypes
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+
+CONFIG = "configs/xetra_report1_config.yaml"
+MB = 1024 * 1024
+
+
+def make_source_file(rows: int, seed: int = 42):
+    """
+    Content of a random source csv file (one hour of one day, 3000 ISINs)
+    """
+    rng = np.random.default_rng(seed)
+    prices = rng.integers(100, 10000, size=(rows, 3)) / 100
+    data_frame = pd.DataFrame(
+        {
+            "ISIN": rng.choice([f"DE000{i:07d}" for i in range(3000)], rows),
+            "Mnemonic": rng.choice([f"M{i:03d}" for i in range(3000)], rows),
+            "SecurityDesc": "SOME SECURITY DESCRIPTION",
+            "SecurityType": "Common stock",
+            "Currency": "EUR",
+            "SecurityID": rng.integers(2_000_000, 3_000_000, rows),
+            "Date": "2021-04-15",
+            "Time": [f"10:{m % 60:02d}" for m in range(rows)],
+            "StartPrice": prices[:, 0],
+            "MaxPrice": prices.max(axis=1),
+            "MinPrice": prices.min(axis=1),
+            "EndPrice": prices[:, 1],
+            "TradedVolume": rng.integers(0, 5000, rows),
+            "NumberOfTrades": rng.integers(1, 50, rows),
+        }
+    )
+    return data_frame.to_csv(index=False).encode()
+
+
+def best_mb_s(function, size: int, repeat: int = 5):
+    """
+    Best throughput of repeat runs in MB of source data per second
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return size / MB / best
+
+
+def main():
+    """
+    Runs the measurements and prints them as plan section of the config
+    """
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    config_file = sys.argv[2] if len(sys.argv) > 2 else None
+    with open(config_file or CONFIG, encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    src_args = XetraSourceConfig(**config["source"])
+    engine = PandasEngine(src_args, XetraTargetConfig(**config["target"]))
+    content = make_source_file(rows)
+    data_frame = pd.read_csv(BytesIO(content))
+    plan = {
+        "plan_parse_mb_s": best_mb_s(
+            lambda: pd.read_csv(BytesIO(content)), len(content)
+        ),
+        "plan_aggregate_mb_s": best_mb_s(
+            lambda: engine.aggregate_report1(data_frame, partial=True), len(content)
+        ),
+        "plan_expansion": data_frame.memory_usage(deep=True).sum() / len(content),
+        "plan_lean_expansion": to_lean_dtypes(data_frame, src_args, 4)
+        .memory_usage(deep=True)
+        .sum()
+        / len(content),
+    }
+    if config_file:
+        s3_config = config["s3"]
+        s3_bucket_src = get_storage_connector(
+            bucket=s3_config["src_bucket"],
+            endpoint_url=s3_config["src_endpoint_url"],
+            local_dir=s3_config.get("local_dir"),
+        )
+        keys = s3_bucket_src.list_files_in_prefix(
+            config["source"]["src_first_extract_date"]
+        )[:20]
+        start = time.perf_counter()
+        size = sum(len(s3_bucket_src.read_object(key)) for key in keys)
+        if size:
+            plan["plan_download_mb_s"] = size / MB / (time.perf_counter() - start)
+    print(f"# {rows} rows per file, {len(content) / MB:.1f} MB")
+    print("plan:")
+    for name, value in plan.items():
+        print(f"  {name}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of the source data validation against parsing and aggregating
+the same source file (the overhead the validation adds to the hot path)
+
+Usage:
+    python -m benchmarks.bench_validation [rows]
+"""
+
+import sys
+import timeit
+from io import BytesIO
+
+import pandas as pd
+import yaml
+
+from benchmarks.bench_plan import CONFIG, make_source_file
+from xetra.transformers.engines.pandas_engine import PandasEngine
+from xetra.transformers.validation import SourceValidator
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+
+
+def main():
+    """
+    Runs the benchmarks and prints the best time of 5 repetitions
+    """
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with open(CONFIG, encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    src_args = XetraSourceConfig(**config["source"])
+    engine = PandasEngine(src_args, XetraTargetConfig(**config["target"]))
+    content = make_source_file(rows)
+    data_frame = pd.read_csv(BytesIO(content))
+    benchmarks = {
+        "parse csv": lambda: pd.read_csv(BytesIO(content)),
+        "validate": lambda: SourceValidator(src_args).validate(data_frame),
+        "aggregate": lambda: engine.aggregate_report1(data_frame, partial=True),
+    }
+    print(f"{rows} rows")
+    times = {}
+    for name, function in benchmarks.items():
+        times[name] = min(timeit.repeat(function, number=1, repeat=5))
+        print(f"{name:32s} {times[name] * 1000:10.1f} ms")
+    overhead = times["validate"] / (times["parse csv"] + times["aggregate"])
+    print(f"{'validation overhead':32s} {overhead * 100:10.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,12 @@ import logging.config
 
 import yaml
 
-from xetra.common.s3 import S3BucketConnector
-from xetra.transformers.xetra_transformer import (
-    XetraETL,
-    XetraSourceConfig,
-    XetraTargetConfig,
-)
+# Only modules without pandas/pyarrow/numba imports are loaded before
+# the check for missing source dates, the transformers are imported in
+# run_jobs (a run with nothing to process exits within the startup time
+# of the interpreter, boto3 and one GET of the meta file)
+from xetra.common.meta_process import MetaProcess
+from xetra.common.storage import get_storage_connector
 
 
 def main():
@@ -21,6 +21,26 @@ def main():
     # Parsing YML file
     parser = argparse.ArgumentParser(description="Run the Xetra ETL Job.")
     parser.add_argument("config", help="A configuration file in YAML format.")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Merge the report 1 files per month instead of running the ETL job.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run the ETL job even if the meta file lists all source dates.",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Estimate size, memory and runtime of the ETL job without running it.",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Write cProfile and tracemalloc results of every ETL stage to DIR.",
+    )
     args = parser.parse_args()
 
     config = yaml.safe_load(open(args.config))
@@ -29,21 +49,139 @@ def main():
     logging.config.dictConfig(log_config)
     # reading s3 configuration
     s3_config = config["s3"]
-    # creating the S3BucketConnector classes for source and target
-    s3_bucket_src = S3BucketConnector(
-        bucket=s3_config["src_bucket"], endpoint_url=s3_config["src_endpoint_url"]
+    # creating the connectors for source and target (S3 or local copies)
+    s3_bucket_src = get_storage_connector(
+        bucket=s3_config["src_bucket"],
+        endpoint_url=s3_config["src_endpoint_url"],
+        local_dir=s3_config.get("local_dir"),
+    )
+    s3_bucket_trg = get_storage_connector(
+        bucket=s3_config["trg_bucket"],
+        endpoint_url=s3_config["trg_endpoint_url"],
+        local_dir=s3_config.get("local_dir"),
+    )
+    logger = logging.getLogger(__name__)
+    if args.plan:
+        plan_job(config, s3_bucket_src, s3_bucket_trg)
+        return
+    extract_dates = None
+    if not args.compact and not args.force:
+        # Fast path: nothing to process -> exiting before the heavy imports
+        extract_dates = MetaProcess.return_date_list(
+            config["source"]["src_first_extract_date"],
+            config["meta"]["meta_key"],
+            s3_bucket_trg,
+        )
+        if not extract_dates[1]:
+            logger.info("No new Xetra source dates to process. Xetra ETL job skipped.")
+            return
+    run_jobs(args, config, s3_bucket_src, s3_bucket_trg, extract_dates)
+
+
+def plan_job(config: dict, s3_bucket_src, s3_bucket_trg):
+    """
+    printing the estimate of the next ETL job, only the meta file is read
+    and the source files are listed
+
+    :param config: parsed configuration file
+    :param s3_bucket_src: connector to the source bucket
+    :param s3_bucket_trg: connector to the target bucket
+    """
+    # pylint: disable=import-outside-toplevel
+    from xetra.transformers.xetra_planner import XetraBackfillPlanner, XetraPlanConfig
+    from xetra.transformers.xetra_transformer import XetraRunConfig, XetraSourceConfig
+
+    planner = XetraBackfillPlanner(
+        s3_bucket_src,
+        s3_bucket_trg,
+        config["meta"]["meta_key"],
+        XetraSourceConfig(**config["source"]),
+        XetraRunConfig(**config.get("run", {})),
+        XetraPlanConfig(**config.get("plan", {})),
     )
-    s3_bucket_trg = S3BucketConnector(
-        bucket=s3_config["trg_bucket"], endpoint_url=s3_config["trg_endpoint_url"]
+    print(planner.report(planner.plan()))
+
+
+def run_jobs(
+    args, config: dict, s3_bucket_src, s3_bucket_trg, extract_dates: tuple = None
+):
+    """
+    running the Xetra ETL job or the compaction job
+
+    :param args: parsed command line arguments
+    :param config: parsed configuration file
+    :param s3_bucket_src: connector to the source bucket
+    :param s3_bucket_trg: connector to the target bucket
+    :param extract_dates: dates returned by MetaProcess.return_date_list if
+      the meta file was already read, so it is not read again
+    """
+    # pylint: disable=import-outside-toplevel
+    from xetra.common.profiling import StageProfiler
+    from xetra.transformers.xetra_compaction import (
+        XetraCompactionConfig,
+        XetraReportCompaction,
     )
+    from xetra.transformers.xetra_rolling_report import (
+        XetraRollingConfig,
+        XetraRollingReport,
+    )
+    from xetra.transformers.xetra_top_movers import (
+        XetraTopMovers,
+        XetraTopMoversConfig,
+    )
+    from xetra.transformers.xetra_transformer import (
+        XetraETL,
+        XetraRunConfig,
+        XetraSourceConfig,
+        XetraTargetConfig,
+    )
+
     # reading source configuration
     source_config = XetraSourceConfig(**config["source"])
     # reading target configuration
     target_config = XetraTargetConfig(**config["target"])
+    # reading optional run configuration
+    run_config = XetraRunConfig(**config.get("run", {}))
     # reading meta file configuration
     meta_config = config["meta"]
-    # creating XetraETL class
+    # reading optional configuration of reports derived from report 1
+    derived_reports = []
+    if "rolling" in config:
+        derived_reports.append(
+            XetraRollingReport(
+                s3_bucket_trg,
+                source_config,
+                target_config,
+                XetraRollingConfig(**config["rolling"]),
+            )
+        )
+    if "top_movers" in config:
+        derived_reports.append(
+            XetraTopMovers(
+                s3_bucket_trg,
+                source_config,
+                target_config,
+                XetraTopMoversConfig(**config["top_movers"]),
+            )
+        )
     logger = logging.getLogger(__name__)
+    if args.compact:
+        # compacting the report 1 files
+        logger.info("Xetra report compaction job started.")
+        XetraReportCompaction(
+            s3_bucket_trg,
+            source_config,
+            target_config,
+            XetraCompactionConfig(**config["compaction"]),
+            meta_config.get("manifest_key"),
+        ).compact()
+        logger.info("Xetra report compaction job finished.")
+        return
+    # profiling the stages if requested
+    profiler = None
+    if args.profile:
+        profiler = StageProfiler(args.profile)
+    # creating XetraETL class
     logger.info("Xetra ETL job started.")
     xetra_etl = XetraETL(
         s3_bucket_src,
@@ -51,6 +189,12 @@ def main():
         meta_config["meta_key"],
         source_config,
         target_config,
+        derived_reports,
+        meta_config.get("isin_dict_key"),
+        run_config,
+        meta_config.get("manifest_key"),
+        profiler,
+        extract_dates,
     )
     # running etl job for xetra report 1
     xetra_etl.etl_report1()
@@ -0,0 +1,156 @@
+"""
+TestAsyncS3BucketConnectorMethods
+"""
+
+import os
+import unittest
+from io import BytesIO
+
+import boto3
+import pandas as pd
+from moto.server import ThreadedMotoServer
+
+from xetra.common.async_s3 import AsyncS3BucketConnector
+from xetra.common.custom_exceptions import NoSuchKeyException, WrongFormatException
+from xetra.common.storage import compress
+
+
+class TestAsyncS3BucketConnectorMethods(unittest.IsolatedAsyncioTestCase):
+    """
+    Testing the AsyncS3BucketConnector class against a local moto server
+    (aiobotocore does not go through the in-process moto mock)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Starting the moto server on a free port
+        """
+        cls.server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+        cls.server.start()
+        host, port = cls.server.get_host_and_port()
+        cls.s3_endpoint_url = f"http://{host}:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.s3_bucket_name = "test-bucket"
+        os.environ["AWS_ACCESS_KEY_ID"] = "KEY1"
+        os.environ["AWS_SECRET_ACCESS_KEY"] = "KEY2"
+        os.environ["AWS_DEFAULT_REGION"] = "eu-central-1"
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket = self.s3.Bucket(self.s3_bucket_name)
+
+    def tearDown(self):
+        self.s3_bucket.objects.all().delete()
+        self.s3_bucket.delete()
+
+    def connector(self, **kwargs):
+        return AsyncS3BucketConnector(
+            bucket=self.s3_bucket_name, endpoint_url=self.s3_endpoint_url, **kwargs
+        )
+
+    async def test_list_files_in_prefix_ok(self):
+        """
+        Tests listing more keys than fit into one list response
+        """
+        keys_exp = sorted(f"prefix/test{i:04}.csv" for i in range(1005))
+        for key in keys_exp:
+            self.s3_bucket.put_object(Body=b"col1\n1", Key=key)
+        self.s3_bucket.put_object(Body=b"col1\n1", Key="other/test.csv")
+        async with self.connector() as s3_conn:
+            list_result = await s3_conn.list_files_in_prefix("prefix/")
+            list_empty = await s3_conn.list_files_in_prefix("no-prefix/")
+        self.assertEqual(keys_exp, sorted(list_result))
+        self.assertEqual([], list_empty)
+
+    async def test_read_csvs_to_df_ok(self):
+        """
+        Tests reading many small csv files concurrently in key order
+        """
+        keys = [f"prefix/test{i}.csv" for i in range(50)]
+        for i, key in enumerate(keys):
+            self.s3_bucket.put_object(Body=f"col1,col2\n{i},v{i}", Key=key)
+        async with self.connector(max_concurrency=10) as s3_conn:
+            frames = await s3_conn.read_csvs_to_df(keys)
+            content = await s3_conn.read_object(keys[3])
+        self.assertEqual(list(range(50)), [df["col1"].iloc[0] for df in frames])
+        self.assertEqual("v7", frames[7]["col2"].iloc[0])
+        self.assertEqual(b"col1,col2\n3,v3", content)
+
+    async def test_read_csvs_to_df_max_bytes_in_flight(self):
+        """
+        Tests that the listed sizes of the files read at the same time
+        stay below max_bytes_in_flight
+        """
+        keys = [f"prefix/test{i}.csv" for i in range(20)]
+        for i, key in enumerate(keys):
+            self.s3_bucket.put_object(Body=f"col1,col2\n{i:02},v{i:04}", Key=key)
+        async with self.connector(max_bytes_in_flight=40) as s3_conn:
+            sizes = await s3_conn.list_file_sizes("prefix/")
+            get_body = s3_conn._get_body
+            in_flight = []
+
+            async def record_get_body(key):
+                in_flight.append(s3_conn._bytes_in_flight)
+                return await get_body(key)
+
+            s3_conn._get_body = record_get_body
+            frames = await s3_conn.read_csvs_to_df(keys, sizes=sizes)
+            contents = await s3_conn.read_objects(keys, sizes=sizes)
+        self.assertEqual({key: 18 for key in keys}, sizes)
+        self.assertEqual(list(range(20)), [df["col1"].iloc[0] for df in frames])
+        self.assertEqual(b"col1,col2\n03,v0003", contents[3])
+        self.assertEqual(40, len(in_flight))
+        self.assertLessEqual(max(in_flight), 36)
+        self.assertEqual(0, s3_conn._bytes_in_flight)
+
+    async def test_read_compressed_and_missing(self):
+        """
+        Tests reading gzip and zstd compressed csv files and
+        a missing file like with the synchronous connector
+        """
+        content = b"col1,col2\n1,v1"
+        self.s3_bucket.put_object(Body=compress(content, "gzip"), Key="test.csv.gz")
+        self.s3_bucket.put_object(Body=compress(content, "zstd"), Key="test.csv.zst")
+        async with self.connector() as s3_conn:
+            df_gzip = await s3_conn.read_csv_to_df("test.csv.gz")
+            df_zstd = await s3_conn.read_csv_to_df("test.csv.zst")
+            content_result = await s3_conn.read_object("test.csv.gz", decompress=True)
+            with self.assertRaises(NoSuchKeyException):
+                await s3_conn.read_csv_to_df("missing.csv")
+        self.assertEqual("v1", df_gzip["col2"].iloc[0])
+        self.assertTrue(df_gzip.equals(df_zstd))
+        self.assertEqual(content, content_result)
+
+    async def test_write_df_to_s3_parquet(self):
+        """
+        Tests writing a DataFrame as parquet file
+        """
+        key_exp = "test.parquet"
+        df_exp = pd.DataFrame([["A", "B"], ["C", "D"]], columns=["col1", "col2"])
+        async with self.connector() as s3_conn:
+            result = await s3_conn.write_df_to_s3(df_exp, key_exp, "parquet")
+            result_empty = await s3_conn.write_df_to_s3(
+                pd.DataFrame(), "empty.parquet", "parquet"
+            )
+            with self.assertRaises(WrongFormatException):
+                await s3_conn.write_df_to_s3(df_exp, "test.txt", "txt")
+        self.assertTrue(result)
+        self.assertIsNone(result_empty)
+        data = self.s3_bucket.Object(key=key_exp).get().get("Body").read()
+        pd.testing.assert_frame_equal(df_exp, pd.read_parquet(BytesIO(data)))
+        self.assertEqual([key_exp], [obj.key for obj in self.s3_bucket.objects.all()])
+
+
+if __name__ == "__main__":
+    unittest.main()
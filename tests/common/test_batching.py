@@ -0,0 +1,125 @@
+"""
+TestAdaptiveBatcherMethods
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from xetra.common.batching import AdaptiveBatcher, InFlightBytes
+
+
+class TestAdaptiveBatcherMethods(unittest.TestCase):
+    """
+    Testing the AdaptiveBatcher class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # 1 MB budget with expansion 2.0 and overhead 2.0 -> 256 KB per batch
+        self.batcher = AdaptiveBatcher(1)
+        self.files = {f"file{i}.csv": 100_000 for i in range(6)}
+
+    def test_batches_grow_and_shrink(self):
+        """
+        Tests that the batches follow the observed expansion ratios
+        """
+        # Expected results
+        batches_exp = [
+            ["file0.csv", "file1.csv"],
+            ["file2.csv", "file3.csv", "file4.csv", "file5.csv"],
+        ]
+        # Method execution
+        batches = []
+        for batch in self.batcher.batches(self.files):
+            batches.append(batch)
+            # the files expand less than expected -> 512 KB per batch
+            for key in batch:
+                self.batcher.observe(self.files[key], self.files[key])
+        # Test after method execution
+        self.assertEqual(batches_exp, batches)
+        self.assertEqual(1.0, self.batcher.expansion)
+        # Method execution: the files expand more -> 64 KB per batch
+        self.batcher.observe(100_000, 800_000)
+        batches = []
+        with self.assertLogs("xetra.common.batching", level="WARNING") as logs:
+            for batch in self.batcher.batches(self.files):
+                batches.append(batch)
+                self.batcher.observe(self.files[batch[0]], 8 * self.files[batch[0]])
+        # Test after method execution
+        self.assertEqual([[key] for key in self.files], batches)
+        self.assertEqual(6, len(logs.output))
+
+    def test_hold_reduces_batches(self):
+        """
+        Tests that memory kept between batches reduces the following batches
+        """
+        # Test init
+        self.batcher.hold(1024 * 1024 - 4 * 100_000)
+        # Method execution
+        batches = list(self.batcher.batches({"a.csv": 100_000, "b.csv": 0}))
+        # Test after method execution
+        self.assertEqual(100_000, self.batcher.batch_bytes())
+        self.assertEqual([["a.csv", "b.csv"]], batches)
+
+    def test_read_bytes(self):
+        """
+        Tests that the raw content and the parsed DataFrames of the files
+        read at the same time fit into the memory budget
+        """
+        # Test init: 1 MB budget with expansion 2.0 -> 1/3 MB
+        self.assertEqual(349_525, self.batcher.read_bytes())
+        # Method execution
+        self.batcher.hold(1024 * 1024 - 300_000)
+        self.batcher.observe(100_000, 100_000)
+        self.batcher.batch_bytes()
+        # Test after method execution
+        self.assertEqual(150_000, self.batcher.read_bytes())
+
+
+class TestInFlightBytesMethods(unittest.TestCase):
+    """
+    Testing the InFlightBytes class.
+    """
+
+    def read_files(self, limit: int, sizes: list):
+        """
+        Reading files of the given sizes with 4 threads
+
+        returns:
+          max_in_flight: largest number of bytes read at the same time
+        """
+        in_flight = InFlightBytes(limit)
+        lock = threading.Lock()
+        max_in_flight = [0]
+
+        def read(size):
+            with in_flight.reserve(size):
+                with lock:
+                    max_in_flight[0] = max(max_in_flight[0], in_flight.in_flight)
+                time.sleep(0.01)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(read, sizes))
+        self.assertEqual(0, in_flight.in_flight)
+        return max_in_flight[0]
+
+    def test_reserve_limits_bytes(self):
+        """
+        Tests that the files read at the same time stay below the limit
+        """
+        self.assertLessEqual(self.read_files(250, [100] * 8), 200)
+        self.assertLessEqual(self.read_files(1000, [100] * 8), 400)
+
+    def test_reserve_large_file_alone(self):
+        """
+        Tests that a file larger than the limit is read alone
+        """
+        self.assertEqual(500, self.read_files(250, [500, 500, 500]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+TestIsinDictionaryMethods
+"""
+
+import os
+import unittest
+
+import boto3
+import numpy as np
+import pandas as pd
+import moto
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.isin_dictionary import IsinDictionary
+from xetra.common.custom_exceptions import WrongMetaFileException
+
+
+class TestIsinDictionaryMethods(unittest.TestCase):
+    """
+    Testing the IsinDictionary class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name = "test-bucket"
+        self.dict_key = "isin_dictionary.csv"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket = S3BucketConnector(
+            bucket=self.s3_bucket_name, endpoint_url=self.s3_endpoint_url
+        )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_encode_decode(self):
+        """
+        Tests the encode method extending the dictionary
+        and the decode method restoring the ISINs
+        """
+        # Expected results
+        isins_exp = ["DE0005772206", "AT0000A0E9W5", "DE0005772206", "DE0007100000"]
+        codes_exp = [1, 0, 1, 2]
+        # Test init
+        isin_dict = IsinDictionary(["AT0000A0E9W5"])
+        # Method execution
+        codes_result = isin_dict.encode(pd.Series(isins_exp))
+        # Test after method execution
+        self.assertEqual(codes_result.dtype, np.int32)
+        self.assertEqual(list(codes_result), codes_exp)
+        self.assertEqual(list(isin_dict.decode(codes_result)), isins_exp)
+        self.assertTrue(isin_dict.is_modified)
+
+    def test_read_no_dict_file(self):
+        """
+        Tests the read method when there is no dictionary file
+        """
+        # Method execution
+        isin_dict = IsinDictionary.read(self.dict_key, self.s3_bucket)
+        # Test after method execution
+        self.assertEqual(len(isin_dict), 0)
+        self.assertFalse(isin_dict.is_modified)
+
+    def test_write_read_ok(self):
+        """
+        Tests the write and read methods keeping the codes stable
+        """
+        # Test init
+        isin_dict = IsinDictionary()
+        codes_exp = isin_dict.encode(["DE0005772206", "AT0000A0E9W5"])
+        # Method execution
+        isin_dict.write(self.dict_key, self.s3_bucket)
+        isin_dict_result = IsinDictionary.read(self.dict_key, self.s3_bucket)
+        # Test after method execution
+        self.assertFalse(isin_dict.is_modified)
+        self.assertEqual(
+            list(isin_dict_result.encode(["DE0005772206", "AT0000A0E9W5"])),
+            list(codes_exp),
+        )
+        self.assertFalse(isin_dict_result.is_modified)
+
+    def test_read_dict_file_wrong(self):
+        """
+        Tests the read method when the dictionary file has wrong codes
+        """
+        # Test init
+        self.s3_bucket.write_df_to_s3(
+            pd.DataFrame({"isin": ["AT0000A0E9W5"], "code": [5]}), self.dict_key, "csv"
+        )
+        # Method execution
+        with self.assertRaises(WrongMetaFileException):
+            IsinDictionary.read(self.dict_key, self.s3_bucket)
+
+
+if __name__ == "__main__":
+    unittest.main()
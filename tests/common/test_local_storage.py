@@ -0,0 +1,190 @@
+"""
+TestLocalStorageConnectorMethods
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.common.storage import compress, get_storage_connector
+from xetra.common.custom_exceptions import NoSuchKeyException, WrongFormatException
+
+
+class TestLocalStorageConnectorMethods(unittest.TestCase):
+    """
+    Testing the LocalStorageConnector class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.bucket_name = "test-bucket"
+        self.conn = get_storage_connector(
+            bucket=self.bucket_name, local_dir=self.tmp_dir.name
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_list_files_in_prefix(self):
+        """
+        Tests listing keys with prefixes that do and do not end at a directory
+        """
+        # Test init
+        keys = [
+            "2021-04-15/2021-04-15_BINS_XETR12.csv",
+            "2021-04-16/2021-04-16_BINS_XETR15.csv",
+            "2021-04-16/nested/file.csv",
+            "meta_file.csv",
+        ]
+        for key in keys:
+            self.conn.write_object(b"col1\n1", key)
+        # Method execution and tests after method execution
+        self.assertIsInstance(self.conn, LocalStorageConnector)
+        self.assertEqual(sorted(keys), self.conn.list_files_in_prefix(""))
+        self.assertEqual(keys[1:3], self.conn.list_files_in_prefix("2021-04-16"))
+        self.assertEqual(keys[:3], self.conn.list_files_in_prefix("2021-04-1"))
+        self.assertEqual(keys[2:3], self.conn.list_files_in_prefix("2021-04-16/n"))
+        self.assertEqual([], self.conn.list_files_in_prefix("2022/"))
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.tmp_dir.name, self.bucket_name, keys[2]))
+        )
+
+    def test_list_file_info(self):
+        """
+        Tests that local files are listed without ETags and that their ETags
+        are the MD5 of their content like the ETags of S3 objects uploaded
+        in one part
+        """
+        # Test init
+        self.conn.write_object(b"col1\n1", "prefix/test1.csv")
+        self.conn.write_object(b"col1\n2", "prefix/test2.csv")
+        # Method execution
+        info = self.conn.list_file_info("prefix/")
+        # Test after method execution
+        self.assertEqual(
+            {"prefix/test1.csv": (6, None), "prefix/test2.csv": (6, None)}, info
+        )
+        self.assertEqual(
+            hashlib.md5(b"col1\n1").hexdigest(),
+            self.conn.file_etag("prefix/test1.csv"),
+        )
+        with self.assertRaises(NoSuchKeyException):
+            self.conn.file_etag("prefix/test3.csv")
+
+    def test_read_write(self):
+        """
+        Tests writing and reading csv, compressed csv and parquet files
+        """
+        # Expected results
+        df_exp = pd.DataFrame({"col1": ["A", "B"], "col2": [1, 2]})
+        # Method execution
+        self.conn.write_df_to_s3(df_exp, "test.csv", "csv")
+        self.conn.write_df_to_s3(df_exp, "test.parquet", "parquet")
+        self.conn.write_df_to_s3(df_exp, "test.csv.zst", "csv", "zstd")
+        self.conn.write_table_to_s3(
+            pa.Table.from_pandas(df_exp), "table.csv.gz", "csv", "gzip"
+        )
+        # Test after method execution
+        self.assertTrue(df_exp.equals(self.conn.read_csv_to_df("test.csv")))
+        self.assertTrue(df_exp.equals(self.conn.read_parquet_to_df("test.parquet")))
+        self.assertTrue(df_exp.equals(self.conn.read_csv_to_df("test.csv.zst")))
+        self.assertEqual(
+            ["A", "B"], self.conn.read_csv_to_arrow("table.csv.gz")["col1"].to_pylist()
+        )
+        self.assertEqual(
+            self.conn.read_object("test.csv"),
+            self.conn.read_object("test.csv.zst", decompress=True),
+        )
+        self.assertEqual(
+            compress(self.conn.read_object("test.csv"), "zstd"),
+            self.conn.read_object("test.csv.zst"),
+        )
+        # S3 options are accepted by every connector
+        metadata = self.conn.read_parquet_metadata(
+            file=self.conn.open_object("test.parquet", read_ahead=0)
+        )
+        self.assertEqual(2, metadata.num_rows)
+        with self.assertRaises(WrongFormatException):
+            self.conn.write_df_to_s3(df_exp, "test.txt", "txt")
+
+    def test_connector_without_logger(self):
+        """
+        Tests that the shared methods of StorageConnector log with the
+        storage module's logger if a connector does not set its own
+        """
+        # Test init
+        del self.conn._logger
+        # Method execution
+        with self.assertLogs("xetra.common.storage") as logs:
+            self.conn.write_df_to_s3(pd.DataFrame(), "empty.csv", "csv")
+        # Test after method execution
+        self.assertIn("No file will be written", logs.output[0])
+
+    def test_missing_and_delete(self):
+        """
+        Tests that missing files raise NoSuchKeyException and that
+        deleting ignores missing files
+        """
+        # Test init
+        self.conn.write_object(b"col1\n1", "test.csv")
+        # Method execution
+        self.conn.delete_objects(["test.csv", "missing.csv"])
+        # Test after method execution
+        self.assertEqual([], self.conn.list_files_in_prefix(""))
+        for read in [
+            self.conn.read_object,
+            self.conn.read_csv_to_df,
+            self.conn.read_parquet_to_df,
+        ]:
+            with self.assertRaises(NoSuchKeyException):
+                read("test.csv")
+
+    def test_meta_process(self):
+        """
+        Tests the MetaProcess methods on local storage (no meta file yet)
+        """
+        # Method execution
+        MetaProcess.update_meta_file(["2021-04-15"], "meta.csv", self.conn)
+        df_meta = self.conn.read_csv_to_df("meta.csv")
+        # Test after method execution
+        self.assertEqual(["2021-04-15"], list(df_meta["source_date"]))
+
+    def test_return_date_list_without_heavy_imports(self):
+        """
+        Tests that reading the meta file does not import pandas, pyarrow or boto3
+        """
+        # Test init
+        self.conn.write_object(
+            b"source_date,datetime_of_processing\n2021-04-15,2021-04-16 10:00:00\n",
+            "meta.csv",
+        )
+        script = (
+            "import sys\n"
+            "from xetra.common.meta_process import MetaProcess\n"
+            "from xetra.common.storage import get_storage_connector\n"
+            f"conn = get_storage_connector({self.bucket_name!r}, "
+            f"local_dir={self.tmp_dir.name!r})\n"
+            "print(MetaProcess.return_date_list('2021-04-16', 'meta.csv', conn)[1][0])\n"
+            "print([m for m in ('pandas', 'pyarrow', 'boto3') if m in sys.modules])\n"
+        )
+        # Method execution
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        ).stdout.splitlines()
+        # Test after method execution
+        self.assertEqual(["2021-04-15", "[]"], output[-2:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -69,7 +69,8 @@ class TestMetaProcessMethods(unittest.TestCase):
         MetaProcess.update_meta_file(date_list_exp, meta_key, self.s3_bucket)
         # Read meta file
         data = (
-            self.s3_bucket._bucket.Object(key=meta_key)
+            self.s3.Bucket(self.s3_bucket_name)
+            .Object(key=meta_key)
             .get()
             .get("Body")
             .read()
@@ -89,7 +90,9 @@ class TestMetaProcessMethods(unittest.TestCase):
         self.assertEqual(date_list_exp, date_list_result)
         self.assertEqual(proc_date_list_exp, proc_date_list_result)
         # Cleanup after test
-        self.s3_bucket._bucket.delete_objects(Delete={"Objects": [{"Key": meta_key}]})
+        self.s3.Bucket(self.s3_bucket_name).delete_objects(
+            Delete={"Objects": [{"Key": meta_key}]}
+        )
 
     def test_update_meta_file_empty_date_list(self):
         """
@@ -103,7 +106,7 @@ class TestMetaProcessMethods(unittest.TestCase):
         date_list = []
         meta_key = "meta.csv"
         # Method execution
-        with self.assertLogs() as logm:
+        with self.assertLogs("xetra") as logm:
             result = MetaProcess.update_meta_file(date_list, meta_key, self.s3_bucket)
             # Log test after method execution
             self.assertIn(log_exp, logm.output[1])
@@ -130,12 +133,13 @@ class TestMetaProcessMethods(unittest.TestCase):
             f"{date_list_old[1]},"
             f"{datetime.today().strftime(MetaProcessFormat.META_PROCESS_DATE_FORMAT.value)}"
         )
-        self.s3_bucket._bucket.put_object(Body=meta_content, Key=meta_key)
+        self.s3.Bucket(self.s3_bucket_name).put_object(Body=meta_content, Key=meta_key)
         # Method execution
         MetaProcess.update_meta_file(date_list_new, meta_key, self.s3_bucket)
         # Read meta file
         data = (
-            self.s3_bucket._bucket.Object(key=meta_key)
+            self.s3.Bucket(self.s3_bucket_name)
+            .Object(key=meta_key)
             .get()
             .get("Body")
             .read()
@@ -155,7 +159,9 @@ class TestMetaProcessMethods(unittest.TestCase):
         self.assertEqual(date_list_exp, date_list_result)
         self.assertEqual(proc_date_list_exp, proc_date_list_result)
         # Cleanup after test
-        self.s3_bucket._bucket.delete_objects(Delete={"Objects": [{"Key": meta_key}]})
+        self.s3.Bucket(self.s3_bucket_name).delete_objects(
+            Delete={"Objects": [{"Key": meta_key}]}
+        )
 
     def test_update_meta_file_meta_file_wrong(self):
         """
@@ -174,12 +180,14 @@ class TestMetaProcessMethods(unittest.TestCase):
             f"{date_list_old[1]},"
             f"{datetime.today().strftime(MetaProcessFormat.META_PROCESS_DATE_FORMAT.value)}"
         )
-        self.s3_bucket._bucket.put_object(Body=meta_content, Key=meta_key)
+        self.s3.Bucket(self.s3_bucket_name).put_object(Body=meta_content, Key=meta_key)
         # Method execution
         with self.assertRaises(WrongMetaFileException):
             MetaProcess.update_meta_file(date_list_new, meta_key, self.s3_bucket)
         # Cleanup after test
-        self.s3_bucket._bucket.delete_objects(Delete={"Objects": [{"Key": meta_key}]})
+        self.s3.Bucket(self.s3_bucket_name).delete_objects(
+            Delete={"Objects": [{"Key": meta_key}]}
+        )
 
     def test_return_date_list_no_meta_file(self):
         """
@@ -252,7 +260,7 @@ class TestMetaProcessMethods(unittest.TestCase):
             f"{self.dates[3]},{self.dates[0]}\n"
             f"{self.dates[4]},{self.dates[0]}"
         )
-        self.s3_bucket._bucket.put_object(Body=meta_content, Key=meta_key)
+        self.s3.Bucket(self.s3_bucket_name).put_object(Body=meta_content, Key=meta_key)
         first_date_list = [self.dates[1], self.dates[4], self.dates[7]]
         # Method execution
         for count, first_date in enumerate(first_date_list):
@@ -263,7 +271,9 @@ class TestMetaProcessMethods(unittest.TestCase):
             self.assertEqual(set(date_list_exp[count]), set(date_list_return))
             self.assertEqual(min_date_exp[count], min_date_return)
         # Cleanup after test
-        self.s3_bucket._bucket.delete_objects(Delete={"Objects": [{"Key": meta_key}]})
+        self.s3.Bucket(self.s3_bucket_name).delete_objects(
+            Delete={"Objects": [{"Key": meta_key}]}
+        )
 
     def test_return_date_list_meta_file_wrong(self):
         """
@@ -277,13 +287,15 @@ class TestMetaProcessMethods(unittest.TestCase):
             f"{self.dates[3]},{self.dates[0]}\n"
             f"{self.dates[4]},{self.dates[0]}"
         )
-        self.s3_bucket._bucket.put_object(Body=meta_content, Key=meta_key)
+        self.s3.Bucket(self.s3_bucket_name).put_object(Body=meta_content, Key=meta_key)
         first_date = self.dates[1]
         # Method execution
         with self.assertRaises(KeyError):
             MetaProcess.return_date_list(first_date, meta_key, self.s3_bucket)
         # Cleanup after test
-        self.s3_bucket._bucket.delete_objects(Delete={"Objects": [{"Key": meta_key}]})
+        self.s3.Bucket(self.s3_bucket_name).delete_objects(
+            Delete={"Objects": [{"Key": meta_key}]}
+        )
 
     def test_return_date_list_empty_date_list(self):
         """
@@ -301,7 +313,7 @@ class TestMetaProcessMethods(unittest.TestCase):
             f"{self.dates[0]},{self.dates[0]}\n"
             f"{self.dates[1]},{self.dates[0]}"
         )
-        self.s3_bucket._bucket.put_object(Body=meta_content, Key=meta_key)
+        self.s3.Bucket(self.s3_bucket_name).put_object(Body=meta_content, Key=meta_key)
         first_date = self.dates[0]
         # Method execution
         min_date_return, date_list_return = MetaProcess.return_date_list(
@@ -311,7 +323,9 @@ class TestMetaProcessMethods(unittest.TestCase):
         self.assertEqual(date_list_exp, date_list_return)
         self.assertEqual(min_date_exp, min_date_return)
         # Cleanup after test
-        self.s3_bucket._bucket.delete_objects(Delete={"Objects": [{"Key": meta_key}]})
+        self.s3.Bucket(self.s3_bucket_name).delete_objects(
+            Delete={"Objects": [{"Key": meta_key}]}
+        )
 
 
 if __name__ == "__main__":
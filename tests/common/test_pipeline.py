@@ -0,0 +1,109 @@
+"""
+TestPipelineMethods
+"""
+
+import time
+import unittest
+
+from xetra.common.pipeline import PipelineStage, run_pipeline
+
+
+class TestPipelineMethods(unittest.TestCase):
+    """
+    Testing the run_pipeline function.
+    """
+
+    def test_run_pipeline_order(self):
+        """
+        Tests the results are in the order of the items with several workers
+        """
+        # Expected results
+        results_exp = [(item + 1) * 2 for item in range(50)]
+        # Method execution
+        results = run_pipeline(
+            list(range(50)),
+            [
+                PipelineStage("add", lambda item: item + 1, workers=4, queue_size=2),
+                PipelineStage("double", lambda item: item * 2, workers=3),
+            ],
+        )
+        # Test after method execution
+        self.assertEqual(results, results_exp)
+
+    def test_run_pipeline_ordered_stage(self):
+        """
+        Tests an ordered stage gets the items in input order although
+        the stage before finishes them out of order
+        """
+        # Test init
+        seen = []
+
+        def slow_even(item):
+            if item % 2 == 0:
+                time.sleep(0.01)
+            return item
+
+        def record(item):
+            seen.append(item)
+            return item
+
+        # Method execution
+        results = run_pipeline(
+            list(range(20)),
+            [
+                PipelineStage("slow", slow_even, workers=4, queue_size=2),
+                PipelineStage("record", record, workers=3, ordered=True),
+            ],
+        )
+        # Test after method execution
+        self.assertEqual(list(range(20)), seen)
+        self.assertEqual(list(range(20)), results)
+
+    def test_run_pipeline_overlaps_stages(self):
+        """
+        Tests the stages run concurrently: the runtime is close to the
+        slowest stage instead of the sum of the stages
+        """
+
+        # Test init
+        def slow(item):
+            time.sleep(0.02)
+            return item
+
+        stages = [PipelineStage(name, slow) for name in ("one", "two", "three")]
+        # Method execution
+        start = time.perf_counter()
+        results = run_pipeline(list(range(20)), stages)
+        runtime = time.perf_counter() - start
+        # Test after method execution (sequential: 20 * 3 * 0.02 s = 1.2 s)
+        self.assertEqual(results, list(range(20)))
+        self.assertLess(runtime, 0.9)
+
+    def test_run_pipeline_error(self):
+        """
+        Tests an exception of a stage is raised by run_pipeline
+        """
+
+        # Test init
+        def fail(item):
+            if item == 3:
+                raise ValueError("item 3")
+            return item
+
+        # Method execution
+        with self.assertRaises(ValueError):
+            run_pipeline(
+                list(range(10)),
+                [PipelineStage("fail", fail, workers=2), PipelineStage("id", int)],
+            )
+
+    def test_run_pipeline_no_items(self):
+        """
+        Tests run_pipeline without items
+        """
+        # Method execution and test
+        self.assertEqual(run_pipeline([], [PipelineStage("id", int)]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+TestStageProfilerMethods
+"""
+
+import os
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+
+from xetra.common.profiling import StageProfiler
+
+
+def allocate():
+    """
+    Function allocating about 1 MB that is profiled
+    """
+    return [bytes(1024) for _ in range(1024)]
+
+
+class TestStageProfilerMethods(unittest.TestCase):
+    """
+    Testing the StageProfiler class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.profile_dir = os.path.join(self.tmp_dir.name, "profile")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_stage(self):
+        """
+        Tests writing the cProfile and the allocation file of every stage
+        """
+        # Expected results
+        files_exp = [
+            "01_allocate.prof",
+            "01_allocate_memory.txt",
+            "02_empty.prof",
+            "02_empty_memory.txt",
+        ]
+        # Test init
+        profiler = StageProfiler(self.profile_dir, top_n=3)
+        # Method execution
+        with profiler.stage("allocate"):
+            data = allocate()
+        with profiler.stage("empty"):
+            pass
+        # Test after method execution
+        self.assertEqual(1024, len(data))
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(files_exp, sorted(os.listdir(self.profile_dir)))
+        stats = pstats.Stats(os.path.join(self.profile_dir, "01_allocate.prof"))
+        self.assertIn("allocate", {function for _, _, function in stats.stats})
+        with open(
+            os.path.join(self.profile_dir, "01_allocate_memory.txt"), encoding="utf-8"
+        ) as file:
+            lines = file.read().splitlines()
+        self.assertEqual("stage: allocate", lines[0])
+        self.assertEqual(7, len(lines))
+        # the list of bytes is the largest allocation
+        self.assertIn("test_profiling.py", lines[4])
+        peak = float(lines[2].split()[3])
+        self.assertGreaterEqual(peak, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
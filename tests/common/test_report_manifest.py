@@ -0,0 +1,148 @@
+"""
+TestReportManifestMethods
+"""
+
+import os
+import unittest
+
+import boto3
+import moto
+import pandas as pd
+import pyarrow as pa
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.report_manifest import ReportManifest
+
+
+class TestReportManifestMethods(unittest.TestCase):
+    """
+    Testing the ReportManifest class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name = "test-bucket"
+        self.manifest_key = "manifest.json"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket = S3BucketConnector(
+            bucket=self.s3_bucket_name, endpoint_url=self.s3_endpoint_url
+        )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_content_hash(self):
+        """
+        Tests the content_hash method for equal and different content
+        """
+        # Method execution
+        hash_first = ReportManifest.content_hash(b"report")
+        hash_second = ReportManifest.content_hash(b"report")
+        hash_other = ReportManifest.content_hash(b"other report")
+        # Test after method execution
+        self.assertEqual(hash_first, hash_second)
+        self.assertNotEqual(hash_first, hash_other)
+        self.assertEqual(len(hash_first), 64)
+
+    def test_read_no_manifest_file(self):
+        """
+        Tests the read method when there is no manifest file
+        """
+        # Method execution
+        manifest = ReportManifest.read(self.manifest_key, self.s3_bucket)
+        # Test after method execution
+        self.assertEqual(manifest.reports, [])
+        self.assertIsNone(manifest.find(ReportManifest.content_hash(b"report")))
+
+    def test_write_read(self):
+        """
+        Tests the write method and reading the written manifest
+        """
+        # Expected results
+        key_exp = "report1/xetra_daily_report1_20210510_101010.parquet"
+        hash_exp = ReportManifest.content_hash(b"report")
+        # Test init
+        manifest = ReportManifest()
+        manifest.add_report(key_exp, hash_exp, 100, {"row_count": 3})
+        # Method execution
+        manifest.write(self.manifest_key, self.s3_bucket)
+        manifest_result = ReportManifest.read(self.manifest_key, self.s3_bucket)
+        # Test after method execution
+        self.assertEqual(manifest_result.reports, manifest.reports)
+        self.assertEqual(manifest_result.find(hash_exp)["key"], key_exp)
+        self.assertEqual(manifest_result.find(hash_exp)["size_bytes"], 100)
+        self.assertEqual(manifest_result.find(hash_exp)["row_count"], 3)
+
+    def test_refresh_report(self):
+        """
+        Tests the refresh_report method moving a report to the end
+        """
+        # Test init
+        manifest = ReportManifest()
+        first = manifest.add_report("first.parquet", "hash1")
+        manifest.add_report("second.parquet", "hash2")
+        first["created"] = "2021-05-10 10:10:10"
+        # Method execution
+        report = manifest.refresh_report(manifest.find("hash1"))
+        # Test after method execution
+        self.assertIs(report, first)
+        self.assertEqual(
+            ["second.parquet", "first.parquet"],
+            [report["key"] for report in manifest.reports],
+        )
+        self.assertNotEqual("2021-05-10 10:10:10", report["created"])
+
+    def test_report_stats(self):
+        """
+        Tests the report_stats method for a Pandas DataFrame and a pyarrow Table
+        """
+        # Expected results
+        stats_exp = {
+            "row_count": 3,
+            "date_min": "2021-04-16",
+            "date_max": "2021-04-19",
+            "isin_min": "AT0000A0E9W5",
+            "isin_max": "DE0005772206",
+            "schema_version": ReportManifest.schema_version(["ISIN", "Date", "vol"]),
+        }
+        # Test init
+        df_report = pd.DataFrame(
+            {
+                "ISIN": ["AT0000A0E9W5", "AT0000A0E9W5", "DE0005772206"],
+                "Date": ["2021-04-16", "2021-04-19", "2021-04-17"],
+                "vol": [10, 20, 30],
+            }
+        )
+        # Method execution
+        stats_df = ReportManifest.report_stats(df_report, "Date", "ISIN")
+        stats_table = ReportManifest.report_stats(
+            pa.Table.from_pandas(df_report, preserve_index=False), "Date", "ISIN"
+        )
+        # Test after method execution
+        self.assertEqual(stats_df, stats_exp)
+        self.assertEqual(stats_table, stats_exp)
+        self.assertNotEqual(
+            stats_exp["schema_version"], ReportManifest.schema_version(["ISIN"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
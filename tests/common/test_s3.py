@@ -9,11 +9,13 @@ from io import BytesIO, StringIO
 import boto3
 import moto
 import pandas as pd
+import pyarrow as pa
 from dotenv import load_dotenv
 
 
 from xetra.common.s3 import S3BucketConnector
-from xetra.common.custom_exceptions import WrongFormatException
+from xetra.common.storage import compress, file_extension
+from xetra.common.custom_exceptions import NoSuchKeyException, WrongFormatException
 
 # Load environment variables from .env file
 load_dotenv()
@@ -102,6 +104,52 @@ class TestS3BucketConnectorMethods(unittest.TestCase):
         # Test after method execution
         self.assertTrue(not list_result)
 
+    def test_list_file_sizes_ok(self):
+        """
+        Tests the list_file_sizes method for getting the
+        file keys and their sizes on the mocked s3 bucket
+        """
+        # Expected results
+        sizes_exp = {"prefix/test1.csv": 3, "prefix/test2.csv": 5}
+        # Test init
+        for key, size in sizes_exp.items():
+            self.s3_bucket.put_object(Body=b"x" * size, Key=key)
+        self.s3_bucket.put_object(Body=b"x", Key="other/test3.csv")
+        # Method execution
+        sizes = self.s3_bucket_conn.list_file_sizes(prefix="prefix/")
+        # Test after method execution
+        self.assertEqual(sizes_exp, sizes)
+
+    def test_list_file_info_ok(self):
+        """
+        Tests the list_file_info method for getting the sizes and
+        equal ETags for files with equal content on the mocked s3 bucket
+        """
+        # Test init
+        for key, body in [
+            ("test1.csv", b"a"),
+            ("test2.csv", b"b"),
+            ("test3.csv", b"a"),
+        ]:
+            self.s3_bucket.put_object(Body=body, Key=f"prefix/{key}")
+        # Method execution
+        info = self.s3_bucket_conn.list_file_info(prefix="prefix/")
+        # Test after method execution
+        self.assertEqual(
+            ["prefix/test1.csv", "prefix/test2.csv", "prefix/test3.csv"], list(info)
+        )
+        self.assertEqual([1, 1, 1], [size for size, _ in info.values()])
+        etags = {key: etag for key, (_, etag) in info.items()}
+        self.assertEqual(etags["prefix/test1.csv"], etags["prefix/test3.csv"])
+        self.assertNotEqual(etags["prefix/test1.csv"], etags["prefix/test2.csv"])
+        self.assertNotIn('"', etags["prefix/test1.csv"])
+        self.assertEqual(
+            etags["prefix/test1.csv"],
+            self.s3_bucket_conn.file_etag("prefix/test1.csv"),
+        )
+        with self.assertRaises(NoSuchKeyException):
+            self.s3_bucket_conn.file_etag("prefix/no_file.csv")
+
     def test_read_csv_to_df_ok(self):
         """
         Tests the read_csv_to_df method for
@@ -130,6 +178,107 @@ class TestS3BucketConnectorMethods(unittest.TestCase):
         # Cleanup after test
         self.s3_bucket.delete_objects(Delete={"Objects": [{"Key": key_exp}]})
 
+    def test_read_object_ok(self):
+        """
+        Tests the read_object method for reading
+        the content of 1 file from the mocked s3 bucket
+        """
+        # Expected results
+        key_exp = "test.csv"
+        content_exp = b"col1,col2\nval1,val2"
+        # Test init
+        self.s3_bucket.put_object(Body=content_exp, Key=key_exp)
+        # Method execution
+        content_result = self.s3_bucket_conn.read_object(key_exp)
+        # Test after method execution
+        self.assertEqual(content_exp, content_result)
+        # Cleanup after test
+        self.s3_bucket.delete_objects(Delete={"Objects": [{"Key": key_exp}]})
+
+    def test_read_csv_to_arrow_ok(self):
+        """
+        Tests the read_csv_to_arrow method for reading selected
+        columns of 1 .csv file from the mocked s3 bucket
+        """
+        # Expected results
+        key_exp = "test.csv"
+        # Test init
+        csv_content = "col1,col2,col3\nval1,1,val3"
+        self.s3_bucket.put_object(Body=csv_content, Key=key_exp)
+        # Method execution
+        table_result = self.s3_bucket_conn.read_csv_to_arrow(
+            key_exp, columns=["col2", "col1"], column_types={"col2": pa.string()}
+        )
+        # Test after method execution
+        self.assertEqual(table_result.column_names, ["col2", "col1"])
+        self.assertEqual(table_result.to_pylist(), [{"col2": "1", "col1": "val1"}])
+        # Cleanup after test
+        self.s3_bucket.delete_objects(Delete={"Objects": [{"Key": key_exp}]})
+
+    def test_read_compressed_ok(self):
+        """
+        Tests reading gzip and zstd compressed .csv files detected
+        from the key suffix or the Content-Encoding
+        """
+        # Expected results
+        content_exp = b"col1,col2\nval1,1\nval2,2\n"
+        # Test init
+        self.s3_bucket.put_object(Body=compress(content_exp, "gzip"), Key="test.csv.gz")
+        self.s3_bucket.put_object(
+            Body=compress(content_exp, "zstd"), Key="test.csv.zst"
+        )
+        self.s3_bucket.put_object(
+            Body=compress(content_exp, "gzip"), Key="test.csv", ContentEncoding="gzip"
+        )
+        for key in ["test.csv.gz", "test.csv.zst", "test.csv"]:
+            with self.subTest(key=key):
+                # Method execution
+                content_result = self.s3_bucket_conn.read_object(key, decompress=True)
+                df_result = self.s3_bucket_conn.read_csv_to_df(key)
+                table_result = self.s3_bucket_conn.read_csv_to_arrow(key)
+                # Test after method execution
+                self.assertEqual(content_exp, content_result)
+                self.assertEqual(["val1", "val2"], list(df_result["col1"]))
+                self.assertEqual([1, 2], table_result["col2"].to_pylist())
+        self.assertNotEqual(content_exp, self.s3_bucket_conn.read_object("test.csv.gz"))
+
+    def test_write_df_to_s3_csv_compressed(self):
+        """
+        Tests the write_df_to_s3 method writing a gzip compressed .csv file
+        """
+        # Expected results
+        key_exp = f"test.{file_extension('csv', 'gzip')}"
+        df_exp = pd.DataFrame([["A", "B"], ["C", "D"]], columns=["col1", "col2"])
+        # Method execution
+        self.s3_bucket_conn.write_df_to_s3(df_exp, key_exp, "csv", "gzip")
+        # Test after method execution
+        data = self.s3_bucket.Object(key=key_exp).get().get("Body").read()
+        self.assertEqual("test.csv.gz", key_exp)
+        self.assertEqual(b"\x1f\x8b", data[:2])
+        self.assertTrue(df_exp.equals(self.s3_bucket_conn.read_csv_to_df(key_exp)))
+        self.assertEqual("parquet", file_extension("parquet", "gzip"))
+
+    def test_read_parquet_to_df_ok(self):
+        """
+        Tests the read_parquet_to_df method for reading selected
+        columns of 1 .parquet file from the mocked s3 bucket
+        """
+        # Expected results
+        key_exp = "test.parquet"
+        df_exp = pd.DataFrame([["A"], ["C"]], columns=["col1"])
+        # Test init
+        out_buffer = BytesIO()
+        pd.DataFrame([["A", "B"], ["C", "D"]], columns=["col1", "col2"]).to_parquet(
+            out_buffer, index=False
+        )
+        self.s3_bucket.put_object(Body=out_buffer.getvalue(), Key=key_exp)
+        # Method execution
+        df_result = self.s3_bucket_conn.read_parquet_to_df(key_exp, columns=["col1"])
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+        # Cleanup after test
+        self.s3_bucket.delete_objects(Delete={"Objects": [{"Key": key_exp}]})
+
     def test_write_df_to_s3_empty(self):
         """
         Tests the write_df_to_s3 method with
@@ -226,6 +375,73 @@ class TestS3BucketConnectorMethods(unittest.TestCase):
             # Log test after method execution
             self.assertIn(log_exp, logm.output[0])
 
+    def test_write_table_to_s3_parquet(self):
+        """
+        Tests the write_table_to_s3 method
+        if writing a pyarrow Table as parquet is successful
+        """
+        # Expected results
+        return_exp = True
+        df_exp = pd.DataFrame([["A", "B"], ["C", "D"]], columns=["col1", "col2"])
+        key_exp = "test.parquet"
+        log_exp = (
+            f"Writing file to {self.s3_endpoint_url}/{self.s3_bucket_name}/{key_exp}"
+        )
+        # Test init
+        table = pa.Table.from_pandas(df_exp, preserve_index=False)
+        file_format = "parquet"
+        # Method execution
+        with self.assertLogs() as logm:
+            result = self.s3_bucket_conn.write_table_to_s3(table, key_exp, file_format)
+            # Log test after method execution
+            self.assertIn(log_exp, logm.output[0])
+        # Test after method execution
+        data = self.s3_bucket.Object(key=key_exp).get().get("Body").read()
+        df_result = pd.read_parquet(BytesIO(data))
+        self.assertEqual(return_exp, result)
+        self.assertTrue(df_exp.equals(df_result))
+        # Cleanup after test
+        self.s3_bucket.delete_objects(Delete={"Objects": [{"Key": key_exp}]})
+
+    def test_write_table_to_s3_empty(self):
+        """
+        Tests the write_table_to_s3 method with an empty pyarrow Table as input
+        """
+        # Expected results
+        return_exp = None
+        log_exp = "The table is empty! No file will be written!"
+        # Test init
+        table_empty = pa.table({"col1": pa.array([], pa.string())})
+        # Method execution
+        with self.assertLogs() as logm:
+            result = self.s3_bucket_conn.write_table_to_s3(
+                table_empty, "test.parquet", "parquet"
+            )
+            # Log test after method execution
+            self.assertIn(log_exp, logm.output[0])
+        # Test after method execution
+        self.assertEqual(return_exp, result)
+
+    def test_delete_objects(self):
+        """
+        Tests the delete_objects method
+        """
+        # Expected results
+        key_kept = "prefix/test_kept.csv"
+        keys_deleted = ["prefix/test1.csv", "prefix/test2.csv"]
+        # Test init
+        for key in keys_deleted + [key_kept]:
+            self.s3_bucket.put_object(Body="col1\nA", Key=key)
+        # Method execution
+        result = self.s3_bucket_conn.delete_objects(keys_deleted)
+        # Test after method execution
+        self.assertTrue(result)
+        self.assertEqual(
+            self.s3_bucket_conn.list_files_in_prefix("prefix/"), [key_kept]
+        )
+        # Cleanup after test
+        self.s3_bucket.delete_objects(Delete={"Objects": [{"Key": key_kept}]})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,168 @@
+"""
+TestS3ObjectFileMethods
+"""
+
+import os
+import unittest
+
+import boto3
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import moto
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.s3_file import ParquetMetadataCache, parquet_chunk_ranges
+
+
+class TestS3ObjectFileMethods(unittest.TestCase):
+    """
+    Testing the S3ObjectFile class and the parquet footer cache.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name = "test-bucket"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket = S3BucketConnector(
+            bucket=self.s3_bucket_name, endpoint_url=self.s3_endpoint_url
+        )
+        self.s3_bucket.parquet_metadata_cache.clear()
+        self.content = bytes(range(256)) * 64
+        self.s3_bucket.write_object(self.content, "test.bin")
+        # Parquet file with 10 row groups and 3 columns
+        rng = np.random.default_rng(1)
+        self.df_parquet = pd.DataFrame(
+            {
+                "a": rng.random(20000),
+                "b": rng.integers(0, 1000, 20000),
+                "c": rng.random(20000),
+            }
+        )
+        self.s3_bucket.write_object(
+            self.s3_bucket.table_to_bytes(
+                pa.Table.from_pandas(self.df_parquet, preserve_index=False),
+                "parquet",
+                2000,
+            ),
+            "test.parquet",
+        )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_seek_read(self):
+        """
+        Tests seek and read against the content of the object
+        """
+        # Test init
+        s3_file = self.s3_bucket.open_object("test.bin", read_ahead=1024)
+        # Method execution and test
+        self.assertEqual(s3_file.size, len(self.content))
+        self.assertEqual(s3_file.read(10), self.content[:10])
+        self.assertEqual(s3_file.read(10), self.content[10:20])
+        s3_file.seek(-5, 2)
+        self.assertEqual(s3_file.read(), self.content[-5:])
+        self.assertEqual(s3_file.read(), b"")
+        s3_file.seek(5000)
+        self.assertEqual(s3_file.tell(), 5000)
+        self.assertEqual(s3_file.read(3000), self.content[5000:8000])
+        # Sequential reads within the read-ahead need one GET
+        self.assertEqual(s3_file.requests, 3)
+
+    def test_prefetch_coalesces_ranges(self):
+        """
+        Tests the prefetch method fetching close ranges with one GET
+        """
+        # Test init
+        s3_file = self.s3_bucket.open_object("test.bin", read_ahead=0, coalesce_gap=100)
+        # Method execution
+        s3_file.prefetch([(0, 100), (150, 200), (5000, 5100)])
+        # Test after method execution
+        self.assertEqual(s3_file.requests, 2)
+        self.assertEqual(s3_file.bytes_requested, 300)
+        s3_file.seek(150)
+        self.assertEqual(s3_file.read(50), self.content[150:200])
+        s3_file.seek(5000)
+        self.assertEqual(s3_file.read(100), self.content[5000:5100])
+        self.assertEqual(s3_file.requests, 2)
+
+    def test_read_row_group_column(self):
+        """
+        Tests reading one column of one row group without
+        downloading the whole parquet object
+        """
+        # Test init
+        s3_file = self.s3_bucket.open_object("test.parquet", read_ahead=0)
+        # Method execution
+        metadata = self.s3_bucket.read_parquet_metadata(s3_file)
+        s3_file.prefetch(parquet_chunk_ranges(metadata, [3], ["b"]))
+        table = pq.ParquetFile(s3_file, metadata=metadata).read_row_groups(
+            [3], columns=["b"]
+        )
+        # Test after method execution
+        self.assertEqual(
+            table.column("b").to_pylist(), list(self.df_parquet["b"][6000:8000])
+        )
+        self.assertLess(s3_file.bytes_requested, s3_file.size / 5)
+
+    def test_parquet_metadata_cache(self):
+        """
+        Tests the footer cache keyed by ETag
+        """
+        # Method execution
+        metadata = self.s3_bucket.read_parquet_metadata(
+            self.s3_bucket.open_object("test.parquet")
+        )
+        s3_file = self.s3_bucket.open_object("test.parquet")
+        metadata_cached = self.s3_bucket.read_parquet_metadata(s3_file)
+        # Test after method execution
+        self.assertIs(metadata_cached, metadata)
+        self.assertEqual(s3_file.requests, 0)
+        # A rewritten object has a new ETag
+        self.s3_bucket.write_df_to_s3(
+            self.df_parquet.head(10), "test.parquet", "parquet"
+        )
+        metadata_new = self.s3_bucket.read_parquet_metadata(
+            self.s3_bucket.open_object("test.parquet")
+        )
+        self.assertEqual(metadata_new.num_rows, 10)
+
+    def test_cache_eviction(self):
+        """
+        Tests the least recently used entry is evicted
+        """
+        # Test init
+        cache = ParquetMetadataCache(max_entries=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.get(("a",))
+        # Method execution
+        cache.put(("c",), 3)
+        # Test after method execution
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.get(("a",)), 1)
+        self.assertEqual(cache.get(("c",)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
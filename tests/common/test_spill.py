@@ -0,0 +1,70 @@
+"""
+TestSpillStoreMethods
+"""
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from xetra.common.spill import SpillStore
+
+
+class TestSpillStoreMethods(unittest.TestCase):
+    """
+    Testing the SpillStore class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.df_1 = pd.DataFrame(
+            {"Date": ["2021-04-17", "2021-04-18"], "Time": ["14:00", "08:00"]}
+        )
+        self.df_2 = pd.DataFrame(
+            {"Date": ["2021-04-17", "2021-04-17"], "Time": ["13:00", "09:00"]}
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_spill_and_read_partitions(self):
+        """
+        Tests spilling runs when the memory budget is exceeded
+        and reading the sorted runs per partition
+        """
+        # Expected results
+        partitions_exp = ["2021-04-17", "2021-04-18"]
+        times_exp = ["14:00", "09:00", "13:00"]
+        # Method execution
+        with SpillStore(self.tmp_dir.name, 0, "Date", ["Time"]) as spill_store:
+            spill_store.append(self.df_1)
+            spill_store.append(self.df_2)
+            spill_store.flush()
+            partitions_result = spill_store.partitions()
+            df_result = spill_store.read_partition("2021-04-17")
+            spill_path = spill_store.path
+            # Test after method execution
+            self.assertEqual(len(os.listdir(os.path.join(spill_path, "part-00000"))), 2)
+        self.assertEqual(partitions_result, partitions_exp)
+        self.assertEqual(list(df_result["Time"]), times_exp)
+        self.assertFalse(os.path.exists(spill_path))
+
+    def test_buffer_within_budget(self):
+        """
+        Tests that nothing is spilled while the buffer fits into the budget
+        """
+        # Method execution
+        with SpillStore(self.tmp_dir.name, 1, "Date") as spill_store:
+            spill_store.append(self.df_1)
+            # Test after method execution
+            self.assertEqual(spill_store.partitions(), [])
+            spill_store.flush()
+            self.assertEqual(spill_store.partitions(), ["2021-04-17", "2021-04-18"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -272,9 +272,9 @@ class IntTestXetraETLMethods(unittest.TestCase):
         self.df_report = pd.DataFrame(data_report, columns=columns_report)
 
     def tearDown(self):
-        for key in self.src_bucket._bucket.objects.all():
+        for key in self.s3.Bucket(self.s3_bucket_name_src).objects.all():
             key.delete()
-        for key in self.trg_bucket._bucket.objects.all():
+        for key in self.s3.Bucket(self.s3_bucket_name_trg).objects.all():
             key.delete()
 
     def test_int_etl_report1_no_metafile(self):
@@ -295,7 +295,13 @@ class IntTestXetraETLMethods(unittest.TestCase):
         xetra_etl.etl_report1()
         # Test after method execution
         trg_file = self.trg_bucket.list_files_in_prefix(self.target_config.trg_key)[0]
-        data = self.trg_bucket._bucket.Object(key=trg_file).get().get("Body").read()
+        data = (
+            self.s3.Bucket(self.s3_bucket_name_trg)
+            .Object(key=trg_file)
+            .get()
+            .get("Body")
+            .read()
+        )
         out_buffer = BytesIO(data)
         df_result = pd.read_parquet(out_buffer)
         self.assertTrue(df_exp.equals(df_result))
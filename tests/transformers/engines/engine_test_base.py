@@ -0,0 +1,217 @@
+"""
+Shared setup and tests of the transform engine tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from xetra.common.custom_exceptions import WrongEngineException
+from xetra.transformers.engines.base import get_engine
+from xetra.transformers.engines.pandas_engine import PandasEngine
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+
+
+class EngineTestMixin:
+    """
+    Tests every transform engine has to pass, mixed into a
+    unittest.TestCase per engine. The test class sets engine_name and
+    engine_class and implements transform_report1.
+    """
+
+    engine_name = None
+    engine_class = None
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=[
+                "ISIN",
+                "Mnemonic",
+                "Date",
+                "Time",
+                "StartPrice",
+                "EndPrice",
+                "MinPrice",
+                "MaxPrice",
+                "TradedVolume",
+            ],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+            src_col_end_price="EndPrice",
+        )
+        self.target_config = XetraTargetConfig(
+            trg_col_isin="isin",
+            trg_col_date="date",
+            trg_col_op_price="opening_price_eur",
+            trg_col_clos_price="closing_price_eur",
+            trg_col_min_price="minimum_price_eur",
+            trg_col_max_price="maximum_price_eur",
+            trg_col_dail_trad_vol="daily_traded_volume",
+            trg_col_ch_prev_clos="change_prev_closing_%",
+            trg_key="report1/xetra_daily_report1_",
+            trg_key_date_format="%Y%m%d_%H%M%S",
+            trg_format="parquet",
+            trg_col_vwap="vwap_eur",
+            trg_col_turnover="turnover_eur",
+        )
+        # Random source data with unique times per ISIN and day
+        rng = np.random.default_rng(42)
+        rows = 5000
+        prices = rng.integers(100, 10000, size=(rows, 4)) / 100
+        self.df_src = pd.DataFrame(
+            {
+                "ISIN": rng.choice([f"DE000{i:07d}" for i in range(40)], rows),
+                "Mnemonic": "XXX",
+                "Date": rng.choice(
+                    ["2021-04-15", "2021-04-16", "2021-04-19", "2021-04-20"], rows
+                ),
+                "Time": [f"{m // 60:02d}:{m % 60:02d}" for m in range(rows)],
+                "StartPrice": prices[:, 0],
+                "EndPrice": prices[:, 1],
+                "MinPrice": prices.min(axis=1),
+                "MaxPrice": prices.max(axis=1),
+                "TradedVolume": rng.integers(0, 5000, rows),
+            }
+        )
+        self.df_src.loc[::97, "EndPrice"] = np.nan
+
+    def transform_report1(self, df_src: pd.DataFrame, extract_date: str):
+        """
+        Creates report 1 with the tested engine from the source rows
+        converted to the engine's source format
+
+        :returns:
+          data_frame: report 1 Pandas DataFrame
+        """
+        raise NotImplementedError
+
+    def test_get_engine(self):
+        """
+        Tests the get_engine function for the engine and an unknown engine
+        """
+        self.assertIsInstance(
+            get_engine(self.engine_name, self.source_config, self.target_config),
+            self.engine_class,
+        )
+        with self.assertRaises(WrongEngineException):
+            get_engine("spark", self.source_config, self.target_config)
+
+    def test_transform_report1_same_as_pandas(self):
+        """
+        Tests the transform_report1 method row for row against the pandas engine
+        """
+        if self.engine_class is PandasEngine:
+            self.skipTest("the pandas engine is the reference")
+        # Expected results
+        df_exp = PandasEngine(self.source_config, self.target_config).transform_report1(
+            self.df_src, "2021-04-16"
+        )
+        # Method execution
+        df_result = self.transform_report1(self.df_src, "2021-04-16")
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
+    def test_transform_report1_unsorted_large(self):
+        """
+        Tests the transform_report1 method against the pandas engine with
+        shuffled source rows and turnovers of many integer digits
+        """
+        if self.engine_class is PandasEngine:
+            self.skipTest("the pandas engine is the reference")
+        # Test init
+        df_src = self.unsorted_large_source()
+        # Expected results
+        df_exp = PandasEngine(self.source_config, self.target_config).transform_report1(
+            df_src, "2021-04-15"
+        )
+        # Method execution
+        df_result = self.transform_report1(df_src, "2021-04-15")
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
+    @staticmethod
+    def unsorted_large_source(rows: int = 50000):
+        """
+        Random source rows of 24 ISINs over 6 days in random order with
+        prices up to 10000 and volumes up to 50000
+
+        returns:
+          data_frame: Pandas DataFrame with source rows
+        """
+        rng = np.random.default_rng(1)
+        prices = rng.integers(100, 1000000, size=(rows, 4)) / 100
+        return pd.DataFrame(
+            {
+                "ISIN": rng.choice([f"DE{i:010d}" for i in range(24)], rows),
+                "Mnemonic": "XXX",
+                "Date": rng.choice([f"2021-04-{day}" for day in range(14, 20)], rows),
+                "Time": [f"{m // 60 % 24:02d}:{m % 60:02d}" for m in range(rows)],
+                "StartPrice": prices[:, 0],
+                "EndPrice": prices[:, 1],
+                "MinPrice": prices.min(axis=1),
+                "MaxPrice": prices.max(axis=1),
+                "TradedVolume": rng.integers(0, 50000, rows),
+            }
+        )
+
+    def test_transform_report1_zero_volume(self):
+        """
+        Tests the VWAP of an ISIN and day with a traded volume of 0 is NaN
+        """
+        # Test init: volumes summing up to 0 with a turnover of 10 - 20
+        df_zero = pd.DataFrame(
+            {
+                "ISIN": "DE0000000099",
+                "Mnemonic": "XXX",
+                "Date": "2021-04-16",
+                "Time": ["09:00", "09:01"],
+                "StartPrice": [1.0, 2.0],
+                "EndPrice": [1.0, 2.0],
+                "MinPrice": [1.0, 2.0],
+                "MaxPrice": [1.0, 2.0],
+                "TradedVolume": [10, -10],
+            }
+        )
+        df_src = pd.concat([self.df_src, df_zero], ignore_index=True)
+        # Method execution
+        df_result = self.transform_report1(df_src, "2021-04-16")
+        # Test after method execution
+        df_result = df_result[df_result["ISIN"] == "DE0000000099"]
+        self.assertEqual([0], list(df_result["daily_traded_volume"]))
+        self.assertEqual([-10.0], list(df_result["turnover_eur"]))
+        self.assertTrue(df_result["vwap_eur"].isna().all())
+        self.assertFalse(np.isinf(df_result["vwap_eur"]).any())
+
+    def test_transform_report1_tied_times(self):
+        """
+        Tests the first and the last source row of the earliest and latest
+        trade time of an ISIN and day are the opening and closing price
+        """
+        # Test init: trade times of 10 minutes, so up to 10 rows share a time
+        df_src = self.df_src.assign(Time=self.df_src["Time"].str[:4] + "0")
+        # Expected results
+        df_exp = (
+            df_src.dropna()
+            .sort_values(["ISIN", "Date", "Time"], kind="stable")
+            .groupby(["ISIN", "Date"])["StartPrice"]
+            .agg(["first", "last"])
+            .reset_index()
+        )
+        df_exp = df_exp[df_exp["Date"] >= "2021-04-16"]
+        # Method execution
+        df_result = self.transform_report1(df_src, "2021-04-16")
+        # Test after method execution
+        np.testing.assert_array_equal(
+            df_exp["first"].to_numpy(), df_result["opening_price_eur"].to_numpy()
+        )
+        np.testing.assert_array_equal(
+            df_exp["last"].to_numpy(), df_result["closing_price_eur"].to_numpy()
+        )
@@ -0,0 +1,58 @@
+"""
+TestArrowEngineMethods
+"""
+
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from tests.transformers.engines.engine_test_base import EngineTestMixin
+from xetra.transformers.engines.arrow_engine import ArrowEngine
+from xetra.transformers.engines.pandas_engine import PandasEngine
+
+
+class TestArrowEngineMethods(EngineTestMixin, unittest.TestCase):
+    """
+    Testing the ArrowEngine class against the PandasEngine.
+    """
+
+    engine_name = "arrow"
+    engine_class = ArrowEngine
+
+    def transform_report1(self, df_src, extract_date):
+        table = ArrowEngine(self.source_config, self.target_config).transform_report1(
+            pa.Table.from_pandas(df_src, preserve_index=False), extract_date
+        )
+        self.assertIsInstance(table, pa.Table)
+        return table.to_pandas()
+
+    def test_transform_report1_concatenated_files(self):
+        """
+        Tests the transform_report1 method with a table of several chunks
+        like extract concatenates it from the source files, the turnover
+        is summed and rounded exactly like by the pandas engine
+        """
+        # Test init
+        df_src = self.unsorted_large_source()
+        table = pa.concat_tables(
+            [
+                pa.Table.from_pandas(df_src.iloc[part::6], preserve_index=False)
+                for part in range(6)
+            ]
+        )
+        # Expected results
+        df_exp = PandasEngine(self.source_config, self.target_config).transform_report1(
+            pd.concat([df_src.iloc[part::6] for part in range(6)], ignore_index=True),
+            "2021-04-15",
+        )
+        # Method execution
+        table = ArrowEngine(self.source_config, self.target_config).transform_report1(
+            table, "2021-04-15"
+        )
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, table.to_pandas(), check_exact=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
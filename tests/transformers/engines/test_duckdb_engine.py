@@ -0,0 +1,33 @@
+"""
+TestDuckDBEngineMethods
+"""
+
+import unittest
+
+import pyarrow as pa
+
+from tests.transformers.engines.engine_test_base import EngineTestMixin
+
+try:
+    from xetra.transformers.engines.duckdb_engine import DuckDBEngine
+except ImportError:  # pragma: no cover
+    DuckDBEngine = None
+
+
+@unittest.skipIf(DuckDBEngine is None, "duckdb is not installed")
+class TestDuckDBEngineMethods(EngineTestMixin, unittest.TestCase):
+    """
+    Testing the DuckDBEngine class against the PandasEngine.
+    """
+
+    engine_name = "duckdb"
+    engine_class = DuckDBEngine
+
+    def transform_report1(self, df_src, extract_date):
+        return DuckDBEngine(self.source_config, self.target_config).transform_report1(
+            pa.Table.from_pandas(df_src, preserve_index=False), extract_date
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+TestPandasEngineMethods
+"""
+
+import unittest
+
+import pandas as pd
+
+from tests.transformers.engines.engine_test_base import EngineTestMixin
+from xetra.transformers.engines.pandas_engine import PandasEngine
+
+
+class TestPandasEngineMethods(EngineTestMixin, unittest.TestCase):
+    """
+    Testing the PandasEngine class.
+    """
+
+    engine_name = "pandas"
+    engine_class = PandasEngine
+
+    def transform_report1(self, df_src, extract_date):
+        return PandasEngine(self.source_config, self.target_config).transform_report1(
+            df_src, extract_date
+        )
+
+    def test_merge_report1_partials(self):
+        """
+        Tests merging the partial aggregates of consecutive
+        batches gives the same report as one aggregation
+        """
+        # Test init
+        engine = PandasEngine(self.source_config, self.target_config)
+        df_exp = engine.transform_report1(self.df_src, "2021-04-16")
+        # Method execution
+        partials = [
+            engine.aggregate_report1(
+                self.df_src.iloc[start : start + 700], partial=True
+            )
+            for start in range(0, len(self.df_src), 700)
+        ]
+        df_result = engine.finalize_report1(
+            engine.merge_report1_partials(partials), "2021-04-16"
+        )
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
+    def test_merge_report1_partials_ties(self):
+        """
+        Tests ties of the opening and closing time between batches
+        are resolved by the batch order
+        """
+        # Test init
+        engine = PandasEngine(self.source_config, self.target_config)
+        df_src = self.df_src.assign(Time="09:00")
+        df_exp = engine.aggregate_report1(df_src)
+        # Method execution
+        df_result = engine.merge_report1_partials(
+            [
+                engine.aggregate_report1(df_src.iloc[:2500], partial=True),
+                engine.aggregate_report1(df_src.iloc[2500:], partial=True),
+            ]
+        )
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+TestPolarsEngineMethods
+"""
+
+import unittest
+
+from tests.transformers.engines.engine_test_base import EngineTestMixin
+
+try:
+    from xetra.transformers.engines.polars_engine import PolarsEngine
+except ImportError:  # pragma: no cover
+    PolarsEngine = None
+
+
+@unittest.skipIf(PolarsEngine is None, "polars is not installed")
+class TestPolarsEngineMethods(EngineTestMixin, unittest.TestCase):
+    """
+    Testing the PolarsEngine class against the PandasEngine.
+    """
+
+    engine_name = "polars"
+    engine_class = PolarsEngine
+
+    def transform_report1(self, df_src, extract_date):
+        # The source rows as csv files of 2000 rows
+        sources = [
+            df_src.iloc[start : start + 2000].to_csv(index=False).encode("utf-8")
+            for start in range(0, len(df_src), 2000)
+        ]
+        return PolarsEngine(self.source_config, self.target_config).transform_report1(
+            sources, extract_date
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+TestSourceDeduplicatorMethods
+"""
+
+import unittest
+
+import pandas as pd
+
+from xetra.transformers.dedup import SourceDeduplicator
+from xetra.transformers.xetra_transformer import XetraSourceConfig
+
+
+class TestSourceDeduplicatorMethods(unittest.TestCase):
+    """
+    Testing the SourceDeduplicator class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=["ISIN", "Date", "Time", "StartPrice"],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.df_src = pd.DataFrame(
+            {
+                "ISIN": ["AT0000A0E9W5", "AT0000A0E9W5", "DE000A0HN5C6", None],
+                "Date": ["2021-04-16", "2021-04-16", "2021-04-16", "2021-04-17"],
+                "Time": ["09:00", "09:01", "09:00", "09:00"],
+                "StartPrice": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+
+    def test_skip_files(self):
+        """
+        Tests skipping the files with the ETag of an earlier file
+        """
+        # Test init
+        dedup = SourceDeduplicator(self.source_config)
+        # Method execution
+        with self.assertLogs("xetra.transformers.dedup") as logs:
+            skipped_first = dedup.skip_files(
+                {"d1/a.csv": (1, "e1"), "d1/b.csv": (1, "e1")}
+            )
+            skipped_second = dedup.skip_files(
+                {"d2/a.csv": (1, "e2"), "d2/b.csv": (1, "e1")}
+            )
+        # Test after method execution
+        self.assertEqual(["d1/b.csv"], skipped_first)
+        self.assertEqual(["d2/b.csv"], skipped_second)
+        self.assertEqual(2, dedup.skipped_files)
+        self.assertIn("same content as d1/a.csv", logs.output[1])
+        # listing a key again does not skip it
+        self.assertEqual([], dedup.skip_files({"d1/a.csv": (1, "e1")}))
+
+    def test_skip_files_missing_etags(self):
+        """
+        Tests the ETags missing in the listing are only computed for
+        files with the size of another file
+        """
+        # Test init
+        dedup = SourceDeduplicator(self.source_config)
+        etags = {"d1/a.csv": "e1", "d1/b.csv": "e2", "d2/a.csv": "e1"}
+        computed = []
+
+        def file_etag(key):
+            computed.append(key)
+            return etags[key]
+
+        # Method execution
+        skipped_first = dedup.skip_files(
+            {"d1/a.csv": (1, None), "d1/b.csv": (2, None)}, file_etag
+        )
+        skipped_again = dedup.skip_files({"d1/a.csv": (1, None)}, file_etag)
+        skipped_second = dedup.skip_files({"d2/a.csv": (1, None)}, file_etag)
+        # Test after method execution
+        self.assertEqual([], skipped_first)
+        self.assertEqual([], skipped_again)
+        self.assertEqual(["d2/a.csv"], skipped_second)
+        self.assertEqual(["d1/a.csv", "d2/a.csv"], computed)
+
+    def test_row_hashes(self):
+        """
+        Tests that the hashes only depend on the key columns
+        """
+        # Test init
+        dedup = SourceDeduplicator(self.source_config)
+        df_other = self.df_src.iloc[::-1].assign(StartPrice=0.0)
+        # Method execution
+        hashes = dedup.row_hashes(self.df_src)
+        hashes_other = dedup.row_hashes(df_other)
+        # Test after method execution
+        self.assertEqual(4, len(set(hashes)))
+        self.assertEqual(list(hashes[::-1]), list(hashes_other))
+
+    def test_drop_duplicates(self):
+        """
+        Tests dropping the rows repeated in one DataFrame
+        and the rows of already deduplicated DataFrames
+        """
+        # Test init
+        dedup = SourceDeduplicator(self.source_config)
+        df_repeated = pd.concat([self.df_src, self.df_src.iloc[[1]]])
+        df_late = pd.DataFrame(
+            {
+                "ISIN": ["AT0000A0E9W5", "AT0000A0E9W5", "DE000A0HN5C6"],
+                "Date": ["2021-04-16", "2021-04-17", "2021-04-16"],
+                "Time": ["09:00", "09:00", "09:05"],
+                "StartPrice": [9.0, 9.0, 9.0],
+            }
+        )
+        # Method execution
+        df_first = dedup.drop_duplicates(df_repeated)
+        df_second = dedup.drop_duplicates(df_late)
+        # Test after method execution
+        self.assertTrue(self.df_src.equals(df_first))
+        self.assertTrue(df_late.iloc[1:].equals(df_second))
+        self.assertEqual(2, dedup.dropped_rows)
+        with self.assertLogs("xetra.transformers.dedup") as logs:
+            dedup.log_counts()
+        self.assertIn("skipped 0 Xetra source files and dropped 2 rows", logs.output[0])
+
+    def test_drop_duplicates_unique_rows(self):
+        """
+        Tests that unique rows are returned without copying the DataFrame
+        """
+        # Test init
+        dedup = SourceDeduplicator(self.source_config)
+        # Method execution
+        df_result = dedup.drop_duplicates(self.df_src)
+        # Test after method execution
+        self.assertIs(self.df_src, df_result)
+        self.assertTrue(dedup.drop_duplicates(self.df_src.iloc[:0]).empty)
+        self.assertEqual(0, dedup.dropped_rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
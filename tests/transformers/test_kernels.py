@@ -0,0 +1,106 @@
+"""
+TestKernelsMethods
+"""
+
+import unittest
+
+import numpy as np
+
+from xetra.transformers.kernels import (
+    JIT_AVAILABLE,
+    group_reduce,
+    group_shift,
+    group_starts,
+)
+
+
+class TestKernelsMethods(unittest.TestCase):
+    """
+    Testing the group reduction kernels.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # Rows sorted by ISIN code, date code and time
+        self.isin_codes = np.array([0, 0, 0, 1, 1, 1])
+        self.date_codes = np.array([0, 0, 1, 0, 0, 0])
+        self.prices = np.array([10.0, 11.0, 12.0, 20.0, 19.0, 21.0])
+        self.min_prices = np.array([9.5, 10.5, 11.5, 19.5, 18.5, 20.5])
+        self.max_prices = np.array([10.5, 11.5, 12.5, 20.5, 19.5, 21.5])
+        self.volumes = np.array([1, 2, 3, 4, 5, 6])
+
+    def test_group_starts(self):
+        """
+        Tests the group_starts function for one and two key arrays
+        """
+        self.assertEqual(list(group_starts([self.isin_codes])), [0, 3])
+        self.assertEqual(
+            list(group_starts([self.isin_codes, self.date_codes])), [0, 2, 3]
+        )
+        self.assertEqual(list(group_starts([np.array([])])), [])
+
+    def test_group_shift(self):
+        """
+        Tests the group_shift function
+        """
+        shifted = group_shift(self.prices, np.array([0, 3]))
+        np.testing.assert_array_equal(shifted, [np.nan, 10.0, 11.0, np.nan, 20.0, 19.0])
+
+    def test_group_reduce_numpy(self):
+        """
+        Tests the group_reduce function with the NumPy kernel
+        """
+        # Method execution
+        reduction = group_reduce(
+            [self.isin_codes, self.date_codes],
+            self.prices,
+            self.min_prices,
+            self.max_prices,
+            [self.volumes],
+        )
+        # Test after method execution
+        self.assertEqual(list(reduction.starts), [0, 2, 3])
+        self.assertEqual(list(reduction.first), [10.0, 12.0, 20.0])
+        self.assertEqual(list(reduction.last), [11.0, 12.0, 21.0])
+        self.assertEqual(list(reduction.minimum), [9.5, 11.5, 18.5])
+        self.assertEqual(list(reduction.maximum), [11.5, 12.5, 21.5])
+        self.assertEqual(list(reduction.totals[0]), [3, 3, 15])
+        self.assertEqual(reduction.totals[0].dtype, self.volumes.dtype)
+
+    @unittest.skipUnless(JIT_AVAILABLE, "numba is not installed")
+    def test_group_reduce_jit(self):
+        """
+        Tests the group_reduce function with the numba
+        kernel against the NumPy kernel
+        """
+        # Test init
+        args = (
+            [self.isin_codes, self.date_codes],
+            self.prices,
+            self.min_prices,
+            self.max_prices,
+            [self.volumes, self.prices * self.volumes],
+        )
+        # Method execution
+        reduction_exp = group_reduce(*args)
+        reduction_result = group_reduce(*args, use_jit=True)
+        # Test after method execution
+        for exp, result in zip(reduction_exp[:5], reduction_result[:5]):
+            np.testing.assert_array_equal(exp, result)
+        for exp, result in zip(reduction_exp.totals, reduction_result.totals):
+            np.testing.assert_array_equal(exp, result)
+
+    def test_group_reduce_empty(self):
+        """
+        Tests the group_reduce function without rows
+        """
+        empty = np.array([])
+        reduction = group_reduce([empty], empty, empty, empty, [empty])
+        self.assertEqual(len(reduction.first), 0)
+        self.assertEqual(len(reduction.totals[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+TestLeanDtypesMethods
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from xetra.transformers.xetra_transformer import XetraSourceConfig
+from xetra.transformers.lean_dtypes import (
+    concat_lean,
+    day_numbers_to_dates,
+    restore_prices,
+    to_lean_dtypes,
+)
+
+
+class TestLeanDtypesMethods(unittest.TestCase):
+    """
+    Testing the lean dtype conversions.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=["ISIN", "Date", "Time", "StartPrice", "TradedVolume"],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="StartPrice",
+            src_col_max_price="StartPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.df_src = pd.DataFrame(
+            {
+                "ISIN": ["AT0000A0E9W5", "DE000A0DJ6J9", None, "AT0000A0E9W5"],
+                "Mnemonic": ["SANT", "S9I", "S9I", "SANT"],
+                "Date": ["2021-04-15", "2021-04-15", "2021-04-16", "2021-04-16"],
+                "Time": ["09:00", "12:01", "12:02", "17:29"],
+                "StartPrice": [20.19, 5.7, 5.8, 20.21],
+                "TradedVolume": [279, 60, 40, 1000],
+            }
+        )
+
+    def test_to_lean_dtypes(self):
+        """
+        Tests the to_lean_dtypes function
+        """
+        # Method execution
+        df_result = to_lean_dtypes(self.df_src, self.source_config, 4)
+        # Test after method execution
+        self.assertEqual(list(df_result.columns), self.source_config.src_columns)
+        self.assertEqual(len(df_result), 3)
+        self.assertIsInstance(df_result["ISIN"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df_result["Date"].dtype, np.int32)
+        self.assertEqual(
+            list(day_numbers_to_dates(df_result["Date"])),
+            ["2021-04-15", "2021-04-15", "2021-04-16"],
+        )
+        self.assertEqual(list(df_result["Time"]), [540, 721, 1049])
+        self.assertEqual(df_result["Time"].dtype, np.int16)
+        self.assertEqual(df_result["StartPrice"].dtype, np.float32)
+        self.assertTrue(
+            np.array_equal(
+                restore_prices(df_result["StartPrice"].to_numpy(), 4),
+                [20.19, 5.7, 20.21],
+            )
+        )
+        self.assertEqual(df_result["TradedVolume"].dtype, np.int32)
+
+    def test_to_lean_dtypes_keeps_float64(self):
+        """
+        Tests the to_lean_dtypes function keeping float64 prices
+        float32 cannot restore exactly
+        """
+        # Test init
+        self.df_src["StartPrice"] = [1234567.89, 5.7, 5.8, 20.21]
+        # Method execution
+        df_result = to_lean_dtypes(self.df_src, self.source_config, 4)
+        # Test after method execution
+        self.assertEqual(df_result["StartPrice"].dtype, np.float64)
+
+    def test_concat_lean(self):
+        """
+        Tests the concat_lean function with different categories per frame
+        """
+        # Test init
+        df_first = to_lean_dtypes(self.df_src.iloc[2:], self.source_config, 4)
+        df_second = to_lean_dtypes(self.df_src.iloc[:2], self.source_config, 4)
+        # Method execution
+        df_result = concat_lean([df_first, df_second])
+        # Test after method execution
+        self.assertIsInstance(df_result["ISIN"].dtype, pd.CategoricalDtype)
+        self.assertEqual(
+            list(df_result["ISIN"].cat.categories), ["AT0000A0E9W5", "DE000A0DJ6J9"]
+        )
+        self.assertEqual(
+            list(df_result["ISIN"]), ["AT0000A0E9W5", "AT0000A0E9W5", "DE000A0DJ6J9"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
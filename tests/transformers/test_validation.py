@@ -0,0 +1,112 @@
+"""
+TestSourceValidatorMethods
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from xetra.transformers.validation import SourceValidator
+from xetra.transformers.xetra_transformer import XetraSourceConfig
+
+
+class TestSourceValidatorMethods(unittest.TestCase):
+    """
+    Testing the SourceValidator class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=[
+                "ISIN",
+                "Date",
+                "Time",
+                "StartPrice",
+                "EndPrice",
+                "MinPrice",
+                "MaxPrice",
+                "TradedVolume",
+            ],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+            src_col_end_price="EndPrice",
+        )
+        # one valid row and one row failing every rule
+        self.df_src = pd.DataFrame(
+            {
+                "ISIN": ["AT0000A0E9W5"] * 2
+                + ["DE12", "AT0000A0E9W5", "AT0000A0E9W5", "DE000A0HN5C6"]
+                + ["DE000A0HN5C6", "AT0000A0E9W5", "AT0000A0E9W5"],
+                "Date": ["2021-04-16"] * 9,
+                "Time": ["09:00", "09:01", "09:02", "09:03", "09:04"]
+                + ["09:05", "09:06", "09:07", "09:00"],
+                "StartPrice": [1.0, 1.0, 1.0, -1.0, 2.5, 5.0, 1.0, 1.0, 1.0],
+                "EndPrice": [1.5, np.nan, 1.5, 1.5, 2.5, 1.5, 1.5, 1.5, 1.5],
+                "MinPrice": [1.0, 1.0, 1.0, -1.0, 3.0, 1.0, 1.0, 1.0, 1.0],
+                "MaxPrice": [2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0],
+                "TradedVolume": [10, 10, 10, 10, 10, 10, -10, 10, 10],
+                "Mnemonic": ["X"] * 9,
+            }
+        )
+        self.reasons_exp = [
+            "missing_value",
+            "malformed_isin",
+            "negative_price",
+            "min_above_max",
+            "price_out_of_range",
+            "negative_volume",
+            "duplicate_row",
+        ]
+
+    def test_validate(self):
+        """
+        Tests rejecting the rows failing a rule with their reason code
+        """
+        # Expected results: row 4 also fails price_out_of_range
+        counts_exp = dict(zip(self.reasons_exp, [1, 1, 1, 1, 2, 1, 1]))
+        # Test init
+        validator = SourceValidator(self.source_config)
+        # Method execution
+        df_valid = validator.validate(self.df_src)
+        df_quarantine = validator.quarantine()
+        # Test after method execution
+        self.assertTrue(self.df_src.iloc[[0, 7]].equals(df_valid))
+        self.assertEqual(counts_exp, validator.counts)
+        self.assertEqual(9, validator.rows)
+        self.assertEqual(self.reasons_exp, list(df_quarantine["reason"]))
+        self.assertIsInstance(df_quarantine["reason"].dtype, pd.CategoricalDtype)
+        self.assertEqual(
+            list(self.df_src.columns) + ["reason"], list(df_quarantine.columns)
+        )
+        with self.assertLogs("xetra.transformers.validation") as logs:
+            validator.log_counts()
+        self.assertIn("Validated 9 Xetra source rows, 7 rows rejected.", logs.output[0])
+        self.assertEqual(8, len(logs.output))
+
+    def test_validate_valid_rows(self):
+        """
+        Tests that valid rows are returned without copying the DataFrame
+        """
+        # Test init
+        validator = SourceValidator(self.source_config)
+        df_src = self.df_src.iloc[[0, 7]]
+        # Method execution
+        df_valid = validator.validate(df_src)
+        # Test after method execution
+        self.assertIs(df_src, df_valid)
+        self.assertTrue(validator.quarantine().empty)
+        self.assertEqual(0, sum(validator.counts.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
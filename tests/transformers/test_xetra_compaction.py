@@ -0,0 +1,252 @@
+"""
+TestXetraReportCompactionMethods
+"""
+
+import os
+import unittest
+from io import BytesIO
+
+import boto3
+import pandas as pd
+import pyarrow.parquet as pq
+import moto
+
+from xetra.common.custom_exceptions import WrongFormatException
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.report_manifest import ReportManifest
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+from xetra.transformers.xetra_compaction import (
+    XetraCompactionConfig,
+    XetraReportCompaction,
+)
+
+
+class TestXetraReportCompactionMethods(unittest.TestCase):
+    """
+    Testing the XetraReportCompaction class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name_trg = "test-bucket-trg"
+        self.manifest_key = "meta/report1_manifest.json"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name_trg,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket_trg = S3BucketConnector(
+            bucket=self.s3_bucket_name_trg, endpoint_url=self.s3_endpoint_url
+        )
+        # Creating source, target and compaction configuration
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=[],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.target_config = XetraTargetConfig(
+            trg_col_isin="isin",
+            trg_col_date="date",
+            trg_col_op_price="opening_price_eur",
+            trg_col_clos_price="closing_price_eur",
+            trg_col_min_price="minimum_price_eur",
+            trg_col_max_price="maximum_price_eur",
+            trg_col_dail_trad_vol="daily_traded_volume",
+            trg_col_ch_prev_clos="change_prev_closing_%",
+            trg_key="report1/xetra_daily_report1_",
+            trg_key_date_format="%Y%m%d_%H%M%S",
+            trg_format="parquet",
+        )
+        self.compaction_config = XetraCompactionConfig(
+            comp_key="report1/xetra_daily_report1_month_", comp_row_group_size=2
+        )
+        self.columns = ["ISIN", "Date", "closing_price_eur"]
+        # Daily report files, the second run re-created 2021-04-30
+        self.daily_reports = {
+            "report1/xetra_daily_report1_20210501_080000.parquet": [
+                ["DE0005772206", "2021-04-29", 20.0],
+                ["AT0000A0E9W5", "2021-04-30", 10.0],
+            ],
+            "report1/xetra_daily_report1_20210503_080000.parquet": [
+                ["AT0000A0E9W5", "2021-04-30", 10.5],
+                ["AT0000A0E9W5", "2021-05-03", 11.0],
+            ],
+        }
+        for key, rows in self.daily_reports.items():
+            self.s3_bucket_trg.write_df_to_s3(
+                pd.DataFrame(rows, columns=self.columns), key, "parquet"
+            )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_compact(self):
+        """
+        Tests the compact method merging the daily files per month
+        """
+        # Expected results
+        keys_exp = [
+            "report1/xetra_daily_report1_month_2021-04.parquet",
+            "report1/xetra_daily_report1_month_2021-05.parquet",
+        ]
+        df_april_exp = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-30", 10.5],
+                ["DE0005772206", "2021-04-29", 20.0],
+            ],
+            columns=self.columns,
+        )
+        # Test init
+        compaction = XetraReportCompaction(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.compaction_config,
+            self.manifest_key,
+        )
+        # Method execution
+        keys_result = compaction.compact()
+        # Test after method execution
+        self.assertEqual(keys_result, keys_exp)
+        self.assertEqual(
+            sorted(self.s3_bucket_trg.list_files_in_prefix(self.target_config.trg_key)),
+            keys_exp,
+        )
+        df_april = self.s3_bucket_trg.read_parquet_to_df(keys_exp[0])
+        self.assertTrue(df_april_exp.equals(df_april))
+        manifest = ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+        self.assertEqual([report["key"] for report in manifest.reports], keys_exp)
+        self.assertEqual(manifest.reports[0]["row_count"], 2)
+        self.assertEqual(manifest.reports[1]["date_min"], "2021-05-03")
+
+    def test_compact_into_existing_month(self):
+        """
+        Tests the compact method merging a new daily file
+        into an existing monthly file with row groups
+        """
+        # Expected results
+        key_exp = "report1/xetra_daily_report1_month_2021-05.parquet"
+        # Test init
+        compaction = XetraReportCompaction(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.compaction_config,
+        )
+        compaction.compact()
+        self.s3_bucket_trg.write_df_to_s3(
+            pd.DataFrame(
+                [
+                    ["AT0000A0E9W5", "2021-05-04", 12.0],
+                    ["AT0000A0E9W5", "2021-05-03", 11.5],
+                    ["DE0005772206", "2021-05-04", 21.0],
+                ],
+                columns=self.columns,
+            ),
+            "report1/xetra_daily_report1_20210505_080000.parquet",
+            "parquet",
+        )
+        # Method execution
+        keys_result = compaction.compact()
+        # Test after method execution
+        self.assertEqual(keys_result, [key_exp])
+        self.assertEqual(compaction.daily_keys(), [])
+        df_may = self.s3_bucket_trg.read_parquet_to_df(key_exp)
+        self.assertEqual(
+            list(df_may["Date"]), ["2021-05-03", "2021-05-04", "2021-05-04"]
+        )
+        self.assertEqual(list(df_may["closing_price_eur"]), [11.5, 12.0, 21.0])
+        parquet_file = pq.ParquetFile(BytesIO(self.s3_bucket_trg.read_object(key_exp)))
+        self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+
+    def test_compact_refreshed_report(self):
+        """
+        Tests the compact method keeping the rows of a daily file that
+        was refreshed in the manifest after a later daily file
+        """
+        # Test init: a rerun reproduced the report of 2021-05-01
+        keys = list(self.daily_reports)
+        manifest = ReportManifest()
+        for key in [keys[1], keys[0]]:
+            manifest.add_report(key, ReportManifest.content_hash(key.encode()))
+        manifest.write(self.manifest_key, self.s3_bucket_trg)
+        compaction = XetraReportCompaction(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.compaction_config,
+            self.manifest_key,
+        )
+        # Method execution
+        daily_keys = compaction.daily_keys()
+        compaction.compact()
+        # Test after method execution
+        self.assertEqual([keys[1], keys[0]], daily_keys)
+        df_april = self.s3_bucket_trg.read_parquet_to_df(
+            "report1/xetra_daily_report1_month_2021-04.parquet"
+        )
+        self.assertEqual([10.0, 20.0], list(df_april["closing_price_eur"]))
+
+    def test_compact_csv_target(self):
+        """
+        Tests the compact method rejecting a csv target
+        without touching the daily files
+        """
+        # Test init
+        compaction = XetraReportCompaction(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config._replace(trg_format="csv"),
+            self.compaction_config,
+        )
+        # Method execution and tests after method execution
+        with self.assertRaises(WrongFormatException):
+            compaction.compact()
+        self.assertEqual(
+            sorted(self.s3_bucket_trg.list_files_in_prefix(self.target_config.trg_key)),
+            sorted(self.daily_reports),
+        )
+
+    def test_compact_no_files(self):
+        """
+        Tests the compact method when there are no daily files
+        """
+        # Test init
+        self.s3_bucket_trg.delete_objects(list(self.daily_reports))
+        compaction = XetraReportCompaction(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.compaction_config,
+        )
+        # Method execution
+        with self.assertLogs() as logm:
+            keys_result = compaction.compact()
+            # Log test after method execution
+            self.assertIn("No report files to compact.", logm.output[1])
+        # Test after method execution
+        self.assertEqual(keys_result, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
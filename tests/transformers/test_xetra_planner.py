@@ -0,0 +1,219 @@
+"""
+TestXetraBackfillPlannerMethods
+"""
+
+import os
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import boto3
+import moto
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.transformers.xetra_planner import (
+    MB,
+    XetraBackfillPlanner,
+    XetraPlanConfig,
+)
+from xetra.transformers.xetra_transformer import XetraRunConfig, XetraSourceConfig
+
+
+class TestXetraBackfillPlannerMethods(unittest.TestCase):
+    """
+    Testing the XetraBackfillPlanner class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name_src = "src-bucket"
+        self.s3_bucket_name_trg = "trg-bucket"
+        self.meta_key = "meta_key"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating the buckets on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        for bucket in [self.s3_bucket_name_src, self.s3_bucket_name_trg]:
+            self.s3.create_bucket(
+                Bucket=bucket,
+                CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+            )
+        self.src_bucket = self.s3.Bucket(self.s3_bucket_name_src)
+        self.s3_bucket_src = S3BucketConnector(
+            bucket=self.s3_bucket_name_src, endpoint_url=self.s3_endpoint_url
+        )
+        self.s3_bucket_trg = S3BucketConnector(
+            bucket=self.s3_bucket_name_trg, endpoint_url=self.s3_endpoint_url
+        )
+        # Source files of yesterday (2 files) and today (1 file)
+        today = datetime.today().date()
+        self.yesterday = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        self.today = today.strftime("%Y-%m-%d")
+        self.sizes = {
+            f"{self.yesterday}/{self.yesterday}_BINS_XETR10.csv": 3 * MB,
+            f"{self.yesterday}/{self.yesterday}_BINS_XETR11.csv": 1 * MB,
+            f"{self.today}/{self.today}_BINS_XETR10.csv": 2 * MB,
+        }
+        for key, size in self.sizes.items():
+            self.src_bucket.put_object(Body=b"x" * size, Key=key)
+        # Creating the source and plan configuration
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date=self.yesterday,
+            src_columns=[],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.plan_config = XetraPlanConfig(
+            plan_download_mb_s=1.0,
+            plan_parse_mb_s=2.0,
+            plan_aggregate_mb_s=4.0,
+            plan_expansion=3.0,
+            plan_memory_mb=30,
+        )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_plan_in_memory(self):
+        """
+        Tests the plan of an in-memory run without reading any source file
+        """
+        # Test init
+        planner = XetraBackfillPlanner(
+            self.s3_bucket_src,
+            self.s3_bucket_trg,
+            self.meta_key,
+            self.source_config,
+            plan_args=self.plan_config,
+        )
+        # Method execution
+        with patch.object(
+            self.s3_bucket_src, "_get_body", side_effect=AssertionError
+        ), patch("os.cpu_count", return_value=2):
+            plan = planner.plan()
+        # Test after method execution
+        self.assertEqual(self.yesterday, plan.extract_date)
+        self.assertEqual([self.yesterday, self.today], plan.dates[1:])
+        self.assertEqual(3, plan.file_count)
+        self.assertEqual(6 * MB, plan.total_bytes)
+        self.assertEqual(3 * MB, plan.max_file_bytes)
+        self.assertEqual(4 * MB, plan.max_day_bytes)
+        self.assertEqual("in-memory", plan.mode)
+        # all files parsed and concatenated: 2 * 6 MB * 3.0
+        self.assertEqual(36 * MB, plan.memory_peak)
+        # 6 MB downloaded, parsed and aggregated one after another
+        self.assertAlmostEqual(6 / 1 + 6 / 2 + 6 / 4, plan.runtime)
+        # 36 MB do not fit into 30 MB, the recommended pipeline neither
+        # (7 raw files and 4 DataFrames of 3 MB with 1 queued file),
+        # batches of one file do
+        self.assertEqual("batched", plan.recommended_mode)
+        self.assertEqual(30, plan.recommended_max_memory_mb)
+        # 2 parse workers parse 4 MB/s
+        self.assertEqual(4, plan.recommended_download_workers)
+        self.assertEqual(2, plan.recommended_parse_workers)
+        self.assertEqual(1, plan.recommended_aggregate_workers)
+        self.assertEqual(1, plan.recommended_queue_size)
+        report = planner.report(plan)
+        self.assertIn("does NOT fit into 30 MB", report)
+        self.assertIn("run_max_memory_mb:      30", report)
+        self.assertIn("run_queue_size:         1", report)
+        # Method execution with 60 MB
+        planner.plan_args = self.plan_config._replace(plan_memory_mb=60)
+        with patch("os.cpu_count", return_value=2):
+            plan = planner.plan()
+        # Test after method execution
+        self.assertEqual("in-memory", plan.recommended_mode)
+        # no more than the 36 MB of all files
+        self.assertEqual(36, plan.recommended_max_memory_mb)
+        self.assertIn("(fits into 60 MB)", planner.report(plan))
+
+    def test_plan_pipeline_and_spill(self):
+        """
+        Tests the memory peak and runtime of pipelined and spilling runs
+        """
+        # Test init
+        run_configs = {
+            "pipeline": XetraRunConfig(
+                run_pipeline=True,
+                run_download_workers=2,
+                run_parse_workers=1,
+                run_aggregate_workers=1,
+                run_queue_size=1,
+            ),
+            "batched": XetraRunConfig(run_max_memory_mb=10, run_download_workers=2),
+            "spill": XetraRunConfig(run_spill_dir="/tmp", run_spill_memory_mb=10),
+        }
+        # Expected results: pipeline with 4 raw files and 3 DataFrames
+        # of 3 MB, batches of at least one file (2 * 3 MB * 3.0) and
+        # spilling with the spill memory and the largest day
+        memory_exp = {
+            "pipeline": (4 + 3 * 3.0) * 3 * MB,
+            "batched": 18 * MB,
+            "spill": 22 * MB,
+        }
+        runtime_exp = {
+            "pipeline": 6 / 2,
+            "batched": 6 / 2 + 6 / 2 + 6 / 4,
+            "spill": 6 / 1 + 6 / 2 + 6 / 4,
+        }
+        for mode, run_config in run_configs.items():
+            with self.subTest(mode=mode):
+                # Method execution
+                plan = XetraBackfillPlanner(
+                    self.s3_bucket_src,
+                    self.s3_bucket_trg,
+                    self.meta_key,
+                    self.source_config,
+                    run_config,
+                    self.plan_config,
+                ).plan()
+                # Test after method execution
+                self.assertEqual(mode, plan.mode)
+                self.assertEqual(memory_exp[mode], plan.memory_peak)
+                self.assertAlmostEqual(runtime_exp[mode], plan.runtime)
+
+    def test_plan_nothing_to_process(self):
+        """
+        Tests the plan if the meta file lists all source dates
+        """
+        # Test init
+        self.s3.Bucket(self.s3_bucket_name_trg).put_object(
+            Body=(
+                "source_date,datetime_of_processing\n"
+                f"{self.yesterday},{self.today} 10:00:00\n"
+                f"{self.today},{self.today} 10:00:00\n"
+            ),
+            Key=self.meta_key,
+        )
+        planner = XetraBackfillPlanner(
+            self.s3_bucket_src,
+            self.s3_bucket_trg,
+            self.meta_key,
+            self.source_config,
+        )
+        # Method execution
+        plan = planner.plan()
+        # Test after method execution
+        self.assertEqual([], plan.dates)
+        self.assertEqual(0, plan.file_count)
+        self.assertEqual("No new Xetra source dates to process.", planner.report(plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+TestXetraReportReaderMethods
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+import boto3
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import moto
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.report_manifest import ReportManifest
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+from xetra.transformers.xetra_report_reader import XetraReportReader
+
+
+class TestXetraReportReaderMethods(unittest.TestCase):
+    """
+    Testing the XetraReportReader class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name_trg = "test-bucket-trg"
+        self.manifest_key = "meta/report1_manifest.json"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name_trg,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket_trg = S3BucketConnector(
+            bucket=self.s3_bucket_name_trg, endpoint_url=self.s3_endpoint_url
+        )
+        # Creating source and target configuration
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=[],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.target_config = XetraTargetConfig(
+            trg_col_isin="isin",
+            trg_col_date="date",
+            trg_col_op_price="opening_price_eur",
+            trg_col_clos_price="closing_price_eur",
+            trg_col_min_price="minimum_price_eur",
+            trg_col_max_price="maximum_price_eur",
+            trg_col_dail_trad_vol="daily_traded_volume",
+            trg_col_ch_prev_clos="change_prev_closing_%",
+            trg_key="report1/xetra_daily_report1_",
+            trg_key_date_format="%Y%m%d_%H%M%S",
+            trg_format="parquet",
+        )
+        self.columns = ["ISIN", "Date", "closing_price_eur", "daily_traded_volume"]
+        # Report files with one row group per row, the last run re-created 2021-04-19
+        self.reports = {
+            "report1/xetra_daily_report1_20210417_080000.parquet": [
+                ["AT0000A0E9W5", "2021-04-15", 10.0, 100],
+                ["AT0000A0E9W5", "2021-04-16", 11.0, 200],
+                ["DE0005772206", "2021-04-16", 20.0, 10],
+            ],
+            "report1/xetra_daily_report1_20210420_080000.parquet": [
+                ["AT0000A0E9W5", "2021-04-19", 12.0, 300],
+                ["DE0005772206", "2021-04-19", 21.0, 20],
+                ["DE0007100000", "2021-04-19", 30.0, 5],
+            ],
+            "report1/xetra_daily_report1_20210421_080000.parquet": [
+                ["AT0000A0E9W5", "2021-04-19", 12.5, 350],
+                ["AT0000A0E9W5", "2021-04-20", 13.0, 400],
+            ],
+        }
+        manifest = ReportManifest()
+        for key, rows in self.reports.items():
+            df_report = pd.DataFrame(rows, columns=self.columns)
+            content = self.s3_bucket_trg.table_to_bytes(
+                pa.Table.from_pandas(df_report, preserve_index=False), "parquet", 1
+            )
+            self.s3_bucket_trg.write_object(content, key)
+            manifest.add_report(
+                key,
+                ReportManifest.content_hash(content),
+                len(content),
+                ReportManifest.report_stats(df_report, "Date", "ISIN"),
+            )
+        manifest.write(self.manifest_key, self.s3_bucket_trg)
+        self.keys = list(self.reports)
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_report_keys_key_dates(self):
+        """
+        Tests the report_keys method pruning by the processing date in the key
+        """
+        # Test init
+        reader = XetraReportReader(
+            self.s3_bucket_trg, self.source_config, self.target_config
+        )
+        # Method execution
+        keys_result = reader.report_keys(first_date="2021-04-19")
+        # Test after method execution
+        self.assertEqual(keys_result, self.keys[1:])
+
+    def test_report_keys_manifest(self):
+        """
+        Tests the report_keys method pruning by the manifest statistics
+        """
+        # Test init
+        reader = XetraReportReader(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.manifest_key,
+        )
+        # Method execution
+        keys_dates = reader.report_keys(first_date="2021-04-10", last_date="2021-04-16")
+        keys_isins = reader.report_keys(isins=["DE0007100000"])
+        # Test after method execution
+        self.assertEqual(keys_dates, self.keys[:1])
+        self.assertEqual(keys_isins, self.keys[1:2])
+
+    def test_read_report_row_groups(self):
+        """
+        Tests the read_report method reading only the matching row groups
+        """
+        # Test init
+        reader = XetraReportReader(
+            self.s3_bucket_trg, self.source_config, self.target_config
+        )
+        read_row_groups = pq.ParquetFile.read_row_groups
+        # Method execution
+        with patch.object(
+            pq.ParquetFile,
+            "read_row_groups",
+            autospec=True,
+            side_effect=read_row_groups,
+        ) as mock_read:
+            table_result = reader.read_report(
+                self.keys[0], first_date="2021-04-16", isins=["AT0000A0E9W5"]
+            )
+        # Test after method execution
+        self.assertEqual(mock_read.call_args[0][1], [1])
+        self.assertEqual(table_result.to_pylist()[0]["closing_price_eur"], 11.0)
+
+    def test_read(self):
+        """
+        Tests the read method with date range, ISINs and columns
+        keeping the rows of the latest report file
+        """
+        # Expected results
+        df_exp = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-16", 11.0],
+                ["AT0000A0E9W5", "2021-04-19", 12.5],
+                ["DE0005772206", "2021-04-16", 20.0],
+                ["DE0005772206", "2021-04-19", 21.0],
+            ],
+            columns=["ISIN", "Date", "closing_price_eur"],
+        )
+        # Test init
+        reader = XetraReportReader(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.manifest_key,
+            max_workers=2,
+        )
+        # Method execution
+        df_result = reader.read(
+            first_date="2021-04-16",
+            last_date="2021-04-19",
+            isins=["AT0000A0E9W5", "DE0005772206"],
+            columns=["closing_price_eur"],
+        )
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_read_no_files(self):
+        """
+        Tests the read method when no report file matches
+        """
+        # Test init
+        reader = XetraReportReader(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.manifest_key,
+        )
+        # Method execution
+        df_result = reader.read(first_date="2021-05-01")
+        # Test after method execution
+        self.assertTrue(df_result.empty)
+        self.assertEqual(list(df_result.columns), ["ISIN", "Date"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,273 @@
+"""
+TestXetraRollingReportMethods
+"""
+
+import os
+import unittest
+
+import boto3
+import numpy as np
+import pandas as pd
+import moto
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+from xetra.transformers.xetra_rolling_report import (
+    XetraRollingConfig,
+    XetraRollingReport,
+)
+
+
+class TestXetraRollingReportMethods(unittest.TestCase):
+    """
+    Testing the XetraRollingReport class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name_trg = "test-bucket-trg"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name_trg,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket_trg = S3BucketConnector(
+            bucket=self.s3_bucket_name_trg, endpoint_url=self.s3_endpoint_url
+        )
+        # Creating source, target and rolling report configuration
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=[],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.target_config = XetraTargetConfig(
+            trg_col_isin="isin",
+            trg_col_date="date",
+            trg_col_op_price="opening_price_eur",
+            trg_col_clos_price="closing_price_eur",
+            trg_col_min_price="minimum_price_eur",
+            trg_col_max_price="maximum_price_eur",
+            trg_col_dail_trad_vol="daily_traded_volume",
+            trg_col_ch_prev_clos="change_prev_closing_%",
+            trg_key="report1/xetra_daily_report1_",
+            trg_key_date_format="%Y%m%d_%H%M%S",
+            trg_format="parquet",
+        )
+        self.rolling_config = XetraRollingConfig(
+            roll_windows=[2],
+            roll_col_return="return_{window}d_%",
+            roll_col_volatility="volatility_{window}d_%",
+            roll_col_avg_vol="avg_volume_{window}d",
+            roll_key="rolling/xetra_rolling_report_",
+            roll_key_date_format="%Y%m%d_%H%M%S",
+            roll_format="parquet",
+        )
+        columns = ["ISIN", "Date", "closing_price_eur", "daily_traded_volume"]
+        self.df_history = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-15", 10.0, 100],
+                ["AT0000A0E9W5", "2021-04-16", 11.0, 200],
+            ],
+            columns=columns,
+        )
+        self.df_new = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-19", 12.1, 300],
+                ["AT0000A0E9W5", "2021-04-20", 10.89, 400],
+                ["DE0005772206", "2021-04-19", 20.0, 10],
+                ["DE0005772206", "2021-04-20", 30.0, 30],
+            ],
+            columns=columns,
+        )
+        self.df_exp = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-19", 21.0, 0.0, 250.0],
+                ["AT0000A0E9W5", "2021-04-20", -1.0, 14.14, 350.0],
+                ["DE0005772206", "2021-04-19", np.nan, np.nan, np.nan],
+                ["DE0005772206", "2021-04-20", np.nan, np.nan, 20.0],
+            ],
+            columns=[
+                "ISIN",
+                "Date",
+                "return_2d_%",
+                "volatility_2d_%",
+                "avg_volume_2d",
+            ],
+        )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_transform_ok(self):
+        """
+        Tests the transform method combining
+        new report 1 rows with the history
+        """
+        # Method execution
+        rolling_report = XetraRollingReport(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.rolling_config,
+        )
+        df_result = rolling_report.transform(self.df_new, self.df_history)
+        # Test after method execution
+        pd.testing.assert_frame_equal(self.df_exp, df_result)
+
+    def test_transform_zero_close(self):
+        """
+        Tests the transform method with a closing price of 0,
+        the returns based on it are NaN and the other ISINs are unaffected
+        """
+        # Expected results
+        df_exp = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-19", 21.0, np.nan, 250.0],
+                ["AT0000A0E9W5", "2021-04-20", np.nan, np.nan, 350.0],
+                ["DE0005772206", "2021-04-19", np.nan, np.nan, 10.0],
+                ["DE0005772206", "2021-04-20", 50.0, 35.36, 20.0],
+            ],
+            columns=self.df_exp.columns,
+        )
+        # Test init
+        df_history = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-15", 10.0, 100],
+                ["AT0000A0E9W5", "2021-04-16", 0.0, 200],
+                ["DE0005772206", "2021-04-16", 20.0, 10],
+            ],
+            columns=self.df_history.columns,
+        )
+        # Method execution
+        rolling_report = XetraRollingReport(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.rolling_config,
+        )
+        df_result = rolling_report.transform(self.df_new, df_history)
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
+    def test_run_reads_history(self):
+        """
+        Tests the run method reading the report 1 history from
+        the target bucket and skipping files older than the lookback
+        """
+        # Test init
+        self.s3_bucket_trg.write_df_to_s3(
+            self.df_history,
+            "report1/xetra_daily_report1_20210416_200000.parquet",
+            "parquet",
+        )
+        self.s3_bucket_trg.write_df_to_s3(
+            self.df_history.assign(closing_price_eur=1.0),
+            "report1/xetra_daily_report1_20200101_200000.parquet",
+            "parquet",
+        )
+        rolling_report = XetraRollingReport(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.rolling_config,
+        )
+        # Method execution
+        with self.assertLogs() as logm:
+            rolling_report.run(self.df_new)
+            # Log test after method execution
+            self.assertIn("Xetra rolling report successfully written.", logm.output[-1])
+        # Test after method execution
+        self.assertNotIn(
+            "Reading file %s/%s/report1/xetra_daily_report1_20200101_200000.parquet"
+            % (self.s3_endpoint_url, self.s3_bucket_name_trg),
+            "".join(logm.output),
+        )
+        trg_file = self.s3_bucket_trg.list_files_in_prefix(
+            self.rolling_config.roll_key
+        )[0]
+        df_result = self.s3_bucket_trg.read_parquet_to_df(trg_file)
+        pd.testing.assert_frame_equal(self.df_exp, df_result)
+
+    def test_run_reads_csv_history(self):
+        """
+        Tests the run method reading a report 1 history written
+        as gzip compressed csv files
+        """
+        # Test init
+        target_config = self.target_config._replace(
+            trg_format="csv", trg_compression="gzip"
+        )
+        self.s3_bucket_trg.write_df_to_s3(
+            self.df_history,
+            "report1/xetra_daily_report1_20210416_200000.csv.gz",
+            "csv",
+            "gzip",
+        )
+        self.s3_bucket_trg.write_df_to_s3(
+            self.df_history.assign(closing_price_eur=1.0),
+            "report1/xetra_daily_report1_20200101_200000.csv.gz",
+            "csv",
+            "gzip",
+        )
+        rolling_report = XetraRollingReport(
+            self.s3_bucket_trg,
+            self.source_config,
+            target_config,
+            self.rolling_config,
+        )
+        # Method execution
+        with self.assertLogs() as logm:
+            rolling_report.run(self.df_new)
+        # Test after method execution
+        self.assertNotIn("20200101_200000", "".join(logm.output))
+        trg_file = self.s3_bucket_trg.list_files_in_prefix(
+            self.rolling_config.roll_key
+        )[0]
+        df_result = self.s3_bucket_trg.read_parquet_to_df(trg_file)
+        pd.testing.assert_frame_equal(self.df_exp, df_result)
+
+    def test_run_emptydf(self):
+        """
+        Tests the run method with an empty DataFrame as input argument
+        """
+        # Expected results
+        log_exp = "The dataframe is empty. No rolling report is created."
+        # Method execution
+        rolling_report = XetraRollingReport(
+            self.s3_bucket_trg,
+            self.source_config,
+            self.target_config,
+            self.rolling_config,
+        )
+        with self.assertLogs() as logm:
+            rolling_report.run(pd.DataFrame())
+            # Log test after method execution
+            self.assertIn(log_exp, logm.output[0])
+        # Test after method execution
+        self.assertFalse(
+            self.s3_bucket_trg.list_files_in_prefix(self.rolling_config.roll_key)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+TestXetraTopMoversMethods
+"""
+
+import os
+import unittest
+
+import boto3
+import numpy as np
+import pandas as pd
+import moto
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.transformers.xetra_transformer import XetraSourceConfig, XetraTargetConfig
+from xetra.transformers.xetra_top_movers import (
+    XetraTopMovers,
+    XetraTopMoversConfig,
+    top_k_indices,
+)
+
+
+class TestXetraTopMoversMethods(unittest.TestCase):
+    """
+    Testing the XetraTopMovers class.
+    """
+
+    def setUp(self):
+        """
+        Setting up the environment
+        """
+        # mocking s3 connection start
+        self.mock_s3 = moto.mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = "AWS_ACCESS_KEY_ID"
+        self.s3_secret_key = "AWS_SECRET_ACCESS_KEY"
+        self.s3_endpoint_url = "https://s3.eu-central-1.amazonaws.com"
+        self.s3_bucket_name_trg = "test-bucket-trg"
+        # Creating s3 access keys as environment variables
+        os.environ[self.s3_access_key] = "KEY1"
+        os.environ[self.s3_secret_key] = "KEY2"
+        # Creating a bucket on the mocked s3
+        self.s3 = boto3.resource(service_name="s3", endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(
+            Bucket=self.s3_bucket_name_trg,
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        self.s3_bucket_trg = S3BucketConnector(
+            bucket=self.s3_bucket_name_trg, endpoint_url=self.s3_endpoint_url
+        )
+        # Creating source, target and top movers configuration
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date="2021-04-01",
+            src_columns=[],
+            src_col_date="Date",
+            src_col_isin="ISIN",
+            src_col_time="Time",
+            src_col_start_price="StartPrice",
+            src_col_min_price="MinPrice",
+            src_col_max_price="MaxPrice",
+            src_col_traded_vol="TradedVolume",
+        )
+        self.target_config = XetraTargetConfig(
+            trg_col_isin="isin",
+            trg_col_date="date",
+            trg_col_op_price="opening_price_eur",
+            trg_col_clos_price="closing_price_eur",
+            trg_col_min_price="minimum_price_eur",
+            trg_col_max_price="maximum_price_eur",
+            trg_col_dail_trad_vol="daily_traded_volume",
+            trg_col_ch_prev_clos="change_prev_closing_%",
+            trg_key="report1/xetra_daily_report1_",
+            trg_key_date_format="%Y%m%d_%H%M%S",
+            trg_format="parquet",
+        )
+        self.top_config = XetraTopMoversConfig(
+            top_n=2,
+            top_col_category="category",
+            top_col_rank="rank",
+            top_key="top_movers/xetra_top_movers_",
+            top_key_date_format="%Y%m%d_%H%M%S",
+            top_format="parquet",
+        )
+        columns = ["ISIN", "Date", "daily_traded_volume", "change_prev_closing_%"]
+        # sorted by ISIN and date like report 1
+        self.df_report = pd.DataFrame(
+            [
+                ["AT0000A0E9W5", "2021-04-19", 100, 1.5],
+                ["AT0000A0E9W5", "2021-04-20", 10, -1.0],
+                ["DE0005772206", "2021-04-19", 300, -2.0],
+                ["DE0007100000", "2021-04-19", 200, np.nan],
+                ["DE000A1EWWW0", "2021-04-19", 50, 3.0],
+            ],
+            columns=columns,
+        )
+        self.df_exp = pd.DataFrame(
+            [
+                ["gainers", 1, "DE000A1EWWW0", "2021-04-19", 50, 3.0],
+                ["gainers", 2, "AT0000A0E9W5", "2021-04-19", 100, 1.5],
+                ["losers", 1, "DE0005772206", "2021-04-19", 300, -2.0],
+                ["losers", 2, "AT0000A0E9W5", "2021-04-19", 100, 1.5],
+                ["most_traded", 1, "DE0005772206", "2021-04-19", 300, -2.0],
+                ["most_traded", 2, "DE0007100000", "2021-04-19", 200, np.nan],
+                ["gainers", 1, "AT0000A0E9W5", "2021-04-20", 10, -1.0],
+                ["losers", 1, "AT0000A0E9W5", "2021-04-20", 10, -1.0],
+                ["most_traded", 1, "AT0000A0E9W5", "2021-04-20", 10, -1.0],
+            ],
+            columns=["category", "rank"] + columns,
+        )
+
+    def tearDown(self):
+        # mocking s3 connection stop
+        self.mock_s3.stop()
+
+    def test_top_k_indices(self):
+        """
+        Tests the top_k_indices function for the largest
+        and smallest values ignoring NaN values
+        """
+        # Test init
+        values = np.array([3.0, np.nan, 7.0, -1.0, 5.0])
+        # Method execution and tests
+        self.assertEqual(list(top_k_indices(values, 2)), [2, 4])
+        self.assertEqual(list(top_k_indices(values, 2, largest=False)), [3, 0])
+        self.assertEqual(list(top_k_indices(values, 10)), [2, 4, 0, 3])
+
+    def test_transform_ok(self):
+        """
+        Tests the transform method selecting
+        the top ISINs per day and category
+        """
+        # Method execution
+        top_movers = XetraTopMovers(
+            self.s3_bucket_trg, self.source_config, self.target_config, self.top_config
+        )
+        df_result = top_movers.transform(self.df_report)
+        # Test after method execution
+        pd.testing.assert_frame_equal(self.df_exp, df_result)
+
+    def test_run_ok(self):
+        """
+        Tests the run method writing the
+        top movers report to the target bucket
+        """
+        # Method execution
+        top_movers = XetraTopMovers(
+            self.s3_bucket_trg, self.source_config, self.target_config, self.top_config
+        )
+        with self.assertLogs() as logm:
+            top_movers.run(self.df_report)
+            # Log test after method execution
+            self.assertIn(
+                "Xetra top movers report successfully written.", logm.output[-1]
+            )
+        # Test after method execution
+        trg_file = self.s3_bucket_trg.list_files_in_prefix(self.top_config.top_key)[0]
+        df_result = self.s3_bucket_trg.read_parquet_to_df(trg_file)
+        pd.testing.assert_frame_equal(self.df_exp, df_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
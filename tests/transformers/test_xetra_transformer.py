@@ -3,7 +3,9 @@ TestXetraETLMethods
 """
 
 import os
+import tempfile
 import unittest
+from contextlib import nullcontext
 from unittest.mock import patch
 from io import BytesIO
 
@@ -12,9 +14,15 @@ import pandas as pd
 import moto
 
 from xetra.common.s3 import S3BucketConnector
+from xetra.common.storage import compress, get_storage_connector
 from xetra.common.meta_process import MetaProcess
+from xetra.common.isin_dictionary import IsinDictionary
+from xetra.common.batching import AdaptiveBatcher, InFlightBytes
+from xetra.common.profiling import StageProfiler
+from xetra.common.report_manifest import ReportManifest
 from xetra.transformers.xetra_transformer import (
     XetraETL,
+    XetraRunConfig,
     XetraSourceConfig,
     XetraTargetConfig,
 )
@@ -255,11 +263,68 @@ class TestXetraETLMethods(unittest.TestCase):
             ["AT0000A0E9W5", "2021-04-19", 23.58, 24.22, 22.21, 25.01, 3586, 14.58],
         ]
         self.df_report = pd.DataFrame(data_report, columns=columns_report)
+        # Extract dates and report manifest of the etl_report1 tests
+        self.extract_date = "2021-04-17"
+        self.extract_date_list = [
+            "2021-04-16",
+            "2021-04-17",
+            "2021-04-18",
+            "2021-04-19",
+        ]
+        self.manifest_key = "meta/report1_manifest.json"
 
     def tearDown(self):
         # mocking s3 connection stop
         self.mock_s3.stop()
 
+    def xetra_etl(self, **kwargs):
+        """
+        Creating a XetraETL instance for the extract date 2021-04-17
+
+        :param kwargs: arguments replacing the default XetraETL arguments
+        """
+        args = {
+            "s3_bucket_src": self.s3_bucket_src,
+            "s3_bucket_trg": self.s3_bucket_trg,
+            "meta_key": self.meta_key,
+            "src_args": self.source_config,
+            "trg_args": self.target_config,
+        }
+        args.update(kwargs)
+        with patch.object(
+            MetaProcess,
+            "return_date_list",
+            return_value=[self.extract_date, self.extract_date_list],
+        ):
+            return XetraETL(**args)
+
+    def assert_report(self, s3_bucket=None, trg_args=None):
+        """
+        Asserting that the target bucket holds one report equal to df_report
+
+        :param s3_bucket: target bucket, the mocked target bucket if None
+        :param trg_args: target configuration, target_config if None
+
+        returns:
+          trg_file: key of the report
+        """
+        s3_bucket = s3_bucket or self.s3_bucket_trg
+        trg_args = trg_args or self.target_config
+        trg_files = s3_bucket.list_files_in_prefix(trg_args.trg_key)
+        self.assertEqual(1, len(trg_files))
+        if trg_args.trg_format == "csv":
+            df_result = s3_bucket.read_csv_to_df(trg_files[0])
+        else:
+            df_result = s3_bucket.read_parquet_to_df(trg_files[0])
+        self.assertTrue(self.df_report.equals(df_result))
+        return trg_files[0]
+
+    def clear_target(self):
+        """
+        Deleting the files of the target bucket between subtests
+        """
+        self.s3_bucket_trg.delete_objects(self.s3_bucket_trg.list_files_in_prefix(""))
+
     def test_extract_no_files(self):
         """
         Tests the extract method when
@@ -385,6 +450,28 @@ class TestXetraETLMethods(unittest.TestCase):
         # Test after method execution
         self.assertTrue(df_exp.equals(df_result))
 
+    def test_transform_report1_vwap_turnover(self):
+        """
+        Tests the transform_report1 method with
+        VWAP and turnover columns configured
+        """
+        # Expected results
+        df_exp = self.df_report.copy()
+        df_exp["vwap_eur"] = [19.44, 19.96, 23.52]
+        df_exp["turnover_eur"] = [21156.07, 205290.15, 84330.94]
+        # Test init
+        df_input = self.df_src.loc[1:8].reset_index(drop=True)
+        xetra_etl = self.xetra_etl(
+            src_args=self.source_config._replace(src_col_end_price="EndPrice"),
+            trg_args=self.target_config._replace(
+                trg_col_vwap="vwap_eur", trg_col_turnover="turnover_eur"
+            ),
+        )
+        # Method execution
+        df_result = xetra_etl.transform_report1(df_input)
+        # Test after method execution
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
     def test_load(self):
         """
         Tests the load method
@@ -411,7 +498,7 @@ class TestXetraETLMethods(unittest.TestCase):
                 self.source_config,
                 self.target_config,
             )
-            with self.assertLogs() as logm:
+            with self.assertLogs("xetra") as logm:
                 xetra_etl.load(df_input)
                 # Log test after method execution
                 self.assertIn(log1_exp, logm.output[1])
@@ -472,6 +559,377 @@ class TestXetraETLMethods(unittest.TestCase):
             Delete={"Objects": [{"Key": trg_file}, {"Key": trg_file}]}
         )
 
+    def test_etl_report1_profiler(self):
+        """
+        Tests the etl_report1 method profiling every stage
+        """
+        # Expected results
+        stages_exp = ["01_extract", "02_transform_report1", "03_load", "04_update_meta"]
+        # Method execution
+        with tempfile.TemporaryDirectory() as profile_dir:
+            self.xetra_etl(profiler=StageProfiler(profile_dir)).etl_report1()
+            # Test after method execution
+            self.assertEqual(
+                [
+                    f"{stage}{suffix}"
+                    for stage in stages_exp
+                    for suffix in [".prof", "_memory.txt"]
+                ],
+                sorted(os.listdir(profile_dir)),
+            )
+        self.assert_report()
+
+    def test_etl_report1_validation(self):
+        """
+        Tests the etl_report1 method rejecting invalid source
+        rows and writing them to the quarantine
+        """
+        # Expected results
+        reasons_exp = ["malformed_isin", "min_above_max", "negative_volume"]
+        counts_exp = {
+            "missing_value": 0,
+            "malformed_isin": 1,
+            "negative_price": 0,
+            "min_above_max": 1,
+            "price_out_of_range": 1,
+            "negative_volume": 1,
+            "duplicate_row": 0,
+        }
+        # Test init
+        quarantine_key = "quarantine/xetra_report1_quarantine_"
+        df_invalid = pd.DataFrame(
+            [
+                ["AT0000A0E9W", "SANT", "2021-04-18", "09:00", 1.0, 1.0, 1.0, 1.0, 1],
+                ["AT0000A0E9W5", "SANT", "2021-04-18", "09:00", 1.0, 1.0, 2.0, 1.0, 1],
+                ["AT0000A0E9W5", "SANT", "2021-04-18", "09:00", 1.0, 1.0, 1.0, 1.0, -1],
+            ],
+            columns=self.df_src.columns,
+        )
+        self.s3_bucket_src.write_df_to_s3(
+            df_invalid, "2021-04-18/2021-04-18_BINS_XETR09.csv", "csv"
+        )
+        # Method execution
+        xetra_etl = self.xetra_etl(
+            run_args=XetraRunConfig(
+                run_validate=True, run_quarantine_key=quarantine_key
+            )
+        )
+        xetra_etl.etl_report1()
+        # Test after method execution
+        self.assert_report()
+        quarantine_file = self.s3_bucket_trg.list_files_in_prefix(quarantine_key)[0]
+        df_quarantine = self.s3_bucket_trg.read_parquet_to_df(quarantine_file)
+        self.assertEqual(reasons_exp, list(df_quarantine["reason"]))
+        self.assertEqual(11, xetra_etl.validator.rows)
+        self.assertEqual(counts_exp, xetra_etl.validator.counts)
+
+    def test_etl_report1_dedup(self):
+        """
+        Tests the etl_report1 method skipping a re-delivered
+        source file and dropping repeated source rows, the rows of the
+        earlier source file are kept in every extraction mode
+        """
+        # Test init: copy of XETR07 under a new key and a late file
+        # repeating two rows with other volumes
+        self.s3_bucket_src.write_df_to_s3(
+            self.df_src.loc[4:4], "2021-04-18/2021-04-18_BINS_XETR09.csv", "csv"
+        )
+        df_late = self.df_src.loc[5:6].copy()
+        df_late["TradedVolume"] *= 10
+        self.s3_bucket_src.write_df_to_s3(
+            df_late, "2021-04-19/2021-04-19_BINS_XETR10.csv", "csv"
+        )
+        for run_args in [
+            XetraRunConfig(run_dedup=True),
+            XetraRunConfig(
+                run_dedup=True,
+                run_pipeline=True,
+                run_download_workers=4,
+                run_parse_workers=4,
+            ),
+            XetraRunConfig(run_dedup=True, run_max_memory_mb=1, run_download_workers=4),
+        ]:
+            with self.subTest(run_args=run_args):
+                self.clear_target()
+                # Method execution
+                xetra_etl = self.xetra_etl(run_args=run_args)
+                xetra_etl.etl_report1()
+                # Test after method execution
+                self.assert_report()
+                self.assertEqual(1, xetra_etl.dedup.skipped_files)
+                self.assertEqual(2, xetra_etl.dedup.dropped_rows)
+
+    def test_etl_report1_isin_dictionary(self):
+        """
+        Tests the etl_report1 method with ISINs
+        encoded by the ISIN dictionary
+        """
+        # Test init
+        isin_dict_key = "isin_dictionary.csv"
+        # Method execution
+        xetra_etl = self.xetra_etl(isin_dict_key=isin_dict_key)
+        df_extract = xetra_etl.extract()
+        xetra_etl.etl_report1()
+        # Test after method execution
+        self.assertEqual(df_extract["ISIN"].dtype, "int32")
+        self.assert_report()
+        df_dict_result = self.s3_bucket_trg.read_csv_to_df(isin_dict_key)
+        self.assertEqual(list(df_dict_result["isin"]), ["AT0000A0E9W5"])
+
+    def test_init_reads_no_meta_data(self):
+        """
+        Tests the constructor with the dates of an earlier meta file read
+        -> neither the meta file nor the ISIN dictionary are read until
+        the ISINs are encoded
+        """
+        # Test init
+        extract_dates = ("2021-04-17", ["2021-04-16", "2021-04-17"])
+        # Method execution
+        with patch.object(MetaProcess, "return_date_list") as return_date_list, patch(
+            "xetra.transformers.xetra_transformer.IsinDictionary.read",
+            wraps=IsinDictionary.read,
+        ) as read_dict:
+            xetra_etl = XetraETL(
+                self.s3_bucket_src,
+                self.s3_bucket_trg,
+                self.meta_key,
+                self.source_config,
+                self.target_config,
+                isin_dict_key="isin_dictionary.csv",
+                extract_dates=extract_dates,
+            )
+            read_before = read_dict.call_count
+            xetra_etl.extract()
+            xetra_etl.extract()
+        # Test after method execution
+        return_date_list.assert_not_called()
+        self.assertEqual(["2021-04-16", "2021-04-17"], xetra_etl.extract_date_list)
+        self.assertEqual(0, read_before)
+        self.assertEqual(1, read_dict.call_count)
+
+    def test_etl_report1_out_of_core(self):
+        """
+        Tests the etl_report1 method spilling
+        the source data to local disk
+        """
+        # Method execution
+        with tempfile.TemporaryDirectory() as spill_dir:
+            self.xetra_etl(
+                run_args=XetraRunConfig(run_spill_dir=spill_dir, run_spill_memory_mb=0)
+            ).etl_report1()
+            # Test after method execution
+            self.assertEqual(os.listdir(spill_dir), [])
+        self.assert_report()
+
+    def test_etl_report1_pipeline(self):
+        """
+        Tests the etl_report1 method downloading, parsing
+        and aggregating the source files concurrently
+        """
+        # Method execution
+        self.xetra_etl(
+            run_args=XetraRunConfig(
+                run_pipeline=True, run_download_workers=2, run_parse_workers=2
+            )
+        ).etl_report1()
+        # Test after method execution
+        self.assert_report()
+
+    def test_etl_report1_batched(self):
+        """
+        Tests the etl_report1 method extracting and aggregating
+        the source files in batches under a memory budget
+        """
+        # Test init
+        acquire = InFlightBytes.acquire
+        read_alone = []
+
+        def record_read(in_flight, size):
+            acquire(in_flight, size)
+            read_alone.append(in_flight.in_flight == size)
+
+        # all 8 source files in one batch and one file per batch,
+        # the files of one file batches are also read one at a time
+        for one_file_batches in [False, True]:
+            with self.subTest(one_file_batches=one_file_batches):
+                self.clear_target()
+                read_alone.clear()
+                # Method execution
+                with (
+                    patch.object(AdaptiveBatcher, "batch_bytes", return_value=0)
+                    if one_file_batches
+                    else nullcontext()
+                ), (
+                    patch.object(AdaptiveBatcher, "read_bytes", return_value=0)
+                    if one_file_batches
+                    else nullcontext()
+                ), patch.object(
+                    InFlightBytes, "acquire", autospec=True, side_effect=record_read
+                ), self.assertLogs(
+                    "xetra.common.batching"
+                ) as logs:
+                    self.xetra_etl(
+                        run_args=XetraRunConfig(
+                            run_max_memory_mb=1, run_download_workers=2
+                        )
+                    ).etl_report1()
+                # Test after method execution
+                self.assertEqual(
+                    8 if one_file_batches else 1,
+                    sum("Batch of" in message for message in logs.output),
+                )
+                self.assertEqual(8, len(read_alone))
+                if one_file_batches:
+                    self.assertTrue(all(read_alone))
+                self.assert_report()
+
+    def test_etl_report1_engines(self):
+        """
+        Tests the etl_report1 method with the DuckDB, Polars
+        and arrow engines
+        """
+        for engine in ["duckdb", "polars", "arrow"]:
+            with self.subTest(engine=engine):
+                self.clear_target()
+                # Method execution
+                self.xetra_etl(run_args=XetraRunConfig(run_engine=engine)).etl_report1()
+                # Test after method execution
+                self.assert_report()
+
+    def test_extract_duckdb_engine(self):
+        """
+        Tests the extract method reading
+        Arrow data for the DuckDB engine
+        """
+        # Method execution
+        table_extract = self.xetra_etl(
+            run_args=XetraRunConfig(run_engine="duckdb")
+        ).extract()
+        # Test after method execution
+        self.assertEqual(table_extract.num_rows, 8)
+        self.assertEqual(table_extract.column_names, self.source_config.src_columns)
+
+    def test_etl_report1_manifest_unchanged(self):
+        """
+        Tests the etl_report1 method running twice with
+        a report manifest -> the unchanged report is written once
+        """
+        # Expected results
+        df_exp = self.df_report
+        log_exp = "Xetra target data unchanged"
+        # Method execution
+        for _ in range(2):
+            xetra_etl = self.xetra_etl(manifest_key=self.manifest_key)
+            with self.assertLogs() as logm:
+                xetra_etl.etl_report1()
+        # Test after method execution
+        self.assertTrue(any(log_exp in output for output in logm.output))
+        trg_file = self.assert_report()
+        manifest = ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+        self.assertEqual(len(manifest.reports), 1)
+        self.assertEqual(manifest.reports[0]["key"], trg_file)
+        self.assertEqual(manifest.reports[0]["row_count"], len(df_exp))
+        self.assertEqual(manifest.reports[0]["date_min"], "2021-04-17")
+        self.assertEqual(manifest.reports[0]["isin_max"], df_exp["ISIN"].max())
+        # The meta file is updated by both runs (3 dates each)
+        df_meta = self.s3_bucket_trg.read_csv_to_df(self.meta_key)
+        self.assertEqual(len(df_meta), 6)
+
+    def test_etl_report1_manifest_unchanged_latest(self):
+        """
+        Tests the etl_report1 method reproducing the content of a report
+        that was superseded by another report -> the unchanged report
+        becomes the latest report of the manifest again
+        """
+        # Test init
+        other_key = "report1/xetra_daily_report1_29991231_235959.parquet"
+        self.xetra_etl(manifest_key=self.manifest_key).etl_report1()
+        # a later report with other content
+        manifest = ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+        manifest.add_report(other_key, "other")
+        manifest.write(self.manifest_key, self.s3_bucket_trg)
+        # Method execution
+        self.xetra_etl(manifest_key=self.manifest_key).etl_report1()
+        # Test after method execution
+        trg_file = self.assert_report()
+        manifest = ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+        self.assertEqual(
+            [other_key, trg_file], [report["key"] for report in manifest.reports]
+        )
+
+    def test_etl_report1_lean_dtypes(self):
+        """
+        Tests the etl_report1 method extracting
+        the source data with lean dtypes
+        """
+        # Method execution
+        xetra_etl = self.xetra_etl(run_args=XetraRunConfig(run_lean_dtypes=True))
+        df_extracted = xetra_etl.extract()
+        xetra_etl.etl_report1()
+        # Test after method execution
+        self.assertEqual(df_extracted["Date"].dtype, "int32")
+        self.assertEqual(df_extracted["Time"].dtype, "int16")
+        self.assertEqual(df_extracted["StartPrice"].dtype, "float32")
+        self.assertIsInstance(df_extracted["ISIN"].dtype, pd.CategoricalDtype)
+        self.assert_report()
+
+    def test_etl_report1_compressed(self):
+        """
+        Tests the etl_report1 method reading gzip and zstd compressed
+        source files and writing a gzip compressed csv report
+        """
+        # Test init
+        for position, key in enumerate(
+            sorted(self.s3_bucket_src.list_files_in_prefix(""))
+        ):
+            content = self.s3_bucket_src.read_object(key)
+            self.src_bucket.delete_objects(Delete={"Objects": [{"Key": key}]})
+            if position % 2:
+                self.s3_bucket_src.write_object(compress(content, "zstd"), f"{key}.zst")
+            else:
+                # Compression given by the Content-Encoding only
+                self.src_bucket.put_object(
+                    Body=compress(content, "gzip"), Key=key, ContentEncoding="gzip"
+                )
+        target_config = self.target_config._replace(
+            trg_format="csv", trg_compression="gzip"
+        )
+        for run_args in [
+            XetraRunConfig(),
+            XetraRunConfig(run_pipeline=True),
+            XetraRunConfig(run_engine="arrow"),
+        ]:
+            with self.subTest(run_args=run_args):
+                self.clear_target()
+                # Method execution
+                self.xetra_etl(trg_args=target_config, run_args=run_args).etl_report1()
+                # Test after method execution
+                trg_file = self.assert_report(trg_args=target_config)
+                self.assertTrue(trg_file.endswith(".csv.gz"))
+
+    def test_etl_report1_local_storage(self):
+        """
+        Tests the etl_report1 method with source and target
+        buckets mirrored to the local filesystem
+        """
+        with tempfile.TemporaryDirectory() as local_dir:
+            # Test init
+            local_src = get_storage_connector(self.s3_bucket_name_src, None, local_dir)
+            local_trg = get_storage_connector(self.s3_bucket_name_trg, None, local_dir)
+            for key in self.s3_bucket_src.list_files_in_prefix(""):
+                local_src.write_object(self.s3_bucket_src.read_object(key), key)
+            # Method execution
+            self.xetra_etl(
+                s3_bucket_src=local_src, s3_bucket_trg=local_trg
+            ).etl_report1()
+            # Test after method execution
+            self.assert_report(s3_bucket=local_trg)
+            self.assertEqual(
+                self.extract_date_list[1:],
+                list(local_trg.read_csv_to_df(self.meta_key)["source_date"]),
+            )
+            self.assertEqual([], self.s3_bucket_trg.list_files_in_prefix(""))
+
 
 if __name__ == "__main__":
     unittest.main()
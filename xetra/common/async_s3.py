@@ -0,0 +1,312 @@
+"""
+Module for interacting with S3 buckets using asyncio and aiobotocore.
+
+AsyncS3BucketConnector offers the methods of S3BucketConnector as
+awaitables, so hundreds of requests can be in flight on one event loop
+instead of one per thread. Parsing and serializing run in an executor
+and do not block the event loop.
+
+Usage:
+    async with AsyncS3BucketConnector(bucket='my-bucket') as s3_connector:
+        files = await s3_connector.list_files_in_prefix(prefix='my-prefix/')
+        frames = await s3_connector.read_csvs_to_df(files)
+
+    Passing max_bytes_in_flight and the listed sizes bounds the memory of
+    the files read at the same time:
+    async with AsyncS3BucketConnector(bucket='my-bucket',
+                                      max_bytes_in_flight=2**28) as s3_connector:
+        sizes = await s3_connector.list_file_sizes(prefix='my-prefix/')
+        frames = await s3_connector.read_csvs_to_df(list(sizes), sizes=sizes)
+"""
+
+import os
+import asyncio
+import logging
+from io import BytesIO
+from functools import partial
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor
+
+import pandas as pd
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from dotenv import load_dotenv
+
+from xetra.common.storage import compression_of, pa, serialize_df
+from xetra.common.custom_exceptions import NoSuchKeyException
+
+load_dotenv()
+
+
+def _decompress(content: bytes, compression: str):
+    """
+    decompressing the content of a compressed file
+
+    :param content: compressed bytes
+    :param compression: compression of the file, see S3Compressions
+    """
+    with pa.input_stream(BytesIO(content), compression=compression) as stream:
+        return stream.read()
+
+
+def _parse_csv(content: bytes, compression: str, encoding: str, sep: str):
+    """
+    parsing the content of a csv file, compressed files are
+    decompressed while they are parsed like by S3BucketConnector
+    """
+    with pa.input_stream(BytesIO(content), compression=compression) as stream:
+        return pd.read_csv(stream, sep=sep, encoding=encoding)
+
+
+class AsyncS3BucketConnector:
+    """
+    Class for interacting with S3 buckets from asyncio code,
+    has to be used as async context manager
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str = None,
+        max_concurrency: int = 100,
+        executor: Executor = None,
+        max_bytes_in_flight: int = None,
+    ):
+        """
+        Constructor for AsyncS3BucketConnector
+
+        :param bucket: name of the S3 bucket
+        :param endpoint_url: URL of the S3 endpoint
+        :param max_concurrency: maximum number of requests in flight
+        :param executor: executor for parsing and serializing,
+          the default executor of the event loop if None
+        :param max_bytes_in_flight: maximum bytes of the files that are
+          read and parsed at the same time (by the sizes passed to the
+          read methods), a larger file is only read alone, no limit if None
+        """
+        self._logger = logging.getLogger(__name__)
+        self.endpoint_url = endpoint_url
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self.max_bytes_in_flight = max_bytes_in_flight
+        self._bytes_in_flight = 0
+        self._bytes_condition = None
+        self._session = get_session()
+        self._client_context = None
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._client_context = self._session.create_client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            aws_access_key_id=os.getenv("aws_access_key_id"),
+            aws_secret_access_key=os.getenv("aws_secret_access_key"),
+            config=AioConfig(max_pool_connections=self.max_concurrency),
+        )
+        self._client = await self._client_context.__aenter__()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._bytes_condition = asyncio.Condition()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._client_context.__aexit__(exc_type, exc_value, traceback)
+        self._client = None
+        self._client_context = None
+
+    async def _run_in_executor(self, function, *args, **kwargs):
+        """
+        Running a blocking function (parsing, serializing) in the executor
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
+
+    @asynccontextmanager
+    async def _reserve_bytes(self, size: int):
+        """
+        Context manager waiting until a file of the given size may be read
+        under max_bytes_in_flight
+
+        :param size: size of the file in bytes, not limited if None
+        """
+        if self.max_bytes_in_flight is None or size is None:
+            yield
+            return
+        async with self._bytes_condition:
+            await self._bytes_condition.wait_for(
+                lambda: self._bytes_in_flight == 0
+                or self._bytes_in_flight + size <= self.max_bytes_in_flight
+            )
+            self._bytes_in_flight += size
+        try:
+            yield
+        finally:
+            async with self._bytes_condition:
+                self._bytes_in_flight -= size
+                self._bytes_condition.notify_all()
+
+    async def list_files_in_prefix(self, prefix: str):
+        """
+        listing the files in the S3 bucket with a given prefix
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          files: list of file names in the bucket with the given prefix
+        """
+        return list(await self.list_file_sizes(prefix))
+
+    async def list_file_sizes(self, prefix: str):
+        """
+        listing the files in the S3 bucket with a given prefix and their
+        sizes, e.g. for max_bytes_in_flight
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          sizes: dict of file name -> size in bytes
+        """
+        paginator = self._client.get_paginator("list_objects_v2")
+        sizes = {}
+        async for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            sizes.update((obj["Key"], obj["Size"]) for obj in page.get("Contents", []))
+        return sizes
+
+    async def _get_body(self, key: str):
+        """
+        reading the content of a file from the S3 bucket and its compression
+
+        :param key: key of the file that should be read
+
+        returns:
+          content: bytes with the (compressed) content of the file
+          compression: compression of the file, None if not compressed
+        """
+        async with self._semaphore:
+            self._logger.info(
+                "Reading file %s/%s/%s", self.endpoint_url, self.bucket, key
+            )
+            try:
+                response = await self._client.get_object(Bucket=self.bucket, Key=key)
+            except self._client.exceptions.NoSuchKey as error:
+                raise NoSuchKeyException(key) from error
+            async with response["Body"] as stream:
+                content = await stream.read()
+        return content, compression_of(key, response.get("ContentEncoding"))
+
+    async def read_object(self, key: str, decompress: bool = False, size: int = None):
+        """
+        reading the content of a file from the S3 bucket
+
+        :param key: key of the file that should be read
+        :param decompress: decompress the content of compressed files
+        :param size: listed size of the file for max_bytes_in_flight
+
+        returns:
+          content: bytes with the content of the file
+        """
+        async with self._reserve_bytes(size):
+            content, compression = await self._get_body(key)
+            if decompress and compression:
+                return await self._run_in_executor(_decompress, content, compression)
+            return content
+
+    async def read_objects(self, keys: list, sizes: dict = None):
+        """
+        reading the contents of files concurrently
+
+        :param keys: keys of the files that should be read
+        :param sizes: dict of file key -> listed size in bytes
+          for max_bytes_in_flight
+
+        returns:
+          contents: list of bytes in the order of the keys
+        """
+        sizes = sizes or {}
+        return await asyncio.gather(
+            *(self.read_object(key, size=sizes.get(key)) for key in keys)
+        )
+
+    async def read_csv_to_df(
+        self, key: str, encoding: str = "utf-8", sep: str = ",", size: int = None
+    ):
+        """
+        reading a csv file from the S3 bucket and returning a dataframe,
+        the file is parsed in the executor
+
+        :param key: key of the file that should be read
+        :encoding: encoding of the data inside the csv file
+        :sep: seperator of the csv file
+        :param size: listed size of the file for max_bytes_in_flight
+
+        returns:
+          data_frame: Pandas DataFrame containing the data of the csv file
+        """
+        async with self._reserve_bytes(size):
+            content, compression = await self._get_body(key)
+            return await self._run_in_executor(
+                _parse_csv, content, compression, encoding, sep
+            )
+
+    async def read_csvs_to_df(
+        self, keys: list, encoding: str = "utf-8", sep: str = ",", sizes: dict = None
+    ):
+        """
+        reading csv files concurrently, files are parsed while others are
+        still downloaded
+
+        :param keys: keys of the files that should be read
+        :encoding: encoding of the data inside the csv files
+        :sep: seperator of the csv files
+        :param sizes: dict of file key -> listed size in bytes
+          for max_bytes_in_flight
+
+        returns:
+          data_frames: list of Pandas DataFrames in the order of the keys
+        """
+        sizes = sizes or {}
+        return await asyncio.gather(
+            *(self.read_csv_to_df(key, encoding, sep, sizes.get(key)) for key in keys)
+        )
+
+    async def write_object(self, content: bytes, key: str):
+        """
+        writing the content of a file to S3
+
+        :content: bytes that should be written
+        :key: target key of the saved file
+        """
+        async with self._semaphore:
+            self._logger.info(
+                "Writing file to %s/%s/%s", self.endpoint_url, self.bucket, key
+            )
+            await self._client.put_object(Bucket=self.bucket, Key=key, Body=content)
+        return True
+
+    async def write_df_to_s3(
+        self,
+        data_frame: pd.DataFrame,
+        key: str,
+        file_format: str,
+        compression: str = None,
+    ):
+        """
+        writing a Pandas DataFrame to S3, the DataFrame is serialized
+        in the executor
+        supported formats: .csv, .parquet
+
+        :data_frame: Pandas DataFrame that should be written
+        :key: target key of the saved file
+        :file_format: format of the saved file
+        :compression: compression of the saved file, see S3Compressions
+        """
+        if data_frame.empty:
+            self._logger.info("The dataframe is empty! No file will be written!")
+            return None
+        content = await self._run_in_executor(
+            serialize_df, data_frame, file_format, compression
+        )
+        return await self.write_object(content, key)
@@ -0,0 +1,173 @@
+"""
+Methods for sizing batches of source files under a memory budget
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+
+class AdaptiveBatcher:
+    """
+    class for splitting files into batches whose parsed DataFrames fit
+    into a memory budget
+
+    The batch size follows the expansion ratio (DataFrame bytes per file
+    byte) observed while the files are parsed: batches shrink when the
+    files expand more than expected and grow when they expand less.
+    """
+
+    def __init__(
+        self,
+        memory_budget_mb: int,
+        expansion: float = 2.0,
+        overhead: float = 2.0,
+    ):
+        """
+        Constructor for AdaptiveBatcher
+
+        :param memory_budget_mb: memory for the parsed files of one batch
+          and the data kept between batches
+        :param expansion: expected DataFrame bytes per file byte until the
+          first files are observed
+        :param overhead: memory needed per DataFrame byte while a batch is
+          processed (e.g. 2.0 for concatenating the DataFrames)
+        """
+        self._logger = logging.getLogger(__name__)
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.expansion = expansion
+        self.overhead = overhead
+        self.held_bytes = 0
+        self._observed = []
+
+    def observe(self, file_bytes: int, frame_bytes: int):
+        """
+        Recording the size of a file and of its parsed DataFrame
+
+        :param file_bytes: size of the file
+        :param frame_bytes: memory usage of the parsed DataFrame
+        """
+        if file_bytes > 0:
+            self._observed.append(frame_bytes / file_bytes)
+
+    def hold(self, frame_bytes: int):
+        """
+        Recording memory that is kept until the end of the run
+        (e.g. aggregates of the batches), it reduces the following batches
+
+        :param frame_bytes: memory usage of the kept DataFrame
+        """
+        self.held_bytes += frame_bytes
+
+    def batch_bytes(self):
+        """
+        returns:
+          bytes: file bytes that fit into the next batch
+        """
+        if self._observed:
+            # the largest ratio of the last batch, so batches only
+            # grow back when the files of a whole batch expand less
+            self.expansion = max(self._observed)
+            self._observed = []
+        available = self.memory_budget - self.held_bytes
+        return max(0, int(available / (self.expansion * self.overhead)))
+
+    def read_bytes(self):
+        """
+        returns:
+          bytes: file bytes that may be read at the same time, a file is
+            held as raw content and as parsed DataFrame while it is read
+        """
+        available = self.memory_budget - self.held_bytes
+        return max(0, int(available / (1 + self.expansion)))
+
+    def batches(self, files: dict):
+        """
+        Splitting files into consecutive batches, the size of every batch
+        is determined when it is requested, so observations of the files
+        of one batch resize the next batch
+
+        :param files: dict of file key -> size in bytes in processing order
+
+        returns:
+          batches: generator of lists of file keys (at least one file each)
+        """
+        keys = list(files)
+        start = 0
+        while start < len(keys):
+            limit = self.batch_bytes()
+            end = start + 1
+            size = files[keys[start]]
+            while end < len(keys) and size + files[keys[end]] <= limit:
+                size += files[keys[end]]
+                end += 1
+            if size > limit:
+                self._logger.warning(
+                    "File %s (%s bytes) exceeds the memory budget of a batch "
+                    "(%s bytes)",
+                    keys[start],
+                    files[keys[start]],
+                    limit,
+                )
+            self._logger.info(
+                "Batch of %s files (%s bytes, expansion %.2f)",
+                end - start,
+                size,
+                self.expansion,
+            )
+            yield keys[start:end]
+            start = end
+
+
+class InFlightBytes:
+    """
+    class for limiting the bytes of the files that are read at the same
+    time by several threads, a file larger than the limit is only read
+    when no other file is read
+    """
+
+    def __init__(self, limit: int):
+        """
+        Constructor for InFlightBytes
+
+        :param limit: bytes that may be read at the same time,
+          can be changed while files are read
+        """
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int):
+        """
+        Waiting until a file of the given size may be read
+
+        :param size: size of the file in bytes
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.in_flight == 0 or self.in_flight + size <= self.limit
+            )
+            self.in_flight += size
+
+    def release(self, size: int):
+        """
+        Recording that a file of the given size was read
+
+        :param size: size of the file in bytes
+        """
+        with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, size: int):
+        """
+        Context manager reading a file of the given size
+
+        :param size: size of the file in bytes
+        """
+        self.acquire(size)
+        try:
+            yield
+        finally:
+            self.release(size)
@@ -14,6 +14,15 @@ class S3FileTypes(Enum):
     PARQUET = "parquet"
 
 
+class S3Compressions(Enum):
+    """
+    supported compressions of S3 objects
+    """
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
 class MetaProcessFormat(Enum):
     """
     formation for MetaProcess class
@@ -24,3 +33,68 @@ class MetaProcessFormat(Enum):
     META_SOURCE_DATE_COL = "source_date"
     META_PROCESS_COL = "datetime_of_processing"
     META_FILE_FORMAT = "csv"
+
+
+class IsinDictionaryFormat(Enum):
+    """
+    formation for IsinDictionary class
+    """
+
+    ISIN_DICT_ISIN_COL = "isin"
+    ISIN_DICT_CODE_COL = "code"
+    ISIN_DICT_FILE_FORMAT = "csv"
+
+
+class ReportManifestFormat(Enum):
+    """
+    formation for ReportManifest class
+    """
+
+    MANIFEST_REPORTS = "reports"
+    MANIFEST_KEY = "key"
+    MANIFEST_CONTENT_HASH = "content_hash"
+    MANIFEST_CREATED = "created"
+    MANIFEST_SIZE = "size_bytes"
+    MANIFEST_ROW_COUNT = "row_count"
+    MANIFEST_DATE_MIN = "date_min"
+    MANIFEST_DATE_MAX = "date_max"
+    MANIFEST_ISIN_MIN = "isin_min"
+    MANIFEST_ISIN_MAX = "isin_max"
+    MANIFEST_SCHEMA_VERSION = "schema_version"
+    MANIFEST_CREATED_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class TransformEngines(Enum):
+    """
+    supported transform engines for XetraETL
+    """
+
+    PANDAS = "pandas"
+    DUCKDB = "duckdb"
+    POLARS = "polars"
+    ARROW = "arrow"
+
+
+class SourceFormats(Enum):
+    """
+    in-memory formats of the extracted source data
+    """
+
+    PANDAS = "pandas"
+    ARROW = "arrow"
+    CSV = "csv"
+
+
+class ValidationReasons(Enum):
+    """
+    reason codes of source rows rejected by the validation, in the order
+    the rules are checked (a rejected row gets the first failing rule)
+    """
+
+    MISSING_VALUE = "missing_value"
+    MALFORMED_ISIN = "malformed_isin"
+    NEGATIVE_PRICE = "negative_price"
+    MIN_ABOVE_MAX = "min_above_max"
+    PRICE_OUT_OF_RANGE = "price_out_of_range"
+    NEGATIVE_VOLUME = "negative_volume"
+    DUPLICATE_ROW = "duplicate_row"
@@ -17,3 +17,21 @@ class WrongMetaFileException(Exception):
     Exception that can be raised when the meta file
     format is not correct.
     """
+
+
+class WrongEngineException(Exception):
+    """
+    WrongEngineException class
+
+    Exception that can be raised when the transform engine
+    given as parameter is not supported.
+    """
+
+
+class NoSuchKeyException(Exception):
+    """
+    NoSuchKeyException class
+
+    Exception that is raised by the storage connectors when
+    the file that should be read does not exist.
+    """
@@ -0,0 +1,104 @@
+"""
+Methods for the persistent ISIN dictionary
+"""
+
+import numpy as np
+import pandas as pd
+
+from xetra.common.storage import StorageConnector
+from xetra.common.constants import IsinDictionaryFormat
+from xetra.common.custom_exceptions import NoSuchKeyException, WrongMetaFileException
+
+
+class IsinDictionary:
+    """
+    class for encoding ISIN strings as int32 codes
+
+    The codes are stable across runs: the dictionary is stored next to
+    the meta file and new ISINs are appended with the next free code.
+    """
+
+    def __init__(self, isins: list = None):
+        """
+        Constructor for IsinDictionary
+
+        :param isins: known ISINs, the position in the list is the code
+        """
+        self._index = pd.Index(isins if isins is not None else [], dtype=object)
+        self.is_modified = False
+
+    def __len__(self):
+        return len(self._index)
+
+    def encode(self, isins):
+        """
+        Mapping ISINs to their codes, unknown ISINs are added to the dictionary
+
+        :param isins: array-like of ISIN strings
+
+        returns:
+          codes: numpy int32 array with the code of every ISIN
+        """
+        values = np.asarray(isins, dtype=object)
+        codes = self._index.get_indexer(values)
+        missing = codes < 0
+        if missing.any():
+            self._index = self._index.append(
+                pd.Index(pd.unique(values[missing]), dtype=object)
+            )
+            codes[missing] = self._index.get_indexer(values[missing])
+            self.is_modified = True
+        return codes.astype(np.int32)
+
+    def decode(self, codes):
+        """
+        Mapping codes back to ISIN strings
+
+        :param codes: array-like of ISIN codes
+
+        returns:
+          isins: numpy object array with the ISIN of every code
+        """
+        return self._index.to_numpy()[np.asarray(codes)]
+
+    @staticmethod
+    def read(dict_key: str, s3_bucket_meta: StorageConnector):
+        """
+        Reading the ISIN dictionary from the S3 bucket
+
+        :param: dict_key -> key of the ISIN dictionary file on the S3 bucket
+        :param: s3_bucket_meta -> StorageConnector for the bucket with the meta file
+
+        returns:
+          isin_dict: IsinDictionary, empty if no dictionary file exists
+        """
+        try:
+            df_dict = s3_bucket_meta.read_csv_to_df(dict_key)
+        except NoSuchKeyException:
+            # No dictionary file exists -> starting with an empty dictionary
+            return IsinDictionary()
+        codes = df_dict[IsinDictionaryFormat.ISIN_DICT_CODE_COL.value]
+        if not np.array_equal(codes.to_numpy(), np.arange(len(df_dict))):
+            raise WrongMetaFileException
+        return IsinDictionary(
+            list(df_dict[IsinDictionaryFormat.ISIN_DICT_ISIN_COL.value])
+        )
+
+    def write(self, dict_key: str, s3_bucket_meta: StorageConnector):
+        """
+        Writing the ISIN dictionary to the S3 bucket
+
+        :param: dict_key -> key of the ISIN dictionary file on the S3 bucket
+        :param: s3_bucket_meta -> StorageConnector for the bucket with the meta file
+        """
+        df_dict = pd.DataFrame(
+            {
+                IsinDictionaryFormat.ISIN_DICT_ISIN_COL.value: self._index.to_numpy(),
+                IsinDictionaryFormat.ISIN_DICT_CODE_COL.value: np.arange(len(self)),
+            }
+        )
+        s3_bucket_meta.write_df_to_s3(
+            df_dict, dict_key, IsinDictionaryFormat.ISIN_DICT_FILE_FORMAT.value
+        )
+        self.is_modified = False
+        return True
@@ -0,0 +1,33 @@
+"""
+Deferred imports of heavy modules
+
+Modules on the startup path of run.py (connectors, meta file) refer to
+pandas and pyarrow through LazyModule, so a run that exits early (nothing
+to process) never imports them.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    class for a module that is imported on the first attribute access
+
+    Annotations using a LazyModule (e.g. pd.DataFrame) are only evaluated
+    lazily with `from __future__ import annotations`.
+    """
+
+    def __init__(self, name: str):
+        """
+        Constructor for LazyModule
+
+        :param name: full name of the module, e.g. "pyarrow.parquet"
+        """
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str):
+        if self._module is None:
+            # import_module is thread-safe and returns the same module object
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
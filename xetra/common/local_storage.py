@@ -0,0 +1,202 @@
+"""
+Module for reading and writing buckets mirrored to the local filesystem
+
+The files of a bucket are stored as <root_dir>/<bucket>/<key> (the layout
+of `aws s3 sync s3://<bucket> <root_dir>/<bucket>`). Files are read through
+memory maps, so csv and parquet files are parsed from the page cache
+without copying them into Python objects first.
+
+Usage:
+    connector = LocalStorageConnector(root_dir='/mnt/nvme/xetra', bucket='my-bucket')
+    files = connector.list_files_in_prefix(prefix='my-prefix/')
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+
+from xetra.common.storage import StorageConnector, compression_of, pa
+from xetra.common.custom_exceptions import NoSuchKeyException
+
+
+class LocalStorageConnector(StorageConnector):
+    """
+    Class for interacting with a bucket mirrored to a local directory
+    """
+
+    def __init__(self, root_dir: str, bucket: str):
+        """
+        Constructor for LocalStorageConnector
+
+        :param root_dir: directory with the local copies of the buckets
+        :param bucket: name of the bucket (subdirectory of root_dir)
+        """
+        self._logger = logging.getLogger(__name__)
+        self.root_dir = root_dir
+        self.bucket = bucket
+        self.bucket_dir = os.path.join(root_dir, bucket)
+
+    def location(self, key: str):
+        return self._path(key)
+
+    def _path(self, key: str):
+        """
+        Path of the file of a key
+        """
+        return os.path.join(self.bucket_dir, *key.split("/"))
+
+    def _memory_map(self, key: str):
+        """
+        Memory-mapping the file of a key
+        """
+        try:
+            return pa.memory_map(self._path(key))
+        except FileNotFoundError as error:
+            raise NoSuchKeyException(key) from error
+
+    def list_files_in_prefix(self, prefix: str):
+        """
+        listing the files with a given prefix (like S3 the prefix does not
+        have to end at a directory)
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          files: sorted list of file keys with the given prefix
+        """
+        return list(self.list_file_sizes(prefix))
+
+    def list_file_sizes(self, prefix: str):
+        """
+        listing the files with a given prefix and their sizes
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          sizes: dict of file key -> size in bytes, sorted by key
+        """
+        # Only the directory of the prefix has to be walked
+        prefix_dir = prefix.rsplit("/", 1)[0] if "/" in prefix else ""
+        start_dir = os.path.join(self.bucket_dir, *prefix_dir.split("/"))
+        sizes = {}
+        for directory, _, names in os.walk(start_dir):
+            relative_dir = os.path.relpath(directory, self.bucket_dir)
+            for name in names:
+                if name.startswith(".xetra-tmp-"):
+                    continue
+                key = (
+                    name
+                    if relative_dir == os.curdir
+                    else "/".join(relative_dir.split(os.sep) + [name])
+                )
+                if key.startswith(prefix):
+                    sizes[key] = os.path.getsize(os.path.join(directory, name))
+        return dict(sorted(sizes.items()))
+
+    def list_file_info(self, prefix: str):
+        """
+        listing the files with a given prefix and their sizes, the
+        fingerprints are None as the files would have to be read for them
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          info: dict of file key -> (size in bytes, None), sorted by key
+        """
+        return {key: (size, None) for key, size in self.list_file_sizes(prefix).items()}
+
+    def file_etag(self, key: str):
+        """
+        MD5 of the content of a file like the ETag of S3 objects (the file
+        is read for this)
+
+        :param key: key of the file
+
+        returns:
+          etag: hex MD5 of the content
+        """
+        md5 = hashlib.md5()
+        try:
+            with open(self._path(key), "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    md5.update(chunk)
+        except FileNotFoundError as error:
+            raise NoSuchKeyException(key) from error
+        return md5.hexdigest()
+
+    def read_object(self, key: str, decompress: bool = False):
+        """
+        reading the content of a file
+
+        :param key: key of the file that should be read
+        :param decompress: decompress the content of compressed files
+
+        returns:
+          content: bytes with the content of the file
+        """
+        if decompress and compression_of(key):
+            return super().read_object(key, decompress)
+        # A plain read copies the file once like a memory map and
+        # does not need pyarrow (e.g. for the meta file at startup)
+        self._logger.info("Reading file %s", self.location(key))
+        try:
+            with open(self._path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError as error:
+            raise NoSuchKeyException(key) from error
+
+    def _get_body(self, key: str):
+        return self._memory_map(key), compression_of(key)
+
+    def _read_buffer(self, key: str):
+        # Zero-copy buffer over the memory map
+        return self._memory_map(key).read_buffer()
+
+    def open_object(self, key: str, **kwargs):
+        """
+        opening a file as seekable memory-mapped file
+
+        :param key: key of the file that should be read
+
+        returns:
+          file: pyarrow MemoryMappedFile of the file
+        """
+        self._logger.info("Opening file %s", self.location(key))
+        return self._memory_map(key)
+
+    def write_object(self, content: bytes, key: str):
+        """
+        writing the content of a file, the file is replaced atomically
+
+        :content: bytes that should be written
+        :key: target key of the saved file
+        """
+        path = self._path(key)
+        self._logger.info("Writing file to %s", path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, tmp_path = tempfile.mkstemp(
+            prefix=".xetra-tmp-", dir=os.path.dirname(path)
+        )
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return True
+
+    def delete_objects(self, keys: list):
+        """
+        deleting files, missing files are ignored like on S3
+
+        :keys: keys of the files that should be deleted
+        """
+        self._logger.info("Deleting %s files from %s", len(keys), self.bucket_dir)
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+        return True
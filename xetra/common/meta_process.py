@@ -2,14 +2,14 @@
 Methods for processing the meta file
 """
 
+import csv
 import collections
+from io import StringIO
 from datetime import datetime, timedelta
 
-import pandas as pd
-
-from xetra.common.s3 import S3BucketConnector
+from xetra.common.storage import StorageConnector, pd
 from xetra.common.constants import MetaProcessFormat
-from xetra.common.custom_exceptions import WrongMetaFileException
+from xetra.common.custom_exceptions import NoSuchKeyException, WrongMetaFileException
 
 
 class MetaProcess:
@@ -19,14 +19,14 @@ class MetaProcess:
 
     @staticmethod
     def update_meta_file(
-        extract_date_list: list, meta_key: str, s3_bucket_meta: S3BucketConnector
+        extract_date_list: list, meta_key: str, s3_bucket_meta: StorageConnector
     ):
         """
         Updating the meta file with the processed Xetra dates and today's date as processed date
 
         :param: extract_date_list -> a list of dates that are extracted from the source
         :param: meta_key -> key of the meta file on the S3 bucket
-        :param: s3_bucket_meta -> S3BucketConnector for the bucket with the meta file
+        :param: s3_bucket_meta -> StorageConnector for the bucket with the meta file
         """
         # Creating an empty DataFrame using the meta file column names
         df_new = pd.DataFrame(
@@ -49,7 +49,7 @@ class MetaProcess:
             ):
                 raise WrongMetaFileException
             df_all = pd.concat([df_old, df_new])
-        except s3_bucket_meta.session.client("s3").exceptions.NoSuchKey:
+        except NoSuchKeyException:
             # No meta file exists -> only the new data is used
             df_all = df_new
         # Writing to S3
@@ -58,9 +58,23 @@ class MetaProcess:
         )
         return True
 
+    @staticmethod
+    def _read_source_dates(meta_key: str, s3_bucket_meta: StorageConnector):
+        """
+        Reading the set of source dates in the meta file
+        """
+        content = s3_bucket_meta.read_object(meta_key, decompress=True)
+        return {
+            datetime.fromisoformat(
+                row[MetaProcessFormat.META_SOURCE_DATE_COL.value]
+            ).date()
+            for row in csv.DictReader(StringIO(content.decode("utf-8")))
+            if row[MetaProcessFormat.META_SOURCE_DATE_COL.value]
+        }
+
     @staticmethod
     def return_date_list(
-        first_date: str, meta_key: str, s3_bucket_meta: S3BucketConnector
+        first_date: str, meta_key: str, s3_bucket_meta: StorageConnector
     ):
         """
         Creating a list of dates based on the input first_date and the already
@@ -68,7 +82,7 @@ class MetaProcess:
 
         :param: first_date -> the earliest date Xetra data should be processed
         :param: meta_key -> key of the meta file on the S3 bucket
-        :param: s3_bucket_meta -> S3BucketConnector for the bucket with the meta file
+        :param: s3_bucket_meta -> StorageConnector for the bucket with the meta file
 
         returns:
           min_date: first date that should be processed
@@ -80,18 +94,13 @@ class MetaProcess:
         today = datetime.today().date()
         try:
             # If meta file exists create return_date_list using the content of the meta file
-            # Reading meta file
-            df_meta = s3_bucket_meta.read_csv_to_df(meta_key)
+            # Reading the processed dates of the meta file (without pandas,
+            # so a run with nothing to process starts fast)
+            src_dates = MetaProcess._read_source_dates(meta_key, s3_bucket_meta)
             # Creating a list of dates from first_date until today
             dates = [
                 start + timedelta(days=x) for x in range(0, (today - start).days + 1)
             ]
-            # Creating set of all dates in meta file
-            src_dates = set(
-                pd.to_datetime(
-                    df_meta[MetaProcessFormat.META_SOURCE_DATE_COL.value]
-                ).dt.date
-            )
             dates_missing = set(dates[1:]) - src_dates
             if dates_missing:
                 # Determining the earliest date that should be extracted
@@ -113,7 +122,7 @@ class MetaProcess:
                     .date()
                     .strftime(MetaProcessFormat.META_DATE_FORMAT.value)
                 )
-        except s3_bucket_meta._s3.meta.client.exceptions.NoSuchKey:
+        except NoSuchKeyException:
             # No meta file found -> creating a date list from first_date - 1 day until today
             return_min_date = first_date
             return_dates = [
@@ -0,0 +1,153 @@
+"""
+Methods for running items through concurrent pipeline stages
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Callable, NamedTuple
+
+# marks the end of the items in a stage queue
+_END = object()
+
+
+class PipelineStage(NamedTuple):
+    """
+    Class for the configuration of one pipeline stage
+
+    name: name of the stage used for logging
+    function: function applied to every item
+    workers: number of threads running the function
+    queue_size: maximum number of items waiting for the stage (backpressure)
+    ordered: the function is applied in the order of the input items (with
+      one worker), items arriving early wait in memory for their turn
+    """
+
+    name: str
+    function: Callable
+    workers: int = 1
+    queue_size: int = 4
+    ordered: bool = False
+
+
+def _put(target: queue.Queue, item, stop: threading.Event):
+    """
+    Putting an item into a bounded queue unless the pipeline is stopped
+    """
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: queue.Queue, stop: threading.Event):
+    """
+    Getting an item from a queue, _END if the pipeline is stopped
+    """
+    while not stop.is_set():
+        try:
+            return source.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _END
+
+
+def run_pipeline(items: list, stages: list):
+    """
+    Runs every item through the stages, all stages work concurrently and
+    every stage takes items from a bounded queue, so a slow stage slows
+    down the stages before it instead of letting items pile up in memory
+
+    :param items: list of input items of the first stage
+    :param stages: list of PipelineStage, the output of a stage is the
+      input of the next stage
+
+    returns:
+      results: outputs of the last stage in the order of the input items
+    """
+    logger = logging.getLogger(__name__)
+    stop = threading.Event()
+    errors = []
+    queues = [queue.Queue(maxsize=stage.queue_size) for stage in stages]
+    queues.append(queue.Queue())
+    busy = [0.0] * len(stages)
+    lock = threading.Lock()
+    workers = [1 if stage.ordered else stage.workers for stage in stages]
+    running = list(workers)
+
+    def feed():
+        for item in enumerate(items):
+            if not _put(queues[0], item, stop):
+                return
+        for _ in range(workers[0]):
+            _put(queues[0], _END, stop)
+
+    def work(position: int, stage: PipelineStage):
+        waiting = {}
+        next_index = 0
+        try:
+            while True:
+                item = _get(queues[position], stop)
+                if item is _END:
+                    break
+                if stage.ordered:
+                    waiting[item[0]] = item[1]
+                    ready = []
+                    while next_index in waiting:
+                        ready.append((next_index, waiting.pop(next_index)))
+                        next_index += 1
+                else:
+                    ready = [item]
+                for index, value in ready:
+                    start = time.perf_counter()
+                    result = stage.function(value)
+                    with lock:
+                        busy[position] += time.perf_counter() - start
+                    if not _put(queues[position + 1], (index, result), stop):
+                        return
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+            stop.set()
+        finally:
+            with lock:
+                running[position] -= 1
+                last_worker = running[position] == 0
+            # The last worker of a stage ends the next stage
+            if last_worker:
+                next_workers = (
+                    workers[position + 1] if position + 1 < len(stages) else 1
+                )
+                for _ in range(next_workers):
+                    _put(queues[position + 1], _END, stop)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    for position, stage in enumerate(stages):
+        threads.extend(
+            threading.Thread(target=work, args=(position, stage), daemon=True)
+            for _ in range(workers[position])
+        )
+    for thread in threads:
+        thread.start()
+    results = {}
+    while True:
+        item = _get(queues[-1], stop)
+        if item is _END:
+            break
+        results[item[0]] = item[1]
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    for stage, stage_workers, seconds in zip(stages, workers, busy):
+        logger.info(
+            "Pipeline stage %s: %s workers, %.2f s busy",
+            stage.name,
+            stage_workers,
+            seconds,
+        )
+    return [results[index] for index in range(len(items))]
@@ -0,0 +1,85 @@
+"""
+Methods for profiling the stages of a job
+"""
+
+import os
+import time
+import cProfile
+import logging
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StageProfiler:
+    """
+    class for profiling stages of a job with cProfile and tracemalloc
+
+    Every stage writes <number>_<stage>.prof (open with pstats or
+    snakeviz) and <number>_<stage>_memory.txt with the duration, the peak
+    of traced memory and the top allocation sites of the stage. cProfile
+    only profiles the thread running the stage, tracemalloc traces all
+    threads.
+    """
+
+    def __init__(self, profile_dir: str, top_n: int = 20, frames: int = 1):
+        """
+        Constructor for StageProfiler
+
+        :param profile_dir: local directory the profile files are written to
+        :param top_n: number of allocation sites written per stage
+        :param frames: frames stored per allocation (more frames show the
+          callers of the allocation site but slow the stage down more)
+        """
+        self._logger = logging.getLogger(__name__)
+        os.makedirs(profile_dir, exist_ok=True)
+        self.profile_dir = profile_dir
+        self.top_n = top_n
+        self.frames = frames
+        self._stages = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Profiling the code run inside the with block as stage
+
+        :param name: name of the stage used for the file names
+        """
+        self._stages += 1
+        path = os.path.join(self.profile_dir, f"{self._stages:02d}_{name}")
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self.frames)
+        tracemalloc.reset_peak()
+        snapshot_before = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            statistics = tracemalloc.take_snapshot().compare_to(
+                snapshot_before, "traceback" if self.frames > 1 else "lineno"
+            )
+            if started_tracing:
+                tracemalloc.stop()
+            profile.dump_stats(f"{path}.prof")
+            with open(f"{path}_memory.txt", "w", encoding="utf-8") as file:
+                file.write(f"stage: {name}\n")
+                file.write(f"duration: {duration:.3f} s\n")
+                file.write(f"peak traced memory: {peak / 1024 / 1024:.1f} MB\n")
+                file.write(f"top {self.top_n} allocation sites (size change):\n")
+                for statistic in statistics[: self.top_n]:
+                    file.write(f"{statistic}\n")
+                    if self.frames > 1:
+                        for line in statistic.traceback.format():
+                            file.write(f"    {line}\n")
+            self._logger.info(
+                "Stage %s took %.3f s, peak traced memory %.1f MB, profile %s.prof",
+                name,
+                duration,
+                peak / 1024 / 1024,
+                path,
+            )
@@ -0,0 +1,204 @@
+"""
+Methods for the report manifest
+"""
+
+import json
+import hashlib
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from xetra.common.storage import StorageConnector
+from xetra.common.constants import ReportManifestFormat
+from xetra.common.custom_exceptions import NoSuchKeyException
+
+
+def _to_json(value):
+    """
+    Converting a NumPy/pandas scalar to a JSON serializable value
+    """
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+class ReportManifest:
+    """
+    class for the manifest listing the reports written to the target bucket
+
+    Every report is stored with the content hash of its file, so a report
+    with the same content as an already written report can be skipped, and
+    with statistics (date and ISIN range, row count, size, schema version)
+    so consumers can select report files with a single GET of the manifest.
+    """
+
+    def __init__(self, reports: list = None):
+        """
+        Constructor for ReportManifest
+
+        :param reports: list of report entries (dicts) in the order of writing
+        """
+        self.reports = reports if reports is not None else []
+
+    @staticmethod
+    def content_hash(content: bytes):
+        """
+        Hashing the content of a report file
+
+        :param content: bytes with the content of the file
+
+        returns:
+          content_hash: SHA-256 hex digest of the content
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def schema_version(columns: list):
+        """
+        Fingerprint of the report columns, changes when the report layout changes
+
+        :param columns: column names of the report
+
+        returns:
+          schema_version: first 12 hex digits of the SHA-256 of the column names
+        """
+        return hashlib.sha256("\n".join(columns).encode()).hexdigest()[:12]
+
+    @staticmethod
+    def report_stats(data_frame, date_col: str, isin_col: str):
+        """
+        Calculating the manifest statistics of a report
+
+        :param data_frame: report as Pandas DataFrame or pyarrow Table
+        :param date_col: column name of the date
+        :param isin_col: column name of the ISIN
+
+        returns:
+          stats: dict with row count, date range, ISIN range and schema version
+        """
+        if isinstance(data_frame, pa.Table):
+            columns = data_frame.column_names
+            dates = pc.min_max(data_frame[date_col]).as_py()
+            isins = pc.min_max(data_frame[isin_col]).as_py()
+            date_min, date_max = dates["min"], dates["max"]
+            isin_min, isin_max = isins["min"], isins["max"]
+        else:
+            columns = list(data_frame.columns)
+            date_min, date_max = data_frame[date_col].min(), data_frame[date_col].max()
+            isin_min, isin_max = data_frame[isin_col].min(), data_frame[isin_col].max()
+        return {
+            ReportManifestFormat.MANIFEST_ROW_COUNT.value: len(data_frame),
+            ReportManifestFormat.MANIFEST_DATE_MIN.value: _to_json(date_min),
+            ReportManifestFormat.MANIFEST_DATE_MAX.value: _to_json(date_max),
+            ReportManifestFormat.MANIFEST_ISIN_MIN.value: _to_json(isin_min),
+            ReportManifestFormat.MANIFEST_ISIN_MAX.value: _to_json(isin_max),
+            ReportManifestFormat.MANIFEST_SCHEMA_VERSION.value: (
+                ReportManifest.schema_version(columns)
+            ),
+        }
+
+    def find(self, content_hash: str):
+        """
+        Searching the report with the given content hash
+
+        :param content_hash: content hash of a report file
+
+        returns:
+          report: report entry (dict), None if no report has the content hash
+        """
+        for report in self.reports:
+            if report[ReportManifestFormat.MANIFEST_CONTENT_HASH.value] == content_hash:
+                return report
+        return None
+
+    def add_report(
+        self, key: str, content_hash: str, size: int = None, stats: dict = None
+    ):
+        """
+        Adding a written report to the manifest
+
+        :param key: key of the report file on the S3 bucket
+        :param content_hash: content hash of the report file
+        :param size: size of the report file in bytes
+        :param stats: statistics of the report, see report_stats
+
+        returns:
+          report: the new report entry (dict)
+        """
+        report = {
+            ReportManifestFormat.MANIFEST_KEY.value: key,
+            ReportManifestFormat.MANIFEST_CONTENT_HASH.value: content_hash,
+            ReportManifestFormat.MANIFEST_CREATED.value: datetime.today().strftime(
+                ReportManifestFormat.MANIFEST_CREATED_FORMAT.value
+            ),
+            ReportManifestFormat.MANIFEST_SIZE.value: size,
+            **(stats or {}),
+        }
+        self.reports.append(report)
+        return report
+
+    def refresh_report(self, report: dict):
+        """
+        Marking a report as written again: the entry is moved to the end
+        of the manifest with the current creation time, so it is the latest
+        report again (e.g. a rerun reproducing the content of an older report)
+
+        :param report: report entry (dict) of the manifest
+
+        returns:
+          report: the refreshed report entry (dict)
+        """
+        self.reports.remove(report)
+        report[ReportManifestFormat.MANIFEST_CREATED.value] = datetime.today().strftime(
+            ReportManifestFormat.MANIFEST_CREATED_FORMAT.value
+        )
+        self.reports.append(report)
+        return report
+
+    def remove_reports(self, keys: list):
+        """
+        Removing the reports of deleted or replaced files from the manifest
+
+        :param keys: keys of the report files on the S3 bucket
+        """
+        keys = set(keys)
+        self.reports = [
+            report
+            for report in self.reports
+            if report[ReportManifestFormat.MANIFEST_KEY.value] not in keys
+        ]
+
+    @staticmethod
+    def read(manifest_key: str, s3_bucket_trg: StorageConnector):
+        """
+        Reading the manifest from the S3 bucket
+
+        :param: manifest_key -> key of the manifest file on the S3 bucket
+        :param: s3_bucket_trg -> StorageConnector for the bucket with the reports
+
+        returns:
+          manifest: ReportManifest, empty if no manifest file exists
+        """
+        try:
+            content = s3_bucket_trg.read_object(manifest_key)
+        except NoSuchKeyException:
+            # No manifest file exists -> starting with an empty manifest
+            return ReportManifest()
+        return ReportManifest(
+            json.loads(content)[ReportManifestFormat.MANIFEST_REPORTS.value]
+        )
+
+    def write(self, manifest_key: str, s3_bucket_trg: StorageConnector):
+        """
+        Writing the manifest to the S3 bucket as one object, so
+        readers see either the old or the new manifest
+
+        :param: manifest_key -> key of the manifest file on the S3 bucket
+        :param: s3_bucket_trg -> StorageConnector for the bucket with the reports
+        """
+        content = json.dumps(
+            {ReportManifestFormat.MANIFEST_REPORTS.value: self.reports}, indent=2
+        )
+        return s3_bucket_trg.write_object(content.encode(), manifest_key)
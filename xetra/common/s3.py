@@ -14,24 +14,27 @@ Usage:
 
 import os
 import logging
-from io import StringIO, BytesIO
+import threading
 
 import boto3
-import pandas as pd
 from dotenv import load_dotenv
 
-from xetra.common.constants import S3FileTypes
-from xetra.common.custom_exceptions import WrongFormatException
+from xetra.common.storage import StorageConnector, compression_of, pa, pq
+from xetra.common.s3_file import ParquetMetadataCache, S3ObjectFile
+from xetra.common.custom_exceptions import NoSuchKeyException
 
 
 load_dotenv()
 
 
-class S3BucketConnector:
+class S3BucketConnector(StorageConnector):
     """
     Class for interacting with S3 buckets
     """
 
+    # parquet footers shared by all connectors of the process, keyed by ETag
+    parquet_metadata_cache = ParquetMetadataCache()
+
     def __init__(self, bucket: str, endpoint_url: str = None):
         """
         Initialize the S3BucketConnector object.
@@ -42,12 +45,32 @@ class S3BucketConnector:
         """
         self._logger = logging.getLogger(__name__)
         self.endpoint_url = endpoint_url
-        self.session = boto3.Session(
-            aws_access_key_id=os.getenv("aws_access_key_id"),
-            aws_secret_access_key=os.getenv("aws_secret_access_key"),
-        )
-        self._s3 = self.session.resource(service_name="s3", endpoint_url=endpoint_url)
-        self._bucket = self._s3.Bucket(bucket)
+        self.bucket_name = bucket
+        # The client is created on first use, connectors that are
+        # never used (e.g. a run with nothing to process) cost nothing
+        self._lock = threading.Lock()
+        self._s3_client = None
+
+    @property
+    def _client(self):
+        """
+        boto3 S3 client, created on first use (the client is thread-safe,
+        so files can be read concurrently with the same S3BucketConnector)
+        """
+        if self._s3_client is None:
+            with self._lock:
+                if self._s3_client is None:
+                    session = boto3.Session(
+                        aws_access_key_id=os.getenv("aws_access_key_id"),
+                        aws_secret_access_key=os.getenv("aws_secret_access_key"),
+                    )
+                    self._s3_client = session.client(
+                        service_name="s3", endpoint_url=self.endpoint_url
+                    )
+        return self._s3_client
+
+    def location(self, key: str):
+        return f"{self.endpoint_url}/{self.bucket_name}/{key}"
 
     def list_files_in_prefix(self, prefix: str):
         """
@@ -59,62 +82,164 @@ class S3BucketConnector:
         Returns:
         files: List of file names in the bucket with the given prefix.
         """
-        files = [obj.key for obj in self._bucket.objects.filter(Prefix=prefix)]
-        return files
+        return list(self.list_file_sizes(prefix))
+
+    def list_file_sizes(self, prefix: str):
+        """
+        List files in the S3 bucket with a given prefix and their sizes
+        (1000 keys per LIST request, no object is downloaded).
+
+        Parameters:
+        prefix (str): Prefix for the files to list.
+
+        Returns:
+        sizes: Dict of file name -> size in bytes.
+        """
+        sizes = {key: size for key, (size, _) in self.list_file_info(prefix).items()}
+        return sizes
 
-    def read_csv_to_df(self, key: str, encoding: str = "utf-8", sep: str = ","):
+    def list_file_info(self, prefix: str):
         """
-        reading a csv file from the S3 bucket and returning a dataframe
+        List files in the S3 bucket with a given prefix, their sizes and
+        ETags (the MD5 of the content for objects not uploaded in parts)
+        with one LIST pagination.
+
+        Parameters:
+        prefix (str): Prefix for the files to list.
+
+        Returns:
+        info: Dict of file name -> (size in bytes, ETag without quotes).
+        """
+        paginator = self._client.get_paginator("list_objects_v2")
+        info = {
+            obj["Key"]: (obj["Size"], obj["ETag"].strip('"'))
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+            for obj in page.get("Contents", [])
+        }
+        return info
+
+    def file_etag(self, key: str):
+        """
+        ETag of one file of the S3 bucket (HEAD request).
+
+        Parameters:
+        key (str): Key of the file.
+
+        Returns:
+        etag: ETag without quotes.
+        """
+        client = self._client
+        try:
+            head = client.head_object(Bucket=self.bucket_name, Key=key)
+        except client.exceptions.ClientError as error:
+            # HEAD responses have no body with the NoSuchKey error code
+            if error.response["Error"]["Code"] != "404":
+                raise
+            raise NoSuchKeyException(key) from error
+        return head["ETag"].strip('"')
+
+    def _get_body(self, key: str):
+        """
+        getting the body of a file and its compression
 
         :param key: key of the file that should be read
-        :encoding: encoding of the data inside the csv file
-        :sep: seperator of the csv file
+        """
+        client = self._client
+        try:
+            response = client.get_object(Bucket=self.bucket_name, Key=key)
+        except client.exceptions.NoSuchKey as error:
+            raise NoSuchKeyException(key) from error
+        return response["Body"], compression_of(key, response.get("ContentEncoding"))
+
+    def _read_buffer(self, key: str):
+        body, _ = self._get_body(key)
+        return pa.py_buffer(body.read())
+
+    def open_object(
+        self,
+        key: str,
+        read_ahead: int = 1024 * 1024,
+        coalesce_gap: int = 64 * 1024,
+        **kwargs,
+    ):
+        """
+        opening a file of the S3 bucket as seekable file-like object
+        that reads byte ranges instead of the whole file
+
+        :param key: key of the file that should be read
+        :param read_ahead: bytes fetched in addition to every unbuffered read
+        :param coalesce_gap: prefetched ranges closer than this are fetched together
+        :param kwargs: options of other connectors, not used
 
         returns:
-          data_frame: Pandas DataFrame containing the data of the csv file
+          file: S3ObjectFile of the file
         """
-        self._logger.info(
-            "Reading file %s/%s/%s", self.endpoint_url, self._bucket.name, key
+        self._logger.info("Opening file %s", self.location(key))
+        client = self._client
+        head = client.head_object(Bucket=self.bucket_name, Key=key)
+        return S3ObjectFile(
+            client,
+            self.bucket_name,
+            key,
+            head["ContentLength"],
+            head["ETag"],
+            read_ahead,
+            coalesce_gap,
         )
-        csv_obj = self._bucket.Object(key=key).get().get("Body").read().decode(encoding)
-        data = StringIO(csv_obj)
-        data_frame = pd.read_csv(data, sep=sep)
-        return data_frame
 
-    def write_df_to_s3(self, data_frame: pd.DataFrame, key: str, file_format: str):
+    def read_parquet_metadata(self, file: S3ObjectFile):
         """
-        writing a Pandas DataFrame to S3
-        supported formats: .csv, .parquet
+        reading the footer of a parquet file, footers are cached per ETag
 
-        :data_frame: Pandas DataFrame that should be written
-        :key: target key of the saved file
-        :file_format: format of the saved file
-        """
-        if data_frame.empty:
-            self._logger.info("The dataframe is empty! No file will be written!")
-            return None
-        if file_format == S3FileTypes.CSV.value:
-            out_buffer = StringIO()
-            data_frame.to_csv(out_buffer, index=False)
-            return self.__put_object(out_buffer, key)
-        if file_format == S3FileTypes.PARQUET.value:
-            out_buffer = BytesIO()
-            data_frame.to_parquet(out_buffer, index=False)
-            return self.__put_object(out_buffer, key)
-        self._logger.info(
-            "The file format %s is not " "supported to be written to s3!", file_format
-        )
-        raise WrongFormatException
+        :param file: S3ObjectFile of the parquet file returned by open_object
 
-    def __put_object(self, out_buffer: StringIO or BytesIO, key: str):
+        returns:
+          metadata: parquet FileMetaData
+        """
+        cache_key = (self.endpoint_url, file.bucket, file.key, file.etag)
+        metadata = self.parquet_metadata_cache.get(cache_key)
+        if metadata is None:
+            metadata = pq.read_metadata(file)
+            self.parquet_metadata_cache.put(cache_key, metadata)
+        return metadata
+
+    def prefetch(self, file: S3ObjectFile, ranges: list):
         """
-        Helper function for self.write_df_to_s3()
+        fetching byte ranges of the file with as few GETs as possible
 
-        :out_buffer: StringIO | BytesIO that should be written
+        :param file: S3ObjectFile of the file returned by open_object
+        :param ranges: list of (start, end) tuples, end exclusive
+        """
+        file.prefetch(ranges)
+
+    def write_object(self, content: bytes, key: str):
+        """
+        writing the content of a file to S3
+
+        :content: bytes that should be written
         :key: target key of the saved file
         """
-        self._logger.info(
-            "Writing file to %s/%s/%s", self.endpoint_url, self._bucket.name, key
-        )
-        self._bucket.put_object(Body=out_buffer.getvalue(), Key=key)
+        self._logger.info("Writing file to %s", self.location(key))
+        self._client.put_object(Bucket=self.bucket_name, Body=content, Key=key)
+        return True
+
+    def delete_objects(self, keys: list):
+        """
+        deleting files from the S3 bucket
+
+        :keys: keys of the files that should be deleted
+        """
+        # S3 deletes at most 1000 keys per request
+        for start in range(0, len(keys), 1000):
+            batch = keys[start : start + 1000]
+            self._logger.info(
+                "Deleting %s files from %s/%s",
+                len(batch),
+                self.endpoint_url,
+                self.bucket_name,
+            )
+            self._client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch]},
+            )
         return True
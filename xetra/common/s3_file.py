@@ -0,0 +1,225 @@
+"""
+Seekable file-like access to S3 objects using byte-range GETs
+"""
+
+import io
+import logging
+import threading
+from collections import OrderedDict
+
+
+class S3ObjectFile(io.RawIOBase):
+    """
+    class for reading an S3 object like a local file
+
+    Reads are served from buffered byte ranges: a read outside the buffers
+    fetches the requested range plus read_ahead bytes, prefetch() fetches
+    several ranges with as few GETs as possible by coalescing close ranges.
+    """
+
+    def __init__(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        size: int,
+        etag: str = None,
+        read_ahead: int = 1024 * 1024,
+        coalesce_gap: int = 64 * 1024,
+    ):
+        """
+        Constructor for S3ObjectFile
+
+        :param client: boto3 S3 client
+        :param bucket: name of the S3 bucket
+        :param key: key of the S3 object
+        :param size: size of the S3 object in bytes
+        :param etag: ETag of the S3 object, GETs fail if the object changes
+        :param read_ahead: bytes fetched in addition to a read outside the buffers
+        :param coalesce_gap: ranges of prefetch() less than coalesce_gap bytes
+          apart are fetched with one GET
+        """
+        super().__init__()
+        self._logger = logging.getLogger(__name__)
+        self._client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.etag = etag
+        self.read_ahead = read_ahead
+        self.coalesce_gap = coalesce_gap
+        self._pos = 0
+        # (start, bytes) buffers of prefetch() and of the last read
+        self._prefetched = []
+        self._read_ahead_buffer = None
+        self.requests = 0
+        self.bytes_requested = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        return self._pos
+
+    def _get_range(self, start: int, end: int):
+        """
+        Fetching the bytes start (inclusive) to end (exclusive) with one GET
+        """
+        args = {
+            "Bucket": self.bucket,
+            "Key": self.key,
+            "Range": f"bytes={start}-{end - 1}",
+        }
+        if self.etag:
+            args["IfMatch"] = self.etag
+        self._logger.debug("Reading bytes %s-%s of %s", start, end - 1, self.key)
+        data = self._client.get_object(**args)["Body"].read()
+        self.requests += 1
+        self.bytes_requested += len(data)
+        return data
+
+    def _buffered(self, start: int, end: int):
+        """
+        Bytes start to end from the buffers, None if no buffer holds all of them
+        """
+        buffers = self._prefetched
+        if self._read_ahead_buffer is not None:
+            buffers = buffers + [self._read_ahead_buffer]
+        for buffer_start, data in buffers:
+            if buffer_start <= start and end <= buffer_start + len(data):
+                return data[start - buffer_start : end - buffer_start]
+        return None
+
+    def prefetch(self, ranges: list):
+        """
+        Fetching byte ranges into the buffers, ranges that are adjacent or
+        less than coalesce_gap bytes apart are fetched with one GET
+
+        :param ranges: list of (start, end) tuples, end exclusive
+        """
+        merged = []
+        for start, end in sorted(ranges):
+            end = min(end, self.size)
+            if start >= end or self._buffered(start, end) is not None:
+                continue
+            if merged and start - merged[-1][1] <= self.coalesce_gap:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            self._prefetched.append((start, self._get_range(start, end)))
+
+    def read(self, size: int = -1):
+        if size is None or size < 0:
+            size = self.size - self._pos
+        start, end = self._pos, min(self._pos + size, self.size)
+        if start >= end:
+            return b""
+        data = self._buffered(start, end)
+        if data is None:
+            # Replacing the read-ahead buffer, prefetched buffers are kept
+            fetch_end = min(max(end, start + self.read_ahead), self.size)
+            self._read_ahead_buffer = (start, self._get_range(start, fetch_end))
+            data = self._read_ahead_buffer[1][: end - start]
+        self._pos = end
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def parquet_chunk_ranges(metadata, row_groups: list, columns: list = None):
+    """
+    Byte ranges of the column chunks of parquet row groups
+
+    :param metadata: parquet FileMetaData
+    :param row_groups: indices of the row groups
+    :param columns: column names, None for all columns
+
+    returns:
+      ranges: list of (start, end) tuples, end exclusive
+    """
+    names = metadata.schema.names
+    indices = (
+        range(len(names)) if columns is None else [names.index(c) for c in columns]
+    )
+    ranges = []
+    for row_group in row_groups:
+        for index in indices:
+            chunk = metadata.row_group(row_group).column(index)
+            start = chunk.data_page_offset
+            if chunk.has_dictionary_page and chunk.dictionary_page_offset is not None:
+                start = min(start, chunk.dictionary_page_offset)
+            ranges.append((start, start + chunk.total_compressed_size))
+    return ranges
+
+
+class ParquetMetadataCache:
+    """
+    class for an in-process LRU cache of parquet footers (FileMetaData)
+
+    Entries are keyed by the object key and ETag, so a rewritten object
+    is never served the metadata of its previous version.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Constructor for ParquetMetadataCache
+
+        :param max_entries: maximum number of cached footers
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cache_key: tuple):
+        """
+        :param cache_key: tuple identifying the object version (including the ETag)
+
+        returns:
+          metadata: cached parquet FileMetaData, None if not cached
+        """
+        with self._lock:
+            metadata = self._entries.get(cache_key)
+            if metadata is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return metadata
+
+    def put(self, cache_key: tuple, metadata):
+        """
+        :param cache_key: tuple identifying the object version (including the ETag)
+        :param metadata: parquet FileMetaData of the object
+        """
+        with self._lock:
+            self._entries[cache_key] = metadata
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removing all cached footers
+        """
+        with self._lock:
+            self._entries.clear()
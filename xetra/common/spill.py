@@ -0,0 +1,119 @@
+"""
+Methods for spilling DataFrames to local disk
+"""
+
+import os
+import glob
+import shutil
+import logging
+import tempfile
+
+import pandas as pd
+
+
+class SpillStore:
+    """
+    class for buffering DataFrames under a memory budget and spilling
+    them as sorted runs to local parquet files partitioned by a column
+    """
+
+    def __init__(
+        self,
+        spill_dir: str,
+        memory_budget_mb: int,
+        partition_col: str,
+        sort_cols: list = None,
+    ):
+        """
+        Constructor for SpillStore
+
+        :param spill_dir: local directory the runs are written to
+        :param memory_budget_mb: buffered data is spilled when exceeding this size
+        :param partition_col: column name the runs are partitioned by
+        :param sort_cols: column names every run is sorted by
+        """
+        self._logger = logging.getLogger(__name__)
+        os.makedirs(spill_dir, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix="xetra_spill_", dir=spill_dir)
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.partition_col = partition_col
+        self.sort_cols = sort_cols or []
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._runs = 0
+        self._partitions = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cleanup()
+
+    def append(self, data_frame: pd.DataFrame):
+        """
+        Adding a DataFrame to the buffer, the buffer is spilled to disk
+        when it exceeds the memory budget
+
+        :param data_frame: Pandas DataFrame that should be stored
+        """
+        if data_frame.empty:
+            return
+        self._buffer.append(data_frame)
+        self._buffer_bytes += int(data_frame.memory_usage(deep=True).sum())
+        if self._buffer_bytes > self.memory_budget:
+            self.flush()
+
+    def flush(self):
+        """
+        Writing the buffered data as one sorted run per partition
+        """
+        if not self._buffer:
+            return
+        data_frame = pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffer_bytes = 0
+        for value, df_part in data_frame.groupby(self.partition_col, sort=False):
+            part_dir = self._partitions.setdefault(
+                value, os.path.join(self.path, f"part-{len(self._partitions):05d}")
+            )
+            os.makedirs(part_dir, exist_ok=True)
+            if self.sort_cols:
+                df_part = df_part.sort_values(by=self.sort_cols, kind="stable")
+            df_part.to_parquet(
+                os.path.join(part_dir, f"run-{self._runs:05d}.parquet"), index=False
+            )
+        self._logger.info("Spilled run %s to %s", self._runs, self.path)
+        self._runs += 1
+
+    def partitions(self):
+        """
+        returns:
+          partitions: sorted list of the spilled partition values
+        """
+        return sorted(self._partitions)
+
+    def read_partition(self, value):
+        """
+        Reading all spilled runs of one partition
+
+        :param value: partition value
+
+        returns:
+          data_frame: Pandas DataFrame with the rows of the partition
+        """
+        return pd.concat(
+            [
+                pd.read_parquet(run)
+                for run in sorted(
+                    glob.glob(os.path.join(self._partitions[value], "*.parquet"))
+                )
+            ],
+            ignore_index=True,
+        )
+
+    def cleanup(self):
+        """
+        Removing all spilled runs
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._partitions = {}
@@ -0,0 +1,433 @@
+"""
+Storage interface shared by the S3 and the local filesystem connectors
+
+The connectors implement access to single files (_get_body, _read_buffer,
+write_object, ...), reading and writing csv and parquet files is done
+here for all of them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from io import StringIO, BytesIO
+
+from xetra.common.constants import S3Compressions, S3FileTypes
+from xetra.common.custom_exceptions import WrongFormatException
+from xetra.common.lazy_import import LazyModule
+
+pd = LazyModule("pandas")
+pa = LazyModule("pyarrow")
+csv = LazyModule("pyarrow.csv")
+pq = LazyModule("pyarrow.parquet")
+
+# key suffixes and Content-Encoding values of compressed objects
+COMPRESSION_SUFFIXES = {
+    "gz": S3Compressions.GZIP.value,
+    "zst": S3Compressions.ZSTD.value,
+}
+CONTENT_ENCODINGS = {
+    "gzip": S3Compressions.GZIP.value,
+    "x-gzip": S3Compressions.GZIP.value,
+    "zstd": S3Compressions.ZSTD.value,
+}
+
+
+def compression_of(key: str, content_encoding: str = None):
+    """
+    compression of an S3 object detected from the key suffix or the
+    Content-Encoding, None if the object is not compressed
+
+    :param key: key of the S3 object
+    :param content_encoding: Content-Encoding of the S3 object
+    """
+    suffix = key.rsplit(".", 1)[-1].lower() if "." in key else ""
+    if suffix in COMPRESSION_SUFFIXES:
+        return COMPRESSION_SUFFIXES[suffix]
+    return CONTENT_ENCODINGS.get((content_encoding or "").lower())
+
+
+def file_extension(file_format: str, compression: str = None):
+    """
+    extension of a file key, compressed csv files get the compression
+    suffix (parquet files are compressed internally)
+
+    :param file_format: format of the file
+    :param compression: compression of the file, see S3Compressions
+    """
+    if compression and file_format == S3FileTypes.CSV.value:
+        suffix = {value: key for key, value in COMPRESSION_SUFFIXES.items()}
+        return f"{file_format}.{suffix[compression]}"
+    return file_format
+
+
+def compress(content: bytes, compression: str = None):
+    """
+    compressing the content of a file
+
+    :param content: bytes that should be compressed
+    :param compression: compression, see S3Compressions (None for no compression)
+    """
+    if not compression:
+        return content
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, compression) as stream:
+        stream.write(content)
+    return sink.getvalue().to_pybytes()
+
+
+def serialize_df(data_frame: pd.DataFrame, file_format: str, compression: str = None):
+    """
+    serializing a Pandas DataFrame to the content of a file
+    supported formats: .csv, .parquet
+
+    :data_frame: Pandas DataFrame that should be serialized
+    :file_format: format of the file
+    :compression: compression of the file, see S3Compressions (csv files
+      are compressed as a whole, parquet files use it as column codec)
+
+    returns:
+      content: bytes with the content of the file
+    """
+    if file_format == S3FileTypes.CSV.value:
+        out_buffer = StringIO()
+        data_frame.to_csv(out_buffer, index=False)
+        return compress(out_buffer.getvalue().encode(), compression)
+    if file_format == S3FileTypes.PARQUET.value:
+        out_buffer = BytesIO()
+        data_frame.to_parquet(
+            out_buffer, index=False, compression=compression or "snappy"
+        )
+        return out_buffer.getvalue()
+    logging.getLogger(__name__).info(
+        "The file format %s is not supported to be written to s3!", file_format
+    )
+    raise WrongFormatException
+
+
+class StorageConnector:
+    """
+    Base class for the connectors to a bucket of files (S3 or local filesystem)
+
+    Missing files raise NoSuchKeyException on every connector.
+    """
+
+    # connectors replace it with the logger of their module
+    _logger = logging.getLogger(__name__)
+
+    def location(self, key: str):
+        """
+        location of a file used for logging
+
+        :param key: key of the file
+        """
+        raise NotImplementedError
+
+    def list_files_in_prefix(self, prefix: str):
+        """
+        listing the files with a given prefix
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          files: list of file keys with the given prefix
+        """
+        raise NotImplementedError
+
+    def list_file_sizes(self, prefix: str):
+        """
+        listing the files with a given prefix and their sizes without
+        reading the files
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          sizes: dict of file key -> size in bytes
+        """
+        raise NotImplementedError
+
+    def list_file_info(self, prefix: str):
+        """
+        listing the files with a given prefix, their sizes and a fingerprint
+        of their content (files with the same content have the same
+        fingerprint) in one listing
+
+        :param prefix: prefix for the files to list
+
+        returns:
+          info: dict of file key -> (size in bytes, fingerprint), the
+            fingerprint is None if it can only be computed by reading the
+            file (see file_etag)
+        """
+        raise NotImplementedError
+
+    def file_etag(self, key: str):
+        """
+        fingerprint of the content of one file like in list_file_info
+
+        :param key: key of the file
+
+        returns:
+          etag: fingerprint of the content
+        """
+        raise NotImplementedError
+
+    def _get_body(self, key: str):
+        """
+        opening a file for sequential reading
+
+        :param key: key of the file that should be read
+
+        returns:
+          body: readable file-like object with the (compressed) content
+          compression: compression of the file, None if not compressed
+        """
+        raise NotImplementedError
+
+    def _read_buffer(self, key: str):
+        """
+        reading the content of a file into a pyarrow Buffer
+
+        :param key: key of the file that should be read
+        """
+        raise NotImplementedError
+
+    def write_object(self, content: bytes, key: str):
+        """
+        writing the content of a file
+
+        :content: bytes that should be written
+        :key: target key of the saved file
+        """
+        raise NotImplementedError
+
+    def delete_objects(self, keys: list):
+        """
+        deleting files
+
+        :keys: keys of the files that should be deleted
+        """
+        raise NotImplementedError
+
+    def open_object(self, key: str, **kwargs):
+        """
+        opening a file as seekable file-like object
+
+        :param key: key of the file that should be read
+        :param kwargs: connector specific options (e.g. the read-ahead of
+          S3 files), ignored by connectors without such options
+        """
+        raise NotImplementedError
+
+    def read_parquet_metadata(self, file):
+        """
+        reading the footer of a parquet file
+
+        :param file: file-like object returned by open_object
+
+        returns:
+          metadata: parquet FileMetaData
+        """
+        return pq.read_metadata(file)
+
+    def prefetch(self, file, ranges: list):
+        """
+        fetching byte ranges of a file returned by open_object before
+        they are read, nothing to do for files that are not remote
+
+        :param file: file-like object returned by open_object
+        :param ranges: list of (start, end) tuples, end exclusive
+        """
+
+    def _open_stream(self, key: str):
+        """
+        opening a file as pyarrow input stream that decompresses compressed files
+
+        :param key: key of the file that should be read
+        """
+        body, compression = self._get_body(key)
+        return pa.input_stream(body, compression=compression)
+
+    def read_object(self, key: str, decompress: bool = False):
+        """
+        reading the content of a file
+
+        :param key: key of the file that should be read
+        :param decompress: decompress the content of compressed files
+
+        returns:
+          content: bytes with the content of the file
+        """
+        self._logger.info("Reading file %s", self.location(key))
+        body, compression = self._get_body(key)
+        if decompress and compression:
+            with pa.input_stream(body, compression=compression) as stream:
+                return stream.read()
+        return body.read()
+
+    def read_csv_to_df(self, key: str, encoding: str = "utf-8", sep: str = ","):
+        """
+        reading a csv file and returning a dataframe
+
+        :param key: key of the file that should be read
+        :encoding: encoding of the data inside the csv file
+        :sep: seperator of the csv file
+
+        returns:
+          data_frame: Pandas DataFrame containing the data of the csv file
+        """
+        self._logger.info("Reading file %s", self.location(key))
+        # Compressed files are decompressed while they are parsed
+        with self._open_stream(key) as stream:
+            data_frame = pd.read_csv(stream, sep=sep, encoding=encoding)
+        return data_frame
+
+    def read_csv_to_arrow(
+        self, key: str, columns: list = None, column_types: dict = None, sep: str = ","
+    ):
+        """
+        reading a csv file and returning a pyarrow Table
+
+        :param key: key of the file that should be read
+        :columns: column names that should be parsed, all columns if None
+        :column_types: dict of column name -> pyarrow type overriding the inference
+        :sep: seperator of the csv file
+
+        returns:
+          table: pyarrow Table containing the data of the csv file
+        """
+        self._logger.info("Reading file %s", self.location(key))
+        with self._open_stream(key) as stream:
+            table = csv.read_csv(
+                stream,
+                parse_options=csv.ParseOptions(delimiter=sep),
+                convert_options=csv.ConvertOptions(
+                    include_columns=columns, column_types=column_types
+                ),
+            )
+        return table
+
+    def read_parquet_to_df(self, key: str, columns: list = None):
+        """
+        reading a parquet file and returning a dataframe
+
+        :param key: key of the file that should be read
+        :columns: column names that should be read, all columns if None
+
+        returns:
+          data_frame: Pandas DataFrame containing the data of the parquet file
+        """
+        self._logger.info("Reading file %s", self.location(key))
+        data_frame = pd.read_parquet(
+            pa.BufferReader(self._read_buffer(key)), columns=columns
+        )
+        return data_frame
+
+    def df_to_bytes(
+        self, data_frame: pd.DataFrame, file_format: str, compression: str = None
+    ):
+        """
+        serializing a Pandas DataFrame to the content of a file,
+        see serialize_df
+        """
+        return serialize_df(data_frame, file_format, compression)
+
+    def table_to_bytes(
+        self,
+        table: pa.Table,
+        file_format: str,
+        row_group_size: int = None,
+        compression: str = None,
+    ):
+        """
+        serializing a pyarrow Table to the content of a file without pandas
+        supported formats: .csv, .parquet
+
+        :table: pyarrow Table that should be serialized
+        :file_format: format of the file
+        :row_group_size: maximum number of rows per parquet row group
+        :compression: compression of the file, see S3Compressions (csv files
+          are compressed as a whole, parquet files use it as column codec)
+
+        returns:
+          content: bytes with the content of the file
+        """
+        if file_format == S3FileTypes.CSV.value:
+            out_buffer = BytesIO()
+            csv.write_csv(table, out_buffer)
+            return compress(out_buffer.getvalue(), compression)
+        if file_format == S3FileTypes.PARQUET.value:
+            out_buffer = BytesIO()
+            pq.write_table(
+                table,
+                out_buffer,
+                row_group_size=row_group_size,
+                compression=compression or "snappy",
+            )
+            return out_buffer.getvalue()
+        self._logger.info(
+            "The file format %s is not supported to be written to s3!", file_format
+        )
+        raise WrongFormatException
+
+    def write_df_to_s3(
+        self,
+        data_frame: pd.DataFrame,
+        key: str,
+        file_format: str,
+        compression: str = None,
+    ):
+        """
+        writing a Pandas DataFrame to the bucket
+        supported formats: .csv, .parquet
+
+        :data_frame: Pandas DataFrame that should be written
+        :key: target key of the saved file
+        :file_format: format of the saved file
+        :compression: compression of the saved file, see S3Compressions
+        """
+        if data_frame.empty:
+            self._logger.info("The dataframe is empty! No file will be written!")
+            return None
+        return self.write_object(
+            self.df_to_bytes(data_frame, file_format, compression), key
+        )
+
+    def write_table_to_s3(
+        self, table: pa.Table, key: str, file_format: str, compression: str = None
+    ):
+        """
+        writing a pyarrow Table to the bucket without converting it to pandas
+        supported formats: .csv, .parquet
+
+        :table: pyarrow Table that should be written
+        :key: target key of the saved file
+        :file_format: format of the saved file
+        :compression: compression of the saved file, see S3Compressions
+        """
+        if table.num_rows == 0:
+            self._logger.info("The table is empty! No file will be written!")
+            return None
+        return self.write_object(
+            self.table_to_bytes(table, file_format, compression=compression), key
+        )
+
+
+def get_storage_connector(bucket: str, endpoint_url: str = None, local_dir: str = None):
+    """
+    Creates the connector to a bucket
+
+    :param bucket: name of the bucket
+    :param endpoint_url: URL of the S3 endpoint
+    :param local_dir: directory with local copies of the buckets
+      (local_dir/<bucket>/<key>), S3 is used if None
+
+    returns:
+      connector: LocalStorageConnector if local_dir is given, else S3BucketConnector
+    """
+    # Imported on demand, so boto3 is not needed for local runs
+    if local_dir:
+        module = importlib.import_module("xetra.common.local_storage")
+        return module.LocalStorageConnector(local_dir, bucket)
+    module = importlib.import_module("xetra.common.s3")
+    return module.S3BucketConnector(bucket=bucket, endpoint_url=endpoint_url)
@@ -0,0 +1,153 @@
+"""Deduplication of the Xetra source data"""
+
+import logging
+import threading
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# multiplier combining the hashes of the key columns (64 bit golden ratio)
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class SourceDeduplicator:
+    """
+    Removes repeated source data: files with the same content as an
+    already read file (same ETag) and rows with the same ISIN, date and
+    time as an already read row
+
+    Rows are compared by a 64 bit hash of the key columns, the hashes of
+    the rows read so far are kept per date as sorted uint64 arrays
+    (8 bytes per row). The first row wins, so the DataFrames have to be
+    deduplicated in the order of the source files.
+    """
+
+    def __init__(self, src_args: NamedTuple):
+        """
+        Constructor for SourceDeduplicator
+
+        :param src_args: NamedTuple class with source configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.src_args = src_args
+        self.key_cols = [
+            src_args.src_col_isin,
+            src_args.src_col_date,
+            src_args.src_col_time,
+        ]
+        self.skipped_files = 0
+        self.dropped_rows = 0
+        self._etags = {}
+        self._etag_sizes = set()
+        # only file of a size whose ETag was not computed yet
+        self._unhashed = {}
+        self._seen = {}
+        # DataFrames may be deduplicated by worker threads (run_pipeline)
+        self._lock = threading.Lock()
+
+    def skip_files(self, files: dict, file_etag: Callable = None):
+        """
+        Finds the files whose content was already listed under another key,
+        missing fingerprints are only computed for files with the size of
+        an earlier file
+
+        :param files: dict of file key -> (size, ETag or None) in processing
+          order, like StorageConnector.list_file_info
+        :param file_etag: function returning the ETag of a file key, needed
+          if an ETag is None
+
+        returns:
+          keys: list of the keys of repeated files
+        """
+        repeated = []
+        for key, (size, etag) in files.items():
+            unhashed_key = self._unhashed.get(size)
+            if unhashed_key == key:
+                continue
+            if etag is None and unhashed_key is None and size not in self._etag_sizes:
+                # no earlier file can have the same content
+                self._unhashed[size] = key
+                continue
+            if unhashed_key is not None:
+                del self._unhashed[size]
+                self._etags[(size, file_etag(unhashed_key))] = unhashed_key
+            if etag is None:
+                etag = file_etag(key)
+            self._etag_sizes.add(size)
+            first_key = self._etags.setdefault((size, etag), key)
+            if first_key != key:
+                self._logger.info(
+                    "Skipping Xetra source file %s, same content as %s",
+                    key,
+                    first_key,
+                )
+                repeated.append(key)
+        self.skipped_files += len(repeated)
+        return repeated
+
+    def row_hashes(self, data_frame: pd.DataFrame):
+        """
+        64 bit hashes of the key columns of every row, only the distinct
+        values of every column are hashed
+
+        :param data_frame: Pandas DataFrame with source rows
+
+        returns:
+          hashes: uint64 numpy array
+        """
+        hashes = np.zeros(len(data_frame), dtype=np.uint64)
+        for column in self.key_cols:
+            codes, uniques = pd.factorize(data_frame[column])
+            # code -1 of missing values selects the appended hash of ""
+            unique_hashes = pd.util.hash_array(
+                np.append(np.asarray(uniques.astype(str), dtype=object), "")
+            )
+            hashes = hashes * _HASH_MULTIPLIER ^ unique_hashes[codes]
+        return hashes
+
+    def drop_duplicates(self, data_frame: pd.DataFrame):
+        """
+        Removes the rows whose key columns equal a row of this or of an
+        already deduplicated DataFrame (the first row is kept, so the
+        DataFrames have to be passed in the order of the source files)
+
+        :param data_frame: Pandas DataFrame with the rows of one source file
+
+        returns:
+          data_frame: Pandas DataFrame without repeated rows (the input
+            DataFrame itself if no row is repeated)
+        """
+        if data_frame.empty:
+            return data_frame
+        hashes = self.row_hashes(data_frame)
+        duplicated = pd.Series(hashes).duplicated().to_numpy(copy=True)
+        date_codes, dates = pd.factorize(data_frame[self.src_args.src_col_date])
+        with self._lock:
+            for code, date in enumerate(dates):
+                in_date = date_codes == code
+                date_hashes = hashes[in_date]
+                seen = self._seen.get(date)
+                if seen is None:
+                    self._seen[date] = np.unique(date_hashes)
+                    continue
+                # Membership in the sorted hashes of the earlier rows
+                positions = np.minimum(
+                    np.searchsorted(seen, date_hashes), len(seen) - 1
+                )
+                duplicated[in_date] |= seen[positions] == date_hashes
+                self._seen[date] = np.union1d(seen, date_hashes)
+            self.dropped_rows += int(np.count_nonzero(duplicated))
+        if not duplicated.any():
+            return data_frame
+        return data_frame[~duplicated]
+
+    def log_counts(self):
+        """
+        Logs the number of skipped files and dropped rows
+        """
+        self._logger.info(
+            "Deduplication skipped %s Xetra source files and dropped %s rows.",
+            self.skipped_files,
+            self.dropped_rows,
+        )
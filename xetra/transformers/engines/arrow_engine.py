@@ -0,0 +1,156 @@
+"""Xetra pyarrow Transform Engine"""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from xetra.common.constants import SourceFormats
+from xetra.transformers.engines.base import TransformEngine
+from xetra.transformers.kernels import group_starts
+
+
+class ArrowEngine(TransformEngine):
+    """
+    Creates report 1 with pyarrow.compute kernels and returns a pyarrow
+    Table, so the data is never converted to pandas from extract to load
+    """
+
+    source_format = SourceFormats.ARROW.value
+
+    def aggregate_report1(self, table: pa.Table):
+        """
+        Aggregates the source rows per ISIN and day
+
+        :param table: pyarrow Table with source rows
+
+        :returns:
+          table: pyarrow Table with one row per ISIN and day sorted by ISIN and day
+        """
+        src, trg = self.src_args, self.trg_args
+        # Filtering necessary source columns and removing rows with missing values
+        table = table.select(src.src_columns).drop_null()
+        # Sorting by ISIN, day and time (stable), first and last need ordered groups
+        table = table.sort_by(
+            [
+                (src.src_col_isin, "ascending"),
+                (src.src_col_date, "ascending"),
+                (src.src_col_time, "ascending"),
+            ]
+        )
+        aggregations = [
+            (src.src_col_start_price, "first", None, trg.trg_col_op_price),
+            (src.src_col_start_price, "last", None, trg.trg_col_clos_price),
+            (src.src_col_min_price, "min", None, trg.trg_col_min_price),
+            (src.src_col_max_price, "max", None, trg.trg_col_max_price),
+            (src.src_col_traded_vol, "sum", None, trg.trg_col_dail_trad_vol),
+        ]
+        # Aggregating per ISIN and day, the order of the groups is not
+        # guaranteed, so they are sorted again
+        grouped = (
+            table.group_by([src.src_col_isin, src.src_col_date], use_threads=False)
+            .aggregate([aggregation[:3] for aggregation in aggregations])
+            .sort_by([(src.src_col_isin, "ascending"), (src.src_col_date, "ascending")])
+        )
+        # Renaming to the target columns in report order
+        names = [f"{column}_{function}" for column, function, *_ in aggregations]
+        columns = [grouped[src.src_col_isin], grouped[src.src_col_date]] + [
+            grouped[name] for name in names
+        ]
+        column_names = [src.src_col_isin, src.src_col_date] + [
+            aggregation[3] for aggregation in aggregations
+        ]
+        turnover_col = trg.trg_col_turnover or trg.trg_col_vwap
+        if turnover_col:
+            columns.append(self._sum_turnover(table))
+            column_names.append(turnover_col)
+        return pa.table(columns, names=column_names)
+
+    def _sum_turnover(self, table: pa.Table):
+        """
+        Sums the traded value of the rows per ISIN and day in row order
+        with NumPy like the pandas engine, so the turnover is rounded the
+        same (the pairwise sums of pyarrow differ in the last bits)
+
+        :param table: pyarrow Table with source rows sorted by ISIN and day
+
+        :returns:
+          turnover: float64 numpy array with one value per ISIN and day
+        """
+        src = self.src_args
+        price = table[src.src_col_start_price].to_numpy().astype(np.float64)
+        if src.src_col_end_price:
+            end_price = table[src.src_col_end_price].to_numpy().astype(np.float64)
+            price = (price + end_price) / 2
+        values = price * table[src.src_col_traded_vol].to_numpy().astype(np.int64)
+        starts = group_starts(
+            [
+                table[src.src_col_isin].to_numpy(),
+                table[src.src_col_date].to_numpy(),
+            ]
+        )
+        if len(starts) == 0:
+            return values
+        return np.add.reduceat(values, starts)
+
+    def finalize_report1(self, table: pa.Table, extract_date: str):
+        """
+        Calculates the report 1 metrics spanning several days from the
+        aggregates per ISIN and day
+
+        :param table: pyarrow Table sorted by ISIN and day
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          table: report 1 pyarrow Table
+        """
+        src, trg = self.src_args, self.trg_args
+        turnover_col = trg.trg_col_turnover or trg.trg_col_vwap
+        columns = {
+            name: table[name].combine_chunks()
+            for name in table.column_names
+            if name != turnover_col
+        }
+        # Change of current day's closing price compared to the
+        # previous trading day's closing price in % (null for the first day)
+        op_price = pc.cast(columns[trg.trg_col_op_price], pa.float64())
+        isins = columns[src.src_col_isin]
+        prev_price = pa.concat_arrays(
+            [pa.nulls(min(len(op_price), 1), pa.float64()), op_price[:-1]]
+        )
+        same_isin = pa.concat_arrays(
+            [pa.array([False] * min(len(isins), 1)), pc.equal(isins[1:], isins[:-1])]
+        )
+        prev_price = pc.if_else(same_isin, prev_price, None)
+        columns[trg.trg_col_ch_prev_clos] = pc.multiply(
+            pc.divide(pc.subtract(op_price, prev_price), prev_price), 100
+        )
+        if trg.trg_col_vwap:
+            volume = pc.cast(table[trg.trg_col_dail_trad_vol], pa.float64())
+            columns[trg.trg_col_vwap] = pc.divide(
+                table[turnover_col], pc.if_else(pc.equal(volume, 0), None, volume)
+            )
+        if trg.trg_col_turnover:
+            columns[trg.trg_col_turnover] = table[turnover_col]
+        # Rounding to 2 decimals with NumPy like the pandas engine (the
+        # rounding of pyarrow differs for values with many integer digits)
+        for name, column in columns.items():
+            if pa.types.is_floating(column.type):
+                columns[name] = pa.array(
+                    np.round(column.to_numpy(zero_copy_only=False), 2),
+                    mask=column.is_null().to_numpy(zero_copy_only=False),
+                )
+        table = pa.table(columns)
+        # Removing the day before extract_date
+        return table.filter(pc.greater_equal(table[src.src_col_date], extract_date))
+
+    def transform_report1(self, data, extract_date: str):
+        """
+        Applies the transformation to create report 1
+
+        :param data: pyarrow Table with the source rows
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          table: report 1 pyarrow Table sorted by ISIN and date
+        """
+        return self.finalize_report1(self.aggregate_report1(data), extract_date)
@@ -0,0 +1,93 @@
+"""Xetra Transform Engine Interface"""
+
+import importlib
+from typing import NamedTuple
+
+from xetra.common.constants import SourceFormats, TransformEngines
+from xetra.common.custom_exceptions import WrongEngineException
+
+# Engine classes are imported on demand, so optional engine
+# dependencies are only needed when the engine is selected
+ENGINE_CLASSES = {
+    TransformEngines.PANDAS.value: "xetra.transformers.engines.pandas_engine.PandasEngine",
+    TransformEngines.DUCKDB.value: "xetra.transformers.engines.duckdb_engine.DuckDBEngine",
+    TransformEngines.POLARS.value: "xetra.transformers.engines.polars_engine.PolarsEngine",
+    TransformEngines.ARROW.value: "xetra.transformers.engines.arrow_engine.ArrowEngine",
+}
+
+
+class TransformEngine:
+    """
+    Base class for the engines creating report 1 from the source data
+
+    All engines create the same report. The opening and closing price are
+    the starting price of the first and last source row of the earliest
+    and latest trade time (rows of equal times in source row order). The
+    turnover sums the traded value of every row (average of starting and
+    ending price times traded volume), the volume-weighted average price
+    is turnover / traded volume (missing for a traded volume of 0).
+    """
+
+    # in-memory format of the extracted source data the engine consumes
+    source_format = SourceFormats.PANDAS.value
+
+    def __init__(
+        self, src_args: NamedTuple, trg_args: NamedTuple, run_args: NamedTuple = None
+    ):
+        """
+        Constructor for TransformEngine
+
+        :param src_args: NamedTuple class with source configuration data
+        :param trg_args: NamedTuple class with target configuration data
+        :param run_args: NamedTuple class with run configuration data
+        """
+        self.src_args = src_args
+        self.trg_args = trg_args
+        self.run_args = run_args
+
+    def transform_report1(self, data, extract_date: str):
+        """
+        Applies the transformation to create report 1
+
+        :param data: extracted source data in the engine's source_format
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          data_frame: report 1 Pandas DataFrame sorted by ISIN and date
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def round_report1(data_frame):
+        """
+        Rounds the report 1 metrics to 2 decimals, engines aggregating
+        outside of pandas only round their small aggregated result with
+        this, so the rounding is the same for all engines
+
+        :param data_frame: report 1 Pandas DataFrame
+
+        :returns:
+          data_frame: rounded report 1 Pandas DataFrame
+        """
+        return data_frame.round(decimals=2)
+
+
+def get_engine(
+    name: str, src_args: NamedTuple, trg_args: NamedTuple, run_args: NamedTuple = None
+):
+    """
+    Creates the transform engine with the given name
+
+    :param name: name of the engine, see TransformEngines
+    :param src_args: NamedTuple class with source configuration data
+    :param trg_args: NamedTuple class with target configuration data
+    :param run_args: NamedTuple class with run configuration data
+
+    returns:
+      engine: TransformEngine instance
+    """
+    if name not in ENGINE_CLASSES:
+        raise WrongEngineException(name)
+    module_name, class_name = ENGINE_CLASSES[name].rsplit(".", 1)
+    engine_class = getattr(importlib.import_module(module_name), class_name)
+    return engine_class(src_args, trg_args, run_args)
@@ -0,0 +1,112 @@
+"""Xetra DuckDB Transform Engine"""
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+
+from xetra.common.constants import SourceFormats
+from xetra.transformers.engines.base import TransformEngine
+
+
+def _quote(identifier: str):
+    """
+    Quotes a column name for the use in a SQL statement
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class DuckDBEngine(TransformEngine):
+    """
+    Creates report 1 with SQL aggregate and window queries executed
+    by an embedded, multithreaded DuckDB database directly on Arrow data
+    """
+
+    source_format = SourceFormats.ARROW.value
+
+    # column with the number of the source row
+    row_col = "_source_row"
+
+    def report1_query(self):
+        """
+        SQL query creating report 1 from the table "source" with the
+        source row numbers in row_col, the first date of the report is
+        the query parameter
+
+        returns:
+          query: SQL query string
+        """
+        src, trg = self.src_args, self.trg_args
+        isin, date = _quote(src.src_col_isin), _quote(src.src_col_date)
+        op_price, vol = _quote(trg.trg_col_op_price), _quote(trg.trg_col_dail_trad_vol)
+        turnover_col = trg.trg_col_turnover or trg.trg_col_vwap
+        if src.src_col_end_price:
+            price = (
+                f"({_quote(src.src_col_start_price)} "
+                f"+ {_quote(src.src_col_end_price)}) / 2"
+            )
+        else:
+            price = _quote(src.src_col_start_price)
+        time_row = f"({_quote(src.src_col_time)}, {_quote(self.row_col)})"
+        daily_columns = [
+            f"arg_min({_quote(src.src_col_start_price)}, {time_row}) AS {op_price}",
+            f"arg_max({_quote(src.src_col_start_price)}, {time_row})"
+            f" AS {_quote(trg.trg_col_clos_price)}",
+            f"min({_quote(src.src_col_min_price)}) AS {_quote(trg.trg_col_min_price)}",
+            f"max({_quote(src.src_col_max_price)}) AS {_quote(trg.trg_col_max_price)}",
+            f"sum({_quote(src.src_col_traded_vol)})::BIGINT AS {vol}",
+        ]
+        report_columns = [
+            isin,
+            date,
+            op_price,
+            _quote(trg.trg_col_clos_price),
+            _quote(trg.trg_col_min_price),
+            _quote(trg.trg_col_max_price),
+            vol,
+            f"({op_price} - lag({op_price}) OVER w) / lag({op_price}) OVER w * 100"
+            f" AS {_quote(trg.trg_col_ch_prev_clos)}",
+        ]
+        if turnover_col:
+            daily_columns.append(
+                f"sum(({price}) * {_quote(src.src_col_traded_vol)}::DOUBLE) AS turnover"
+            )
+        if trg.trg_col_vwap:
+            report_columns.append(
+                f"turnover / nullif({vol}, 0) AS {_quote(trg.trg_col_vwap)}"
+            )
+        if trg.trg_col_turnover:
+            report_columns.append(f"turnover AS {_quote(trg.trg_col_turnover)}")
+        not_null = " AND ".join(
+            f"{_quote(column)} IS NOT NULL" for column in src.src_columns
+        )
+        return (
+            f"WITH daily AS ("
+            f" SELECT {isin}, {date}, {', '.join(daily_columns)}"
+            f" FROM source WHERE {not_null} GROUP BY {isin}, {date}"
+            f"), report AS ("
+            f" SELECT {', '.join(report_columns)}"
+            f" FROM daily WINDOW w AS (PARTITION BY {isin} ORDER BY {date})"
+            f") SELECT * FROM report WHERE {date} >= ? ORDER BY {isin}, {date}"
+        )
+
+    def transform_report1(self, data, extract_date: str):
+        """
+        Applies the transformation to create report 1
+
+        :param data: pyarrow Table or Pandas DataFrame with the source rows
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          data_frame: report 1 Pandas DataFrame sorted by ISIN and date
+        """
+        # Numbering the source rows for rows of equal times
+        if isinstance(data, pa.Table):
+            data = data.append_column(
+                self.row_col, pa.array(np.arange(data.num_rows, dtype=np.int64))
+            )
+        else:
+            data = data.assign(**{self.row_col: np.arange(len(data), dtype=np.int64)})
+        with duckdb.connect() as connection:
+            connection.register("source", data)
+            data_frame = connection.execute(self.report1_query(), [extract_date]).df()
+        return self.round_report1(data_frame)
@@ -0,0 +1,214 @@
+"""Xetra pandas Transform Engine"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype
+
+from xetra.transformers.engines.base import TransformEngine
+from xetra.transformers.kernels import group_reduce, group_shift, group_starts
+from xetra.transformers.lean_dtypes import day_numbers_to_dates, restore_prices
+
+
+class PandasEngine(TransformEngine):
+    """
+    Creates report 1 with pandas and the NumPy group reduction kernels
+    """
+
+    # columns of partial aggregates with the time of the opening/closing price
+    partial_first_time = "_first_time"
+    partial_last_time = "_last_time"
+
+    def transform_report1(self, data, extract_date: str):
+        """
+        Applies the transformation to create report 1
+
+        :param data: Pandas DataFrame with the source rows
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          data_frame: report 1 Pandas DataFrame sorted by ISIN and date
+        """
+        return self.finalize_report1(self.aggregate_report1(data), extract_date)
+
+    def _price_decimals(self):
+        """
+        returns:
+          decimals: number of decimals of the source prices
+        """
+        return 4 if self.run_args is None else self.run_args.run_price_decimals
+
+    def aggregate_report1(self, data_frame: pd.DataFrame, partial: bool = False):
+        """
+        Aggregates the source rows per ISIN and day, rows of different
+        days are independent so this can also run per day partition,
+        the source columns may have the dtypes of lean_dtypes.to_lean_dtypes
+
+        :param data_frame: Pandas DataFrame with source rows
+        :param partial: adds the times of the opening and closing price, so
+          aggregates of several batches can be merged by merge_report1_partials
+
+        :returns:
+          data_frame: Pandas DataFrame with one row per ISIN and day
+        """
+        src, trg = self.src_args, self.trg_args
+        decimals = self._price_decimals()
+        # Filtering necessary source columns and removing rows with missing values
+        data_frame = data_frame.loc[:, src.src_columns].dropna()
+        # Sorting the rows by ISIN, day and time using integer codes
+        isin_codes, isins = pd.factorize(data_frame[src.src_col_isin], sort=True)
+        date_codes, dates = pd.factorize(data_frame[src.src_col_date], sort=True)
+        time_codes, times = pd.factorize(data_frame[src.src_col_time], sort=True)
+        order = np.lexsort((time_codes, date_codes, isin_codes))
+        isin_codes, date_codes = isin_codes[order], date_codes[order]
+        start_price = restore_prices(
+            data_frame[src.src_col_start_price].to_numpy()[order], decimals
+        )
+        volume = data_frame[src.src_col_traded_vol].to_numpy()[order].astype(np.int64)
+        totals = [volume]
+        # Turnover summed in the same grouped pass
+        turnover_col = trg.trg_col_turnover or trg.trg_col_vwap
+        if turnover_col:
+            if src.src_col_end_price:
+                end_price = restore_prices(
+                    data_frame[src.src_col_end_price].to_numpy()[order], decimals
+                )
+                price = (start_price + end_price) / 2
+            else:
+                price = start_price
+            totals.append(price * volume)
+        # Aggregating per ISIN and day -> opening price, closing price,
+        # minimum price, maximum price, traded volume (and turnover)
+        reduction = group_reduce(
+            [isin_codes, date_codes],
+            start_price,
+            data_frame[src.src_col_min_price].to_numpy()[order],
+            data_frame[src.src_col_max_price].to_numpy()[order],
+            totals,
+            use_jit=self.run_args is not None and self.run_args.run_jit,
+        )
+        # Restoring the report dtypes of lean source columns
+        isins = isins.take(isin_codes[reduction.starts])
+        if isinstance(isins, pd.CategoricalIndex):
+            isins = isins.astype(isins.categories.dtype)
+        dates = dates.take(date_codes[reduction.starts])
+        if is_integer_dtype(dates):
+            dates = day_numbers_to_dates(dates)
+        data_frame = pd.DataFrame(
+            {
+                src.src_col_isin: isins,
+                src.src_col_date: dates,
+                trg.trg_col_op_price: reduction.first,
+                trg.trg_col_clos_price: reduction.last,
+                trg.trg_col_min_price: restore_prices(reduction.minimum, decimals),
+                trg.trg_col_max_price: restore_prices(reduction.maximum, decimals),
+                trg.trg_col_dail_trad_vol: reduction.totals[0],
+            }
+        )
+        if turnover_col:
+            data_frame[turnover_col] = reduction.totals[1]
+        if partial:
+            time_codes = time_codes[order]
+            ends = np.append(reduction.starts[1:], len(order)) - 1
+            data_frame[self.partial_first_time] = times.take(
+                time_codes[reduction.starts]
+            )
+            data_frame[self.partial_last_time] = times.take(time_codes[ends])
+        return data_frame
+
+    def merge_report1_partials(self, partials: list):
+        """
+        Merges partial aggregates of consecutive batches of source rows,
+        ties of the opening/closing price time are resolved by the batch
+        order like ties of rows in one batch are resolved by the row order
+
+        :param partials: list of aggregate_report1(partial=True) DataFrames
+          in the order of the source rows
+
+        :returns:
+          data_frame: Pandas DataFrame with one row per ISIN and day
+        """
+        src, trg = self.src_args, self.trg_args
+        turnover_col = trg.trg_col_turnover or trg.trg_col_vwap
+        partials = [partial for partial in partials if not partial.empty]
+        if not partials:
+            return pd.DataFrame()
+        batches = np.repeat(
+            np.arange(len(partials)), [len(partial) for partial in partials]
+        )
+        data_frame = pd.concat(partials, ignore_index=True)
+        isin_codes, isins = pd.factorize(data_frame[src.src_col_isin], sort=True)
+        date_codes, dates = pd.factorize(data_frame[src.src_col_date], sort=True)
+        first_codes, _ = pd.factorize(data_frame[self.partial_first_time], sort=True)
+        last_codes, _ = pd.factorize(data_frame[self.partial_last_time], sort=True)
+        # Opening price, minimum, maximum and sums in the order of the first
+        # times, closing price in the order of the last times
+        order = np.lexsort((batches, first_codes, date_codes, isin_codes))
+        order_last = np.lexsort((batches, last_codes, date_codes, isin_codes))
+        totals = [data_frame[trg.trg_col_dail_trad_vol].to_numpy()[order]]
+        if turnover_col:
+            totals.append(data_frame[turnover_col].to_numpy()[order])
+        reduction = group_reduce(
+            [isin_codes[order], date_codes[order]],
+            data_frame[trg.trg_col_op_price].to_numpy()[order],
+            data_frame[trg.trg_col_min_price].to_numpy()[order],
+            data_frame[trg.trg_col_max_price].to_numpy()[order],
+            totals,
+            use_jit=self.run_args is not None and self.run_args.run_jit,
+        )
+        ends = np.append(reduction.starts[1:], len(order)) - 1
+        merged = pd.DataFrame(
+            {
+                src.src_col_isin: isins.take(isin_codes[order][reduction.starts]),
+                src.src_col_date: dates.take(date_codes[order][reduction.starts]),
+                trg.trg_col_op_price: reduction.first,
+                trg.trg_col_clos_price: data_frame[trg.trg_col_clos_price].to_numpy()[
+                    order_last
+                ][ends],
+                trg.trg_col_min_price: reduction.minimum,
+                trg.trg_col_max_price: reduction.maximum,
+                trg.trg_col_dail_trad_vol: reduction.totals[0],
+            }
+        )
+        if turnover_col:
+            merged[turnover_col] = reduction.totals[1]
+        return merged
+
+    def finalize_report1(self, data_frame: pd.DataFrame, extract_date: str):
+        """
+        Calculates the report 1 metrics spanning several days from the
+        aggregates per ISIN and day
+
+        :param data_frame: Pandas DataFrame sorted by ISIN and day
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          data_frame: report 1 Pandas DataFrame
+        """
+        turnover_col = self.trg_args.trg_col_turnover or self.trg_args.trg_col_vwap
+        # Change of current day's closing price compared to the
+        # previous trading day's closing price in %
+        data_frame[self.trg_args.trg_col_ch_prev_clos] = group_shift(
+            data_frame[self.trg_args.trg_col_op_price].to_numpy(dtype=np.float64),
+            group_starts([data_frame[self.src_args.src_col_isin].to_numpy()]),
+        )
+        data_frame[self.trg_args.trg_col_ch_prev_clos] = (
+            (
+                data_frame[self.trg_args.trg_col_op_price]
+                - data_frame[self.trg_args.trg_col_ch_prev_clos]
+            )
+            / data_frame[self.trg_args.trg_col_ch_prev_clos]
+            * 100
+        )
+        if self.trg_args.trg_col_vwap:
+            volume = data_frame[self.trg_args.trg_col_dail_trad_vol]
+            data_frame[self.trg_args.trg_col_vwap] = data_frame[
+                turnover_col
+            ] / volume.where(volume != 0)
+        # Moving the optional metrics behind the report 1 base columns
+        for column in (self.trg_args.trg_col_vwap, self.trg_args.trg_col_turnover):
+            if column:
+                data_frame[column] = data_frame.pop(column)
+        data_frame = self.round_report1(data_frame)
+        # Removing the day before extract_date
+        data_frame = data_frame[data_frame.Date >= extract_date].reset_index(drop=True)
+        return data_frame
@@ -0,0 +1,108 @@
+"""Xetra Polars Transform Engine"""
+
+from io import BytesIO
+
+import polars as pl
+
+from xetra.common.constants import SourceFormats
+from xetra.transformers.engines.base import TransformEngine
+
+
+class PolarsEngine(TransformEngine):
+    """
+    Creates report 1 with a Polars LazyFrame plan scanning the source
+    CSVs, the projection and the removal of missing values are pushed
+    into the scans and the aggregation runs in parallel on all cores
+    """
+
+    source_format = SourceFormats.CSV.value
+
+    def report1_plan(self, sources: list, extract_date: str):
+        """
+        Lazy query plan creating report 1
+
+        :param sources: list with the content (bytes) of the source csv files
+        :param extract_date: first date that is part of the report
+
+        returns:
+          lazy_frame: Polars LazyFrame with the report 1 plan
+        """
+        src, trg = self.src_args, self.trg_args
+        turnover_col = trg.trg_col_turnover or trg.trg_col_vwap
+        # Dates and times are kept as strings like in pandas
+        schema_overrides = {src.src_col_date: pl.String, src.src_col_time: pl.String}
+        lazy_frame = (
+            pl.concat(
+                [
+                    pl.scan_csv(BytesIO(source), schema_overrides=schema_overrides)
+                    for source in sources
+                ],
+                how="diagonal_relaxed",
+            )
+            .select(src.src_columns)
+            .drop_nulls()
+        )
+        start_price = pl.col(src.src_col_start_price).sort_by(
+            src.src_col_time, maintain_order=True
+        )
+        aggregations = [
+            start_price.first().alias(trg.trg_col_op_price),
+            start_price.last().alias(trg.trg_col_clos_price),
+            pl.col(src.src_col_min_price).min().alias(trg.trg_col_min_price),
+            pl.col(src.src_col_max_price).max().alias(trg.trg_col_max_price),
+            pl.col(src.src_col_traded_vol).sum().alias(trg.trg_col_dail_trad_vol),
+        ]
+        if turnover_col:
+            if src.src_col_end_price:
+                price = (
+                    pl.col(src.src_col_start_price) + pl.col(src.src_col_end_price)
+                ) / 2
+            else:
+                price = pl.col(src.src_col_start_price)
+            aggregations.append(
+                (price * pl.col(src.src_col_traded_vol)).sum().alias("turnover")
+            )
+        prev_op_price = pl.col(trg.trg_col_op_price).shift(1).over(src.src_col_isin)
+        report_columns = [
+            src.src_col_isin,
+            src.src_col_date,
+            trg.trg_col_op_price,
+            trg.trg_col_clos_price,
+            trg.trg_col_min_price,
+            trg.trg_col_max_price,
+            trg.trg_col_dail_trad_vol,
+            (
+                (pl.col(trg.trg_col_op_price) - prev_op_price) / prev_op_price * 100
+            ).alias(trg.trg_col_ch_prev_clos),
+        ]
+        if trg.trg_col_vwap:
+            report_columns.append(
+                (
+                    pl.col("turnover")
+                    / pl.when(pl.col(trg.trg_col_dail_trad_vol) != 0).then(
+                        pl.col(trg.trg_col_dail_trad_vol)
+                    )
+                ).alias(trg.trg_col_vwap)
+            )
+        if trg.trg_col_turnover:
+            report_columns.append(pl.col("turnover").alias(trg.trg_col_turnover))
+        return (
+            lazy_frame.group_by([src.src_col_isin, src.src_col_date])
+            .agg(aggregations)
+            .sort([src.src_col_isin, src.src_col_date])
+            .select(report_columns)
+            .filter(pl.col(src.src_col_date) >= extract_date)
+        )
+
+    def transform_report1(self, data, extract_date: str):
+        """
+        Applies the transformation to create report 1
+
+        :param data: list with the content (bytes) of the source csv files
+        :param extract_date: first date that is part of the report
+
+        :returns:
+          data_frame: report 1 Pandas DataFrame sorted by ISIN and date
+        """
+        data_frame = self.report1_plan(data, extract_date).collect().to_pandas()
+        return self.round_report1(data_frame)
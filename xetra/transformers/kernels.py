@@ -0,0 +1,174 @@
+"""Xetra Group Reduction Kernels"""
+
+import importlib
+import importlib.util
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+# numba is optional, the NumPy kernels are used without it. It is only
+# imported when a compiled kernel is used (importing it takes longer
+# than the startup of a small run)
+JIT_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+class GroupReduction(NamedTuple):
+    """
+    Class for the result of group_reduce
+
+    starts: index of the first row of every group
+    first: first value of every group
+    last: last value of every group
+    minimum: minimum value of every group
+    maximum: maximum value of every group
+    totals: list with the sum of every group per summed array
+    """
+
+    starts: np.ndarray
+    first: np.ndarray
+    last: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    totals: list
+
+
+def group_starts(keys: list):
+    """
+    Finds the group boundaries of rows sorted by the key arrays
+
+    :param keys: list of equally long key arrays, the rows are sorted by them
+
+    returns:
+      starts: index of the first row of every group
+    """
+    size = len(keys[0])
+    if size == 0:
+        return np.empty(0, dtype=np.int64)
+    changed = np.zeros(size - 1, dtype=bool)
+    for key in keys:
+        changed |= key[1:] != key[:-1]
+    return np.concatenate(([0], np.flatnonzero(changed) + 1))
+
+
+def group_shift(values: np.ndarray, starts: np.ndarray):
+    """
+    Shifts float values by one row inside every group
+
+    :param values: values of rows sorted by group
+    :param starts: index of the first row of every group
+
+    returns:
+      shifted: previous value of the group, NaN for the first row of a group
+    """
+    shifted = np.empty(len(values), dtype=np.float64)
+    shifted[1:] = values[:-1]
+    shifted[starts] = np.nan
+    return shifted
+
+
+def _reduce_numpy(starts, first_last, minimum, maximum, totals):
+    """
+    NumPy implementation of group_reduce using index picks and reduceat
+    """
+    ends = np.append(starts[1:], len(first_last)) - 1
+    return GroupReduction(
+        starts,
+        first_last[starts],
+        first_last[ends],
+        np.minimum.reduceat(minimum, starts),
+        np.maximum.reduceat(maximum, starts),
+        [np.add.reduceat(total, starts) for total in totals],
+    )
+
+
+def _first_last_min_max(starts, first_last, minimum, maximum):
+    """
+    Loop kernel of group_reduce, compiled by _jit_kernels
+    """
+    groups = len(starts)
+    first = np.empty(groups, first_last.dtype)
+    last = np.empty(groups, first_last.dtype)
+    group_min = np.empty(groups, minimum.dtype)
+    group_max = np.empty(groups, maximum.dtype)
+    for group in range(groups):
+        start = starts[group]
+        end = starts[group + 1] if group + 1 < groups else len(first_last)
+        first[group] = first_last[start]
+        last[group] = first_last[end - 1]
+        low, high = minimum[start], maximum[start]
+        for row in range(start + 1, end):
+            low = min(low, minimum[row])
+            high = max(high, maximum[row])
+        group_min[group], group_max[group] = low, high
+    return first, last, group_min, group_max
+
+
+def _sum(starts, values):
+    """
+    Loop kernel of the group sums, compiled by _jit_kernels
+    """
+    groups = len(starts)
+    result = np.zeros(groups, values.dtype)
+    for group in range(groups):
+        end = starts[group + 1] if group + 1 < groups else len(values)
+        for row in range(starts[group], end):
+            result[group] += values[row]
+    return result
+
+
+@lru_cache(maxsize=None)
+def _jit_kernels():
+    """
+    Compiling the loop kernels with numba on first use
+
+    returns:
+      kernels: compiled _first_last_min_max and _sum
+    """
+    jit = importlib.import_module("numba").njit(cache=True, nogil=True)
+    return jit(_first_last_min_max), jit(_sum)
+
+
+def group_reduce(
+    keys: list,
+    first_last: np.ndarray,
+    minimum: np.ndarray,
+    maximum: np.ndarray,
+    totals: list = None,
+    use_jit: bool = False,
+):
+    """
+    Reduces rows sorted by the key arrays (e.g. ISIN code, date, time)
+    to one row per group of the key arrays (e.g. ISIN code and date)
+
+    :param keys: list of key arrays defining the groups
+    :param first_last: values the first and last value per group is taken from
+    :param minimum: values the minimum per group is taken from
+    :param maximum: values the maximum per group is taken from
+    :param totals: list of value arrays that are summed per group
+    :param use_jit: use the numba compiled kernel if numba is installed
+
+    returns:
+      reduction: GroupReduction with the group starts and the reduced values
+    """
+    totals = totals or []
+    starts = group_starts(keys)
+    if len(starts) == 0:
+        empty = first_last[:0]
+        return GroupReduction(
+            starts, empty, empty, minimum[:0], maximum[:0], [t[:0] for t in totals]
+        )
+    if use_jit and JIT_AVAILABLE:
+        first_last_min_max_jit, sum_jit = _jit_kernels()
+        first, last, group_min, group_max = first_last_min_max_jit(
+            starts, first_last, minimum, maximum
+        )
+        return GroupReduction(
+            starts,
+            first,
+            last,
+            group_min,
+            group_max,
+            [sum_jit(starts, total) for total in totals],
+        )
+    return _reduce_numpy(starts, first_last, minimum, maximum, totals)
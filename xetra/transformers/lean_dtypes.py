@@ -0,0 +1,139 @@
+"""Memory-lean dtypes for the Xetra source data"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+from pandas.api.types import union_categoricals
+
+from xetra.common.constants import MetaProcessFormat
+
+
+def restore_prices(values: np.ndarray, decimals: int):
+    """
+    Restores the exact float64 prices from float32 prices by rounding
+    to the number of decimals of the source prices
+
+    :param values: float32 (or float64) prices
+    :param decimals: number of decimals of the source prices
+
+    returns:
+      values: float64 prices
+    """
+    if values.dtype != np.float32:
+        return values
+    return np.round(values.astype(np.float64), decimals)
+
+
+def day_numbers_to_dates(day_numbers: np.ndarray):
+    """
+    Converts days since 1970-01-01 to date strings
+
+    :param day_numbers: integer day numbers
+
+    returns:
+      dates: numpy object array with dates as YYYY-MM-DD strings
+    """
+    return np.datetime_as_string(
+        np.asarray(day_numbers).astype("datetime64[D]"), unit="D"
+    ).astype(object)
+
+
+def _parse_uniques(series: pd.Series, parse):
+    """
+    Parses only the unique values of a column and maps them back to the rows
+    """
+    codes, uniques = pd.factorize(series)
+    return parse(uniques)[codes]
+
+
+def _day_numbers(dates: pd.Index):
+    """
+    Parses YYYY-MM-DD dates to days since 1970-01-01 (int32)
+    """
+    return (
+        pd.to_datetime(dates, format=MetaProcessFormat.META_DATE_FORMAT.value)
+        .to_numpy()
+        .astype("datetime64[D]")
+        .astype(np.int32)
+    )
+
+
+def _minutes(times: pd.Index):
+    """
+    Parses HH:MM times to minutes since midnight (int16)
+    """
+    times = pd.to_datetime(times, format="%H:%M")
+    return (times.hour * 60 + times.minute).to_numpy().astype(np.int16)
+
+
+def to_lean_dtypes(data_frame: pd.DataFrame, src_args: NamedTuple, decimals: int):
+    """
+    Converts source data to memory-lean dtypes: strings to categoricals,
+    the date to days since 1970-01-01 (int32), the time to minutes since
+    midnight (int16), prices to float32 if restore_prices gives back the
+    exact float64 values and volumes to int32 if they fit
+
+    :param data_frame: Pandas DataFrame with source rows
+    :param src_args: NamedTuple class with source configuration data
+    :param decimals: number of decimals of the source prices
+
+    returns:
+      data_frame: Pandas DataFrame with the source columns without missing values
+    """
+    # Unneeded columns and rows are dropped before any conversion
+    data_frame = data_frame.loc[:, src_args.src_columns].dropna()
+    lean_columns = {}
+    for column in src_args.src_columns:
+        values = data_frame[column]
+        if column == src_args.src_col_date and not is_integer_dtype(values):
+            lean_columns[column] = _parse_uniques(values, _day_numbers)
+        elif column == src_args.src_col_time and not is_integer_dtype(values):
+            lean_columns[column] = _parse_uniques(values, _minutes)
+        elif is_object_dtype(values) or is_string_dtype(values):
+            lean_columns[column] = values.astype("category")
+        elif is_float_dtype(values):
+            float32_values = values.to_numpy(dtype=np.float32)
+            if np.array_equal(restore_prices(float32_values, decimals), values):
+                lean_columns[column] = float32_values
+        elif is_integer_dtype(values) and values.dtype.itemsize > 4:
+            if len(values) == 0 or (
+                values.min() >= np.iinfo(np.int32).min
+                and values.max() <= np.iinfo(np.int32).max
+            ):
+                lean_columns[column] = values.to_numpy(dtype=np.int32)
+    for column, values in lean_columns.items():
+        data_frame[column] = values
+    return data_frame
+
+
+def concat_lean(frames: list):
+    """
+    Concatenates DataFrames with lean dtypes, categorical columns keep
+    the categorical dtype with sorted categories even if the categories
+    differ between the frames
+
+    :param frames: list of Pandas DataFrames with the same columns
+
+    returns:
+      data_frame: concatenated Pandas DataFrame
+    """
+    categorical = [
+        column
+        for column, dtype in frames[0].dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+    ]
+    data_frame = pd.concat(
+        [frame.drop(columns=categorical) for frame in frames], ignore_index=True
+    )
+    for column in categorical:
+        data_frame[column] = union_categoricals(
+            [frame[column] for frame in frames], sort_categories=True
+        )
+    return data_frame.loc[:, frames[0].columns]
@@ -0,0 +1,179 @@
+"""Data-quality validation of the Xetra source data"""
+
+import logging
+import threading
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from xetra.common.constants import ValidationReasons
+
+# two letter country code, nine alphanumeric characters and a check digit
+ISIN_PATTERN = r"[A-Z]{2}[A-Z0-9]{9}[0-9]"
+
+
+class SourceValidator:
+    """
+    Checks source rows with vectorised rules over whole columns and
+    collects the rejected rows with their reason code (the quarantine)
+
+    Rules (see ValidationReasons): missing values in the source columns,
+    malformed ISINs, negative prices, minimum price above maximum price,
+    start/end price outside of the minimum and maximum price, negative
+    traded volume and duplicate rows.
+    """
+
+    # column of the quarantine with the reason code of a rejected row
+    reason_col = "reason"
+
+    def __init__(self, src_args: NamedTuple):
+        """
+        Constructor for SourceValidator
+
+        :param src_args: NamedTuple class with source configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.src_args = src_args
+        self.counts = {reason.value: 0 for reason in ValidationReasons}
+        self.rows = 0
+        self._rejected = []
+        # Source files may be validated concurrently (run_pipeline)
+        self._lock = threading.Lock()
+
+    def _rule_masks(self, data_frame: pd.DataFrame):
+        """
+        Evaluates every rule on the whole columns
+
+        :param data_frame: Pandas DataFrame with source rows
+
+        returns:
+          masks: dict of reason code -> boolean numpy array (True = rejected)
+        """
+        src = self.src_args
+        columns = [column for column in src.src_columns if column in data_frame.columns]
+        # Comparisons with NaN are False, missing values only fail MISSING_VALUE
+        prices = {
+            column: data_frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            for column in [
+                src.src_col_start_price,
+                src.src_col_min_price,
+                src.src_col_max_price,
+                src.src_col_end_price,
+            ]
+            if column in data_frame.columns
+        }
+        min_price = prices[src.src_col_min_price]
+        max_price = prices[src.src_col_max_price]
+        out_of_range = np.zeros(len(data_frame), dtype=bool)
+        for column in [src.src_col_start_price, src.src_col_end_price]:
+            if column in prices:
+                out_of_range |= (prices[column] < min_price) | (
+                    prices[column] > max_price
+                )
+        # The ISIN pattern is only matched once per distinct ISIN
+        isin_codes, isins = pd.factorize(data_frame[src.src_col_isin])
+        malformed_isins = ~pd.Index(isins.astype(str)).str.fullmatch(ISIN_PATTERN)
+        malformed_isins = np.append(np.asarray(malformed_isins, dtype=bool), False)
+        volume = data_frame[src.src_col_traded_vol].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        return {
+            ValidationReasons.MISSING_VALUE.value: data_frame[columns]
+            .isna()
+            .any(axis=1)
+            .to_numpy(),
+            # code -1 of missing ISINs selects the appended False
+            ValidationReasons.MALFORMED_ISIN.value: malformed_isins[isin_codes],
+            ValidationReasons.NEGATIVE_PRICE.value: np.logical_or.reduce(
+                [values < 0 for values in prices.values()]
+            ),
+            ValidationReasons.MIN_ABOVE_MAX.value: min_price > max_price,
+            ValidationReasons.PRICE_OUT_OF_RANGE.value: out_of_range,
+            ValidationReasons.NEGATIVE_VOLUME.value: volume < 0,
+            ValidationReasons.DUPLICATE_ROW.value: self._duplicate_rows(
+                data_frame, columns
+            ),
+        }
+
+    @staticmethod
+    def _duplicate_rows(data_frame: pd.DataFrame, columns: list):
+        """
+        Finds rows equal to an earlier row in all columns
+
+        Equal rows have equal numeric columns, so the string columns are
+        only compared for the few rows whose 64 bit hash of the numeric
+        columns is not unique (hashing all strings would cost more than
+        the aggregation of the rows).
+
+        returns:
+          duplicated: boolean numpy array, True for the repeated rows
+        """
+        numeric = [column for column in columns if is_numeric_dtype(data_frame[column])]
+        if numeric:
+            candidates = (
+                pd.util.hash_pandas_object(data_frame[numeric], index=False)
+                .duplicated(keep=False)
+                .to_numpy()
+            )
+        else:
+            candidates = np.ones(len(data_frame), dtype=bool)
+        duplicated = np.zeros(len(data_frame), dtype=bool)
+        if candidates.any():
+            duplicated[candidates] = (
+                data_frame.loc[candidates, columns].duplicated().to_numpy()
+            )
+        return duplicated
+
+    def validate(self, data_frame: pd.DataFrame):
+        """
+        Removes the rows failing a rule and adds them to the quarantine
+
+        :param data_frame: Pandas DataFrame with the rows of one source file
+
+        returns:
+          data_frame: Pandas DataFrame with the valid rows (the input
+            DataFrame itself if all rows are valid)
+        """
+        if data_frame.empty:
+            return data_frame
+        masks = self._rule_masks(data_frame)
+        rejected = np.logical_or.reduce(list(masks.values()))
+        with self._lock:
+            self.rows += len(data_frame)
+            for reason, mask in masks.items():
+                self.counts[reason] += int(np.count_nonzero(mask))
+            if not rejected.any():
+                return data_frame
+            # the first failing rule is the reason code of a row
+            reasons = pd.Categorical.from_codes(
+                np.argmax(np.column_stack(list(masks.values()))[rejected], axis=1),
+                categories=list(masks),
+            )
+            self._rejected.append(
+                data_frame[rejected].assign(**{self.reason_col: reasons})
+            )
+        return data_frame[~rejected]
+
+    def quarantine(self):
+        """
+        returns:
+          data_frame: Pandas DataFrame with all rejected rows and their
+            reason code (categorical), empty if no row was rejected
+        """
+        if not self._rejected:
+            return pd.DataFrame()
+        return pd.concat(self._rejected, ignore_index=True)
+
+    def log_counts(self):
+        """
+        Logs the number of rows failing every rule
+        """
+        self._logger.info(
+            "Validated %s Xetra source rows, %s rows rejected.",
+            self.rows,
+            sum(len(rejected) for rejected in self._rejected),
+        )
+        for reason, count in self.counts.items():
+            self._logger.info("Validation rule %s: %s rows", reason, count)
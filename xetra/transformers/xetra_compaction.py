@@ -0,0 +1,182 @@
+"""Xetra Report Compaction Component"""
+
+import logging
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow as pa
+
+from xetra.common.constants import ReportManifestFormat, S3FileTypes
+from xetra.common.custom_exceptions import WrongFormatException
+from xetra.common.storage import StorageConnector, file_extension
+from xetra.common.report_manifest import ReportManifest
+
+
+class XetraCompactionConfig(NamedTuple):
+    """
+    Class for report compaction configuration data
+
+    comp_key: basic key of the monthly report 1 files, the month (YYYY-MM) is appended
+    comp_row_group_size: maximum number of rows per parquet row group
+    """
+
+    comp_key: str
+    comp_row_group_size: int = 100000
+
+
+class XetraReportCompaction:
+    """
+    Merges the report 1 files of the daily runs into one file per month,
+    only parquet report files are supported
+    """
+
+    def __init__(
+        self,
+        s3_bucket_trg: StorageConnector,
+        src_args: NamedTuple,
+        trg_args: NamedTuple,
+        comp_args: XetraCompactionConfig,
+        manifest_key: str = None,
+    ):
+        """
+        Constructor for XetraReportCompaction
+
+        :param s3_bucket_trg: connection to target S3 bucket with the report 1 files
+        :param src_args: NamedTuple class with source configuration data
+        :param trg_args: NamedTuple class with report 1 target configuration data
+        :param comp_args: NamedTuple class with compaction configuration data
+        :param manifest_key: key of the report manifest file that is updated
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_trg = s3_bucket_trg
+        self.src_args = src_args
+        self.trg_args = trg_args
+        self.comp_args = comp_args
+        self.manifest_key = manifest_key
+
+    def _month_key(self, month: str):
+        """
+        Key of the monthly report 1 file of month (YYYY-MM)
+        """
+        extension = file_extension(
+            self.trg_args.trg_format, self.trg_args.trg_compression
+        )
+        return f"{self.comp_args.comp_key}{month}.{extension}"
+
+    def daily_keys(self):
+        """
+        returns:
+          keys: sorted keys of the report 1 files not compacted yet (oldest
+            first, in the order of the manifest if a manifest key is given)
+        """
+        keys = sorted(
+            key
+            for key in self.s3_bucket_trg.list_files_in_prefix(self.trg_args.trg_key)
+            if not key.startswith(self.comp_args.comp_key)
+        )
+        if self.manifest_key:
+            # Unchanged reports are moved to the end of the manifest, files
+            # missing in the manifest are older than the manifest
+            positions = {
+                report[ReportManifestFormat.MANIFEST_KEY.value]: position
+                for position, report in enumerate(
+                    ReportManifest.read(self.manifest_key, self.s3_bucket_trg).reports
+                )
+            }
+            keys.sort(key=lambda key: positions.get(key, -1))
+        return keys
+
+    def merge(self, frames: list):
+        """
+        Merges report 1 DataFrames, for rows with the same ISIN and date
+        the row of the latest DataFrame is kept
+
+        :param frames: list of report 1 DataFrames (oldest first)
+
+        returns:
+          data_frame: merged DataFrame sorted by ISIN and date
+        """
+        isin, date = self.src_args.src_col_isin, self.src_args.src_col_date
+        data_frame = pd.concat(frames, ignore_index=True)
+        data_frame = data_frame.drop_duplicates(subset=[isin, date], keep="last")
+        return data_frame.sort_values(by=[isin, date], kind="stable", ignore_index=True)
+
+    def compact(self):
+        """
+        Merges all daily report 1 files into the monthly files of the months
+        they contain, deletes the daily files and updates the manifest
+
+        The daily files are read one after another and merged into the
+        months they contain, so only the merged months and one daily
+        file are in memory.
+
+        returns:
+          keys: keys of the written monthly files
+        """
+        if self.trg_args.trg_format != S3FileTypes.PARQUET.value:
+            self._logger.info(
+                "The file format %s is not supported for the compaction!",
+                self.trg_args.trg_format,
+            )
+            raise WrongFormatException
+        self._logger.info("Xetra report compaction started...")
+        daily_keys = self.daily_keys()
+        if not daily_keys:
+            self._logger.info("No report files to compact.")
+            return []
+        date = self.src_args.src_col_date
+        monthly_keys = set(
+            self.s3_bucket_trg.list_files_in_prefix(self.comp_args.comp_key)
+        )
+        months = {}
+        for key in daily_keys:
+            df_daily = self.s3_bucket_trg.read_parquet_to_df(key)
+            for month, df_part in df_daily.groupby(df_daily[date].str[:7]):
+                frames = [df_part]
+                if month in months:
+                    frames.insert(0, months[month])
+                elif self._month_key(month) in monthly_keys:
+                    # The existing monthly file is older than every daily file
+                    frames.insert(
+                        0, self.s3_bucket_trg.read_parquet_to_df(self._month_key(month))
+                    )
+                months[month] = self.merge(frames)
+        manifest = (
+            ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+            if self.manifest_key
+            else None
+        )
+        written_keys = []
+        for month in sorted(months):
+            month_key = self._month_key(month)
+            df_month = months.pop(month)
+            content = self.s3_bucket_trg.table_to_bytes(
+                pa.Table.from_pandas(df_month, preserve_index=False),
+                self.trg_args.trg_format,
+                self.comp_args.comp_row_group_size,
+                self.trg_args.trg_compression,
+            )
+            self.s3_bucket_trg.write_object(content, month_key)
+            written_keys.append(month_key)
+            if manifest is not None:
+                manifest.remove_reports([month_key])
+                manifest.add_report(
+                    month_key,
+                    ReportManifest.content_hash(content),
+                    len(content),
+                    ReportManifest.report_stats(
+                        df_month, date, self.src_args.src_col_isin
+                    ),
+                )
+        # Daily files are deleted only after all monthly files are written
+        self.s3_bucket_trg.delete_objects(daily_keys)
+        if manifest is not None:
+            manifest.remove_reports(daily_keys)
+            manifest.write(self.manifest_key, self.s3_bucket_trg)
+            self._logger.info("Xetra report manifest successfully updated.")
+        self._logger.info(
+            "Xetra report compaction finished: %s files merged into %s monthly files.",
+            len(daily_keys),
+            len(written_keys),
+        )
+        return written_keys
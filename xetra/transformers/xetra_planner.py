@@ -0,0 +1,312 @@
+"""Xetra Backfill Planner Component"""
+
+import logging
+import math
+import os
+from typing import NamedTuple
+
+from xetra.common.storage import StorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformers.xetra_transformer import XetraRunConfig, XetraSourceConfig
+
+MB = 1024 * 1024
+
+
+class XetraPlanConfig(NamedTuple):
+    """
+    Class for backfill planner configuration data, the throughput numbers
+    and expansion ratios are measured by benchmarks/bench_plan.py
+
+    plan_download_mb_s: source MB downloaded per second by one download worker
+    plan_parse_mb_s: source MB parsed per second by one parse worker
+    plan_aggregate_mb_s: source MB aggregated per second by one aggregate worker
+    plan_expansion: DataFrame bytes per source byte
+    plan_lean_expansion: DataFrame bytes per source byte with run_lean_dtypes
+    plan_memory_mb: memory available to the ETL job
+    plan_max_workers: upper bound for the recommended workers per stage
+    """
+
+    plan_download_mb_s: float = 25.0
+    plan_parse_mb_s: float = 70.0
+    plan_aggregate_mb_s: float = 350.0
+    plan_expansion: float = 2.0
+    plan_lean_expansion: float = 0.5
+    plan_memory_mb: int = 4096
+    plan_max_workers: int = 32
+
+
+class BackfillPlan(NamedTuple):
+    """
+    Estimate of an ETL run and the recommended run configuration
+
+    Sizes are in bytes, the runtime in seconds.
+    """
+
+    extract_date: str
+    dates: list
+    file_count: int
+    total_bytes: int
+    max_file_bytes: int
+    max_day_bytes: int
+    mode: str
+    memory_peak: int
+    runtime: float
+    recommended_mode: str
+    recommended_max_memory_mb: int
+    recommended_download_workers: int
+    recommended_parse_workers: int
+    recommended_aggregate_workers: int
+    recommended_queue_size: int
+
+
+class XetraBackfillPlanner:
+    """
+    Estimates size, memory peak and runtime of the next ETL run from the
+    source file listing, without downloading any source file
+    """
+
+    def __init__(
+        self,
+        s3_bucket_src: StorageConnector,
+        s3_bucket_trg: StorageConnector,
+        meta_key: str,
+        src_args: XetraSourceConfig,
+        run_args: XetraRunConfig = None,
+        plan_args: XetraPlanConfig = None,
+    ):
+        """
+        Constructor for XetraBackfillPlanner
+
+        :param s3_bucket_src: connection to source S3 bucket
+        :param s3_bucket_trg: connection to target S3 bucket with the meta file
+        :param meta_key: key of the meta file
+        :param src_args: NamedTouple class with source configuration data
+        :param run_args: NamedTouple class with run configuration data
+        :param plan_args: NamedTouple class with planner configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_src = s3_bucket_src
+        self.s3_bucket_trg = s3_bucket_trg
+        self.meta_key = meta_key
+        self.src_args = src_args
+        self.run_args = run_args or XetraRunConfig()
+        self.plan_args = plan_args or XetraPlanConfig()
+
+    def _mode(self):
+        """
+        returns:
+          mode: how the configured ETL run extracts the source files
+        """
+        if self.run_args.run_spill_dir:
+            return "spill"
+        if self.run_args.run_max_memory_mb:
+            return "batched"
+        if self.run_args.run_pipeline:
+            return "pipeline"
+        return "in-memory"
+
+    def _expansion(self):
+        """
+        returns:
+          expansion: DataFrame bytes per source byte of the configured run
+        """
+        if self.run_args.run_lean_dtypes:
+            return self.plan_args.plan_lean_expansion
+        return self.plan_args.plan_expansion
+
+    def _pipeline_memory(
+        self, max_file_bytes: int, download: int, parse: int, aggregate: int, queue: int
+    ):
+        """
+        Memory peak of the pipeline: every worker holds one file, the parse
+        and the aggregate stage queue up to queue files (raw bytes waiting
+        for the parse workers, DataFrames waiting for the aggregate workers)
+
+        returns:
+          memory: bytes
+        """
+        raw_files = download + queue + parse
+        parsed_files = parse + queue + aggregate
+        return max_file_bytes * (raw_files + parsed_files * self._expansion())
+
+    def _estimate(self, mode: str, total: int, max_file: int, max_day: int):
+        """
+        Memory peak and runtime of a run
+
+        :param mode: in-memory, pipeline, batched or spill
+        :param total: bytes of all source files
+        :param max_file: bytes of the largest source file
+        :param max_day: bytes of the source files of the largest day
+
+        returns:
+          memory_peak: bytes
+          runtime: seconds
+        """
+        run, plan = self.run_args, self.plan_args
+        total_mb = total / MB
+        if mode == "pipeline":
+            memory_peak = self._pipeline_memory(
+                max_file,
+                run.run_download_workers,
+                run.run_parse_workers,
+                run.run_aggregate_workers,
+                run.run_queue_size,
+            )
+            # The stages overlap, the slowest stage determines the runtime
+            runtime = max(
+                total_mb / (plan.plan_download_mb_s * run.run_download_workers),
+                total_mb / (plan.plan_parse_mb_s * run.run_parse_workers),
+                total_mb / (plan.plan_aggregate_mb_s * run.run_aggregate_workers),
+            )
+            return memory_peak, runtime
+        # Files are downloaded, parsed and aggregated one after another
+        runtime = (
+            total_mb / plan.plan_download_mb_s
+            + total_mb / plan.plan_parse_mb_s
+            + total_mb / plan.plan_aggregate_mb_s
+        )
+        if mode == "batched":
+            # The files of a batch are downloaded concurrently, a batch
+            # has at least one file
+            runtime -= (
+                total_mb / plan.plan_download_mb_s * (1 - 1 / run.run_download_workers)
+            )
+            memory_peak = max(
+                run.run_max_memory_mb * MB, 2 * max_file * self._expansion()
+            )
+        elif mode == "spill":
+            memory_peak = run.run_spill_memory_mb * MB + max_day * self._expansion()
+        else:
+            # concatenating the DataFrames of all files copies them once
+            memory_peak = 2 * total * self._expansion()
+        return memory_peak, runtime
+
+    def _recommend_workers(self):
+        """
+        Workers per stage, so downloading and aggregating keep up with
+        the parse workers (one per CPU)
+
+        returns:
+          download_workers, parse_workers, aggregate_workers
+        """
+        plan = self.plan_args
+        parse = max(1, min(os.cpu_count() or 1, plan.plan_max_workers))
+        parse_mb_s = parse * plan.plan_parse_mb_s
+        download = min(
+            math.ceil(parse_mb_s / plan.plan_download_mb_s), plan.plan_max_workers
+        )
+        aggregate = min(
+            math.ceil(parse_mb_s / plan.plan_aggregate_mb_s), plan.plan_max_workers
+        )
+        return download, parse, aggregate
+
+    def plan(self):
+        """
+        Lists the source files of the next ETL run and estimates it
+
+        :returns:
+          plan: BackfillPlan of the next ETL run
+        """
+        extract_date, dates = MetaProcess.return_date_list(
+            self.src_args.src_first_extract_date, self.meta_key, self.s3_bucket_trg
+        )
+        self._logger.info("Listing Xetra source files of %s dates...", len(dates))
+        day_sizes = {
+            date: list(self.s3_bucket_src.list_file_sizes(date).values())
+            for date in dates
+        }
+        sizes = [size for day in day_sizes.values() for size in day]
+        total = sum(sizes)
+        max_file = max(sizes, default=0)
+        max_day = max((sum(day) for day in day_sizes.values()), default=0)
+        mode = self._mode()
+        memory_peak, runtime = self._estimate(mode, total, max_file, max_day)
+        # Recommendations for the memory budget
+        budget = self.plan_args.plan_memory_mb * MB
+        expansion = self._expansion()
+        download, parse, aggregate = self._recommend_workers()
+        queue = 1
+        while (
+            queue < 16
+            and self._pipeline_memory(max_file, download, parse, aggregate, queue + 1)
+            <= budget
+        ):
+            queue += 1
+        if 2 * total * expansion <= budget:
+            recommended_mode = "in-memory"
+        elif (
+            self._pipeline_memory(max_file, download, parse, aggregate, queue) <= budget
+        ):
+            recommended_mode = "pipeline"
+        elif 2 * max_file * expansion <= budget:
+            recommended_mode = "batched"
+        else:
+            recommended_mode = "spill"
+        # run_max_memory_mb for batched runs: the budget, but not more than
+        # all files need, None when even the largest file does not fit
+        max_memory_mb = (
+            min(
+                self.plan_args.plan_memory_mb,
+                math.ceil(2 * total * expansion / MB),
+            )
+            if 2 * max_file * expansion <= budget
+            else None
+        )
+        return BackfillPlan(
+            extract_date=extract_date,
+            dates=dates,
+            file_count=len(sizes),
+            total_bytes=total,
+            max_file_bytes=max_file,
+            max_day_bytes=max_day,
+            mode=mode,
+            memory_peak=int(memory_peak),
+            runtime=runtime,
+            recommended_mode=recommended_mode,
+            recommended_max_memory_mb=max_memory_mb,
+            recommended_download_workers=download,
+            recommended_parse_workers=parse,
+            recommended_aggregate_workers=aggregate,
+            recommended_queue_size=queue,
+        )
+
+    def report(self, plan: BackfillPlan):
+        """
+        Formats a plan for the console
+
+        :param plan: BackfillPlan returned by plan()
+
+        :returns:
+          text: plan as text with one value per line
+        """
+        if not plan.dates:
+            return "No new Xetra source dates to process."
+        budget_mb = self.plan_args.plan_memory_mb
+        fits = "fits" if plan.memory_peak <= budget_mb * MB else "does NOT fit"
+        rows = [
+            (
+                "dates",
+                f"{plan.dates[0]} .. {plan.dates[-1]} ({len(plan.dates)} days, "
+                f"report from {plan.extract_date})",
+            ),
+            ("source files", plan.file_count),
+            (
+                "source size",
+                f"{plan.total_bytes / MB:.1f} MB (largest file "
+                f"{plan.max_file_bytes / MB:.1f} MB, largest day "
+                f"{plan.max_day_bytes / MB:.1f} MB)",
+            ),
+            ("configured mode", plan.mode),
+            (
+                "estimated memory peak",
+                f"{plan.memory_peak / MB:.0f} MB ({fits} into {budget_mb} MB)",
+            ),
+            ("estimated runtime", f"{plan.runtime / 60:.1f} min"),
+            ("recommended mode", plan.recommended_mode),
+            ("run_max_memory_mb", plan.recommended_max_memory_mb or "-"),
+            ("run_download_workers", plan.recommended_download_workers),
+            ("run_parse_workers", plan.recommended_parse_workers),
+            ("run_aggregate_workers", plan.recommended_aggregate_workers),
+            ("run_queue_size", plan.recommended_queue_size),
+        ]
+        return "\n".join(f"{label + ':':24s}{value}" for label, value in rows)
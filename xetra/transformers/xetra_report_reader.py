@@ -0,0 +1,241 @@
+"""Xetra Report 1 Reader Component"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from xetra.common.storage import StorageConnector
+from xetra.common.constants import MetaProcessFormat, ReportManifestFormat
+from xetra.common.report_manifest import ReportManifest
+from xetra.common.s3_file import parquet_chunk_ranges
+
+
+def _overlaps(low, high, first, last):
+    """
+    Checks if the range [low, high] overlaps the range [first, last],
+    unknown (None) bounds never exclude anything
+    """
+    if low is None or high is None:
+        return True
+    return (last is None or low <= last) and (first is None or high >= first)
+
+
+def _contains_any(low, high, values: list):
+    """
+    Checks if one of the values is in the range [low, high], an empty
+    values list or unknown (None) bounds never exclude anything
+    """
+    if not values or low is None or high is None:
+        return True
+    return any(low <= value <= high for value in values)
+
+
+class XetraReportReader:
+    """
+    Reads report 1 rows by date range and ISINs, only report files and
+    parquet row groups that can contain matching rows are read
+    """
+
+    def __init__(
+        self,
+        s3_bucket_trg: StorageConnector,
+        src_args: NamedTuple,
+        trg_args: NamedTuple,
+        manifest_key: str = None,
+        max_workers: int = 8,
+    ):
+        """
+        Constructor for XetraReportReader
+
+        :param s3_bucket_trg: connection to target S3 bucket with the report 1 files
+        :param src_args: NamedTuple class with source configuration data
+        :param trg_args: NamedTuple class with report 1 target configuration data
+        :param manifest_key: key of the report manifest file, if not given the
+          report files are listed and pruned by the processing date in the key
+        :param max_workers: number of report files that are fetched concurrently
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_trg = s3_bucket_trg
+        self.src_args = src_args
+        self.trg_args = trg_args
+        self.manifest_key = manifest_key
+        self.max_workers = max_workers
+
+    def _key_date(self, key: str):
+        """
+        Processing date encoded in a report 1 key, None if it cannot be parsed
+        """
+        key_date = key[len(self.trg_args.trg_key) :].rsplit(".", 1)[0]
+        try:
+            return (
+                datetime.strptime(key_date, self.trg_args.trg_key_date_format)
+                .date()
+                .strftime(MetaProcessFormat.META_DATE_FORMAT.value)
+            )
+        except ValueError:
+            return None
+
+    def report_keys(
+        self, first_date: str = None, last_date: str = None, isins: list = None
+    ):
+        """
+        Selects the report files that can contain rows of the date range and ISINs
+
+        :param first_date: first date (YYYY-MM-DD) of the rows, None for no limit
+        :param last_date: last date (YYYY-MM-DD) of the rows, None for no limit
+        :param isins: ISINs of the rows, None for all ISINs
+
+        returns:
+          keys: keys of the report files in the order they were written
+        """
+        if self.manifest_key:
+            manifest = ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+            return [
+                report[ReportManifestFormat.MANIFEST_KEY.value]
+                for report in manifest.reports
+                if _overlaps(
+                    report.get(ReportManifestFormat.MANIFEST_DATE_MIN.value),
+                    report.get(ReportManifestFormat.MANIFEST_DATE_MAX.value),
+                    first_date,
+                    last_date,
+                )
+                and _contains_any(
+                    report.get(ReportManifestFormat.MANIFEST_ISIN_MIN.value),
+                    report.get(ReportManifestFormat.MANIFEST_ISIN_MAX.value),
+                    isins,
+                )
+            ]
+        # Compacted files (no processing date in the key) are older than
+        # every daily file, a daily file cannot hold dates after the day
+        # it was processed
+        return [
+            key
+            for key in sorted(
+                self.s3_bucket_trg.list_files_in_prefix(self.trg_args.trg_key),
+                key=lambda key: (self._key_date(key) is not None, key),
+            )
+            if first_date is None
+            or self._key_date(key) is None
+            or self._key_date(key) >= first_date
+        ]
+
+    def read_report(
+        self,
+        key: str,
+        first_date: str = None,
+        last_date: str = None,
+        isins: list = None,
+        columns: list = None,
+    ):
+        """
+        Reads the matching rows of one report file, row groups are skipped
+        if their parquet statistics exclude the date range and ISINs
+
+        :param key: key of the report file
+        :param first_date: first date (YYYY-MM-DD) of the rows, None for no limit
+        :param last_date: last date (YYYY-MM-DD) of the rows, None for no limit
+        :param isins: ISINs of the rows, None for all ISINs
+        :param columns: report columns that are read, None for all columns
+
+        returns:
+          table: pyarrow Table with the matching rows
+        """
+        isin_col, date_col = self.src_args.src_col_isin, self.src_args.src_col_date
+        # Only the footer (cached per ETag) and the column chunks of the
+        # selected row groups are fetched, with byte-range GETs
+        s3_file = self.s3_bucket_trg.open_object(key)
+        metadata = self.s3_bucket_trg.read_parquet_metadata(s3_file)
+        names = metadata.schema.names
+        row_groups = []
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            date_stats = row_group.column(names.index(date_col)).statistics
+            isin_stats = row_group.column(names.index(isin_col)).statistics
+            if (
+                date_stats is None
+                or not date_stats.has_min_max
+                or _overlaps(date_stats.min, date_stats.max, first_date, last_date)
+            ) and (
+                isin_stats is None
+                or not isin_stats.has_min_max
+                or _contains_any(isin_stats.min, isin_stats.max, isins)
+            ):
+                row_groups.append(index)
+        self.s3_bucket_trg.prefetch(
+            s3_file, parquet_chunk_ranges(metadata, row_groups, columns)
+        )
+        parquet_file = pq.ParquetFile(s3_file, metadata=metadata)
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+        # Filtering the rows of the selected row groups
+        conditions = []
+        if first_date is not None:
+            conditions.append(pc.greater_equal(table[date_col], first_date))
+        if last_date is not None:
+            conditions.append(pc.less_equal(table[date_col], last_date))
+        if isins:
+            conditions.append(
+                pc.is_in(
+                    table[isin_col],
+                    value_set=pa.array(isins, table.schema.field(isin_col).type),
+                )
+            )
+        if not conditions:
+            return table
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask = pc.and_(mask, condition)
+        return table.filter(mask)
+
+    def read(
+        self,
+        first_date: str = None,
+        last_date: str = None,
+        isins: list = None,
+        columns: list = None,
+    ):
+        """
+        Reads the report 1 rows of a date range and ISINs, the report files
+        are fetched concurrently and for rows in several report files
+        (reruns) the row of the latest file is kept
+
+        :param first_date: first date (YYYY-MM-DD) of the rows, None for no limit
+        :param last_date: last date (YYYY-MM-DD) of the rows, None for no limit
+        :param isins: ISINs of the rows, None for all ISINs
+        :param columns: report columns besides ISIN and date, None for all columns
+
+        returns:
+          data_frame: Pandas DataFrame sorted by ISIN and date
+        """
+        isin_col, date_col = self.src_args.src_col_isin, self.src_args.src_col_date
+        if columns is not None:
+            columns = [isin_col, date_col] + [
+                column for column in columns if column not in (isin_col, date_col)
+            ]
+        keys = self.report_keys(first_date, last_date, isins)
+        self._logger.info("Reading %s report 1 files.", len(keys))
+        if not keys:
+            return pd.DataFrame(columns=columns or [isin_col, date_col])
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            tables = list(
+                executor.map(
+                    lambda key: self.read_report(
+                        key, first_date, last_date, isins, columns
+                    ),
+                    keys,
+                )
+            )
+        data_frame = pd.concat(
+            [table.to_pandas() for table in tables], ignore_index=True
+        )
+        data_frame = data_frame.drop_duplicates(
+            subset=[isin_col, date_col], keep="last"
+        )
+        return data_frame.sort_values(
+            by=[isin_col, date_col], kind="stable", ignore_index=True
+        )
@@ -0,0 +1,260 @@
+"""Xetra Rolling Window Report Component"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from xetra.common.storage import StorageConnector
+from xetra.common.constants import MetaProcessFormat, S3FileTypes
+
+
+class XetraRollingConfig(NamedTuple):
+    """
+    Class for rolling window report configuration data
+
+    roll_windows: window lengths in trading days, e.g. [5, 20, 60]
+    roll_col_return: column name pattern for the N-day return in %, {window} is replaced
+    roll_col_volatility: column name pattern for the realised volatility in %
+    roll_col_avg_vol: column name pattern for the average traded volume
+    roll_key: basic key of the rolling report file
+    roll_key_date_format: date format of the rolling report file key
+    roll_format: file format of the rolling report file
+    roll_lookback_days: calendar days of report 1 history read before the new dates
+    """
+
+    roll_windows: list
+    roll_col_return: str
+    roll_col_volatility: str
+    roll_col_avg_vol: str
+    roll_key: str
+    roll_key_date_format: str
+    roll_format: str
+    roll_lookback_days: int = None
+
+
+def _group_positions(group_keys: np.ndarray):
+    """
+    Position of every row inside its group for arrays sorted by group
+
+    :param group_keys: group key per row, rows of one group are contiguous
+
+    returns:
+      positions: 0 for the first row of a group, 1 for the second, ...
+    """
+    index = np.arange(len(group_keys))
+    is_start = np.ones(len(group_keys), dtype=bool)
+    is_start[1:] = group_keys[1:] != group_keys[:-1]
+    starts = np.flatnonzero(is_start)
+    return index - starts[np.cumsum(is_start) - 1]
+
+
+def _rolling_sum(values: np.ndarray, positions: np.ndarray, window: int):
+    """
+    Rolling sum over group-sorted values using cumulative sums
+
+    :param values: float values sorted by group
+    :param positions: positions of the rows inside their group
+    :param window: window length in rows
+
+    returns:
+      result: sum of the last window values of the group, NaN if the
+      group has less than window rows up to the current row or one of
+      the values is NaN
+    """
+    missing = np.isnan(values)
+    cumsum = np.concatenate(
+        ([0.0], np.cumsum(np.where(missing, 0.0, values), dtype=np.float64))
+    )
+    cummissing = np.concatenate(([0], np.cumsum(missing)))
+    result = np.full(len(values), np.nan)
+    valid = np.flatnonzero(positions >= window - 1)
+    valid = valid[cummissing[valid + 1] == cummissing[valid + 1 - window]]
+    result[valid] = cumsum[valid + 1] - cumsum[valid + 1 - window]
+    return result
+
+
+class XetraRollingReport:
+    """
+    Creates rolling window statistics per ISIN from the report 1 history
+    """
+
+    def __init__(
+        self,
+        s3_bucket_trg: StorageConnector,
+        src_args: NamedTuple,
+        trg_args: NamedTuple,
+        roll_args: XetraRollingConfig,
+    ):
+        """
+        Constructor for XetraRollingReport
+
+        :param s3_bucket_trg: connection to target S3 bucket with the report 1 files
+        :param src_args: NamedTuple class with source configuration data
+        :param trg_args: NamedTuple class with report 1 target configuration data
+        :param roll_args: NamedTuple class with rolling report configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_trg = s3_bucket_trg
+        self.src_args = src_args
+        self.trg_args = trg_args
+        self.roll_args = roll_args
+
+    def _lookback_days(self):
+        """
+        Calendar days of history needed to fill the longest window
+        """
+        if self.roll_args.roll_lookback_days is not None:
+            return self.roll_args.roll_lookback_days
+        # Two calendar days per trading day cover weekends and holidays
+        return 2 * max(self.roll_args.roll_windows) + 1
+
+    def _key_date(self, key: str):
+        """
+        Processing date encoded in a report 1 key, None if it cannot be parsed
+        """
+        # Compressed csv files have two extensions
+        key_date = key[len(self.trg_args.trg_key) :].split(".", 1)[0]
+        try:
+            return datetime.strptime(key_date, self.trg_args.trg_key_date_format).date()
+        except ValueError:
+            return None
+
+    def read_history(self, first_date: str):
+        """
+        Reads the persisted report 1 history needed for the rolling windows
+        of all dates from first_date on
+
+        :param first_date: first date the rolling statistics are created for
+
+        returns:
+          data_frame: report 1 rows (ISIN, date, closing price, traded volume)
+        """
+        cutoff = datetime.strptime(
+            first_date, MetaProcessFormat.META_DATE_FORMAT.value
+        ).date() - timedelta(days=self._lookback_days())
+        # Report files processed before the cutoff cannot hold data after it
+        keys = [
+            key
+            for key in sorted(
+                self.s3_bucket_trg.list_files_in_prefix(self.trg_args.trg_key)
+            )
+            if self._key_date(key) is None or self._key_date(key) >= cutoff
+        ]
+        columns = [
+            self.src_args.src_col_isin,
+            self.src_args.src_col_date,
+            self.trg_args.trg_col_clos_price,
+            self.trg_args.trg_col_dail_trad_vol,
+        ]
+        if not keys:
+            return pd.DataFrame(columns=columns)
+        data_frame = pd.concat(
+            [self._read_report(key, columns) for key in keys], ignore_index=True
+        )
+        cutoff = cutoff.strftime(MetaProcessFormat.META_DATE_FORMAT.value)
+        return data_frame[data_frame[self.src_args.src_col_date] >= cutoff]
+
+    def _read_report(self, key: str, columns: list):
+        """
+        Reads columns of a report 1 file in the target file format
+
+        :param key: key of the report 1 file
+        :param columns: columns to read
+
+        returns:
+          data_frame: Pandas DataFrame with the columns
+        """
+        if self.trg_args.trg_format == S3FileTypes.CSV.value:
+            # Compressed csv files are decompressed while they are parsed
+            return self.s3_bucket_trg.read_csv_to_df(key).loc[:, columns]
+        return self.s3_bucket_trg.read_parquet_to_df(key, columns=columns)
+
+    def transform(self, data_frame: pd.DataFrame, df_history: pd.DataFrame):
+        """
+        Calculates N-day return, realised volatility and average traded
+        volume per ISIN for the dates in data_frame
+
+        :param data_frame: new report 1 rows
+        :param df_history: previously persisted report 1 rows
+
+        returns:
+          data_frame: rolling statistics for the ISINs and dates of data_frame
+        """
+        isin_col = self.src_args.src_col_isin
+        date_col = self.src_args.src_col_date
+        new_dates = data_frame[date_col].unique()
+        # Newest rows win for ISIN and dates contained in several reports
+        data_frame = (
+            pd.concat(
+                [df_history, data_frame.loc[:, df_history.columns]], ignore_index=True
+            )
+            .drop_duplicates(subset=[isin_col, date_col], keep="last")
+            .sort_values(by=[isin_col, date_col], kind="stable")
+            .reset_index(drop=True)
+        )
+        isins = data_frame[isin_col].to_numpy()
+        close = data_frame[self.trg_args.trg_col_clos_price].to_numpy(dtype=np.float64)
+        volume = data_frame[self.trg_args.trg_col_dail_trad_vol].to_numpy(
+            dtype=np.float64
+        )
+        positions = _group_positions(isins)
+        # Closing prices of 0 give NaN returns instead of inf
+        base_close = np.where(close == 0, np.nan, close)
+        # Daily returns, 0 for the first row of an ISIN (masked by positions)
+        returns = np.zeros(len(close))
+        returns[1:] = close[1:] / base_close[:-1] - 1
+        returns[positions == 0] = 0.0
+        df_report = data_frame.loc[:, [isin_col, date_col]]
+        for window in self.roll_args.roll_windows:
+            # N-day return: closing price compared to the one N trading days ago
+            window_return = np.full(len(close), np.nan)
+            valid = np.flatnonzero(positions >= window)
+            window_return[valid] = (close[valid] / base_close[valid - window] - 1) * 100
+            # Realised volatility: standard deviation of the last N daily returns
+            sum_ret = _rolling_sum(returns, positions - 1, window)
+            sum_sq = _rolling_sum(returns**2, positions - 1, window)
+            variance = np.maximum(sum_sq - sum_ret**2 / window, 0) / max(window - 1, 1)
+            df_report[self.roll_args.roll_col_return.format(window=window)] = (
+                window_return
+            )
+            df_report[self.roll_args.roll_col_volatility.format(window=window)] = (
+                np.sqrt(variance) * 100
+            )
+            df_report[self.roll_args.roll_col_avg_vol.format(window=window)] = (
+                _rolling_sum(volume, positions, window) / window
+            )
+        df_report = df_report[df_report[date_col].isin(new_dates)]
+        return df_report.round(decimals=2).reset_index(drop=True)
+
+    def load(self, data_frame: pd.DataFrame):
+        """
+        Saves the rolling report to the target
+
+        :param data_frame: Pandas DataFrame as Input
+        """
+        target_key = (
+            f"{self.roll_args.roll_key}"
+            f"{datetime.today().strftime(self.roll_args.roll_key_date_format)}."
+            f"{self.roll_args.roll_format}"
+        )
+        self.s3_bucket_trg.write_df_to_s3(
+            data_frame, target_key, self.roll_args.roll_format
+        )
+        self._logger.info("Xetra rolling report successfully written.")
+        return True
+
+    def run(self, data_frame: pd.DataFrame):
+        """
+        Creates the rolling report for the dates of a new report 1
+
+        :param data_frame: report 1 DataFrame of the current run
+        """
+        if data_frame.empty:
+            self._logger.info("The dataframe is empty. No rolling report is created.")
+            return True
+        df_history = self.read_history(data_frame[self.src_args.src_col_date].min())
+        self.load(self.transform(data_frame, df_history))
+        return True
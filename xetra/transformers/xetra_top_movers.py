@@ -0,0 +1,154 @@
+"""Xetra Top Movers Report Component"""
+
+import logging
+from datetime import datetime
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from xetra.common.storage import StorageConnector
+from xetra.transformers.kernels import group_starts
+
+
+class XetraTopMoversConfig(NamedTuple):
+    """
+    Class for top movers report configuration data
+
+    top_n: number of ISINs per category and day
+    top_col_category: column name for the category (gainers, losers, most traded)
+    top_col_rank: column name for the rank inside the category
+    top_key: basic key of the top movers file
+    top_key_date_format: date format of the top movers file key
+    top_format: file format of the top movers file
+    """
+
+    top_n: int
+    top_col_category: str
+    top_col_rank: str
+    top_key: str
+    top_key_date_format: str
+    top_format: str
+
+
+def top_k_indices(values: np.ndarray, k: int, largest: bool = True):
+    """
+    Indices of the k largest (or smallest) values without a full sort
+
+    Only the k selected values are sorted, NaN values are never selected.
+
+    :param values: values to select from
+    :param k: number of indices to return
+    :param largest: True for the largest, False for the smallest values
+
+    returns:
+      indices: indices into values ordered from the best to the k-th best value
+    """
+    candidates = np.flatnonzero(~np.isnan(values))
+    keys = -values[candidates] if largest else values[candidates]
+    if k < len(candidates):
+        selected = np.argpartition(keys, k - 1)[:k]
+    else:
+        selected = np.arange(len(candidates))
+    return candidates[selected[np.argsort(keys[selected], kind="stable")]]
+
+
+class XetraTopMovers:
+    """
+    Creates the daily top gainers, losers and most traded ISINs from report 1
+
+    The ranking is computed after report 1 is loaded, from the aggregates
+    of all days of the run (report 1 is written as one object per run).
+    """
+
+    def __init__(
+        self,
+        s3_bucket_trg: StorageConnector,
+        src_args: NamedTuple,
+        trg_args: NamedTuple,
+        top_args: XetraTopMoversConfig,
+    ):
+        """
+        Constructor for XetraTopMovers
+
+        :param s3_bucket_trg: connection to target S3 bucket
+        :param src_args: NamedTuple class with source configuration data
+        :param trg_args: NamedTuple class with report 1 target configuration data
+        :param top_args: NamedTuple class with top movers configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_trg = s3_bucket_trg
+        self.src_args = src_args
+        self.trg_args = trg_args
+        self.top_args = top_args
+
+    def transform(self, data_frame: pd.DataFrame):
+        """
+        Selects the top ISINs per day from the report 1 aggregates
+
+        :param data_frame: report 1 DataFrame
+
+        returns:
+          data_frame: one row per day, category and rank
+        """
+        # Sorting the rows by day once (stable, ties keep the row order)
+        dates = data_frame[self.src_args.src_col_date].to_numpy()
+        order = np.argsort(dates, kind="stable")
+        starts = group_starts([dates[order]])
+        ends = np.append(starts[1:], len(order))
+        change = data_frame[self.trg_args.trg_col_ch_prev_clos].to_numpy(
+            dtype=np.float64
+        )
+        volume = data_frame[self.trg_args.trg_col_dail_trad_vol].to_numpy(
+            dtype=np.float64
+        )
+        categories = (
+            ("gainers", change, True),
+            ("losers", change, False),
+            ("most_traded", volume, True),
+        )
+        frames = []
+        for start, end in zip(starts, ends):
+            rows = order[start:end]
+            for category, values, largest in categories:
+                selected = rows[
+                    top_k_indices(values[rows], self.top_args.top_n, largest)
+                ]
+                df_top = data_frame.iloc[selected]
+                df_top.insert(
+                    0, self.top_args.top_col_rank, np.arange(1, len(selected) + 1)
+                )
+                df_top.insert(0, self.top_args.top_col_category, category)
+                frames.append(df_top)
+        return pd.concat(frames, ignore_index=True)
+
+    def load(self, data_frame: pd.DataFrame):
+        """
+        Saves the top movers report to the target
+
+        :param data_frame: Pandas DataFrame as Input
+        """
+        target_key = (
+            f"{self.top_args.top_key}"
+            f"{datetime.today().strftime(self.top_args.top_key_date_format)}."
+            f"{self.top_args.top_format}"
+        )
+        self.s3_bucket_trg.write_df_to_s3(
+            data_frame, target_key, self.top_args.top_format
+        )
+        self._logger.info("Xetra top movers report successfully written.")
+        return True
+
+    def run(self, data_frame: pd.DataFrame):
+        """
+        Creates the top movers report for the days of a new report 1
+
+        :param data_frame: report 1 DataFrame of the current run
+        """
+        if data_frame.empty:
+            self._logger.info(
+                "The dataframe is empty. No top movers report is created."
+            )
+            return True
+        self.load(self.transform(data_frame))
+        return True
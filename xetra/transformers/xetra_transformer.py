@@ -1,13 +1,37 @@
 """Xetra ETL Component"""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from io import BytesIO
 from typing import NamedTuple
 
 import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_integer_dtype
 
-from xetra.common.s3 import S3BucketConnector
+from xetra.common.storage import StorageConnector, file_extension
+from xetra.common.constants import (
+    ReportManifestFormat,
+    S3Compressions,
+    S3FileTypes,
+    SourceFormats,
+    TransformEngines,
+)
 from xetra.common.meta_process import MetaProcess
+from xetra.common.isin_dictionary import IsinDictionary
+from xetra.common.report_manifest import ReportManifest
+from xetra.common.spill import SpillStore
+from xetra.common.batching import AdaptiveBatcher, InFlightBytes
+from xetra.common.profiling import StageProfiler
+from xetra.common.pipeline import PipelineStage, run_pipeline
+from xetra.transformers.engines.base import get_engine
+from xetra.transformers.engines.pandas_engine import PandasEngine
+from xetra.transformers.lean_dtypes import concat_lean, to_lean_dtypes
+from xetra.transformers.validation import SourceValidator
+from xetra.transformers.dedup import SourceDeduplicator
 
 
 class XetraSourceConfig(NamedTuple):
@@ -23,6 +47,7 @@ class XetraSourceConfig(NamedTuple):
     src_col_min_price: column name for minimum price in source
     src_col_max_price: column name for maximum price in source
     src_col_traded_vol: column name for traded volumne in source
+    src_col_end_price: column name for ending price in source (optional)
     """
 
     src_first_extract_date: str
@@ -34,6 +59,7 @@ class XetraSourceConfig(NamedTuple):
     src_col_min_price: str
     src_col_max_price: str
     src_col_traded_vol: str
+    src_col_end_price: str = None
 
 
 class XetraTargetConfig(NamedTuple):
@@ -51,6 +77,10 @@ class XetraTargetConfig(NamedTuple):
     trg_key: basic key of target file
     trg_key_date_format: date format of target file key
     trg_format: file format of the target file
+    trg_col_vwap: column name for volume-weighted average price in target (optional)
+    trg_col_turnover: column name for daily turnover in EUR in target (optional)
+    trg_compression: compression of the target file, see S3Compressions (optional,
+      csv files get the compression suffix, parquet files use it as column codec)
     """
 
     trg_col_isin: str
@@ -64,6 +94,57 @@ class XetraTargetConfig(NamedTuple):
     trg_key: str
     trg_key_date_format: str
     trg_format: str
+    trg_col_vwap: str = None
+    trg_col_turnover: str = None
+    trg_compression: str = None
+
+
+class XetraRunConfig(NamedTuple):
+    """
+    Class for run configuration data
+
+    run_spill_dir: local directory for spilling source data, enables the
+      out-of-core transformation if given
+    run_spill_memory_mb: memory budget for source data before it is spilled
+    run_engine: transform engine for report 1, see TransformEngines (the
+      out-of-core transformation always aggregates with pandas)
+    run_jit: use the numba compiled group reduction kernel of the pandas engine
+    run_lean_dtypes: read the source data with memory-lean dtypes (pandas engine)
+    run_price_decimals: maximum number of decimals of the source prices
+    run_pipeline: download, parse and aggregate the source files concurrently
+      in a pipeline (always aggregates with pandas)
+    run_download_workers: threads downloading source files in the pipeline
+    run_parse_workers: threads parsing source files in the pipeline
+    run_aggregate_workers: threads aggregating source files in the pipeline
+    run_queue_size: source files waiting per pipeline stage
+    run_max_memory_mb: memory budget for source data, enables extracting and
+      aggregating the source files in batches sized to fit into it (always
+      aggregates with pandas, the batches are read with run_download_workers)
+    run_validate: reject source rows failing the data-quality rules of
+      SourceValidator before the transformation (engines consuming pandas
+      source data)
+    run_quarantine_key: basic key of the file with the rejected rows and
+      their reason codes (zstd compressed parquet), not written if None
+    run_dedup: skip source files with the same ETag as an earlier file and
+      drop rows with the ISIN, date and time of an earlier row (the rows
+      only for engines consuming pandas source data)
+    """
+
+    run_spill_dir: str = None
+    run_spill_memory_mb: int = 1024
+    run_engine: str = TransformEngines.PANDAS.value
+    run_jit: bool = False
+    run_lean_dtypes: bool = False
+    run_price_decimals: int = 4
+    run_pipeline: bool = False
+    run_download_workers: int = 8
+    run_parse_workers: int = 2
+    run_aggregate_workers: int = 1
+    run_queue_size: int = 4
+    run_max_memory_mb: int = None
+    run_validate: bool = False
+    run_quarantine_key: str = None
+    run_dedup: bool = False
 
 
 class XetraETL:
@@ -73,11 +154,17 @@ class XetraETL:
 
     def __init__(
         self,
-        s3_bucket_src: S3BucketConnector,
-        s3_bucket_trg: S3BucketConnector,
+        s3_bucket_src: StorageConnector,
+        s3_bucket_trg: StorageConnector,
         meta_key: str,
         src_args: XetraSourceConfig,
         trg_args: XetraTargetConfig,
+        derived_reports: list = None,
+        isin_dict_key: str = None,
+        run_args: XetraRunConfig = None,
+        manifest_key: str = None,
+        profiler: StageProfiler = None,
+        extract_dates: tuple = None,
     ):
         """
         Constructor for XetraTransformer
@@ -87,6 +174,18 @@ class XetraETL:
         :param meta_key: used as self.meta_key -> key of meta file
         :param src_args: NamedTouple class with source configuration data
         :param trg_args: NamedTouple class with target configuration data
+        :param derived_reports: reports with a run(data_frame) method that are
+          created from the report 1 DataFrame after loading it
+        :param isin_dict_key: key of the ISIN dictionary file, if given the
+          ISINs are encoded as int32 codes from extract until load (for
+          engines consuming pandas source data)
+        :param run_args: NamedTouple class with run configuration data
+        :param manifest_key: key of the report manifest file, if given every
+          report is listed with its statistics and reports with the same
+          content as an already written report are not written again
+        :param profiler: StageProfiler profiling every stage of etl_report1
+        :param extract_dates: (extract_date, extract_date_list) already returned
+          by MetaProcess.return_date_list, the meta file is read if not given
         """
         self._logger = logging.getLogger(__name__)
         self.s3_bucket_src = s3_bucket_src
@@ -94,31 +193,202 @@ class XetraETL:
         self.meta_key = meta_key
         self.src_args = src_args
         self.trg_args = trg_args
-        self.extract_date, self.extract_date_list = MetaProcess.return_date_list(
-            self.src_args.src_first_extract_date, self.meta_key, self.s3_bucket_trg
+        self.derived_reports = derived_reports or []
+        self.run_args = run_args or XetraRunConfig()
+        self.engine = get_engine(
+            self.run_args.run_engine, src_args, trg_args, self.run_args
+        )
+        self.extract_date, self.extract_date_list = (
+            extract_dates
+            or MetaProcess.return_date_list(
+                self.src_args.src_first_extract_date, self.meta_key, self.s3_bucket_trg
+            )
         )
         self.meta_update_list = [
             date for date in self.extract_date_list if date >= self.extract_date
         ]
+        self.isin_dict_key = isin_dict_key
+        # The ISIN dictionary is read on first use (see isin_dict)
+        self._isin_dict = None
+        self.manifest_key = manifest_key
+        self.profiler = profiler
+        self.validator = (
+            SourceValidator(src_args) if self.run_args.run_validate else None
+        )
+        if (
+            self.validator is not None
+            and self.engine.source_format != SourceFormats.PANDAS.value
+        ):
+            self._logger.warning(
+                "The engine %s does not consume pandas source data, "
+                "the source data is not validated.",
+                self.run_args.run_engine,
+            )
+        self.dedup = SourceDeduplicator(src_args) if self.run_args.run_dedup else None
+        if (
+            self.dedup is not None
+            and self.engine.source_format != SourceFormats.PANDAS.value
+        ):
+            self._logger.warning(
+                "The engine %s does not consume pandas source data, "
+                "only repeated source files are skipped.",
+                self.run_args.run_engine,
+            )
+        # Source files may be parsed concurrently (run_pipeline, run_max_memory_mb)
+        self._isin_dict_lock = threading.Lock()
+
+    @property
+    def isin_dict(self):
+        """
+        ISIN dictionary, read from the target bucket on first use
+
+        :returns:
+          isin_dict: IsinDictionary, None without isin_dict_key
+        """
+        if self.isin_dict_key and self._isin_dict is None:
+            with self._isin_dict_lock:
+                if self._isin_dict is None:
+                    self._isin_dict = IsinDictionary.read(
+                        self.isin_dict_key, self.s3_bucket_trg
+                    )
+        return self._isin_dict
+
+    def _list_source_files(self):
+        """
+        Lists the source files of the extract dates, files with the same
+        content as an already listed file are skipped if run_dedup is set
+
+        :returns:
+          files: dict of source file key -> size in bytes in processing order
+        """
+        files = {}
+        for date in self.extract_date_list:
+            # Sizes and ETags come from one listing, sorted by key
+            info = dict(sorted(self.s3_bucket_src.list_file_info(date).items()))
+            if self.dedup is not None:
+                for key in self.dedup.skip_files(info, self.s3_bucket_src.file_etag):
+                    del info[key]
+            files.update((key, size) for key, (size, _) in info.items())
+        return files
+
+    def _read_source_file(self, key: str):
+        """
+        Reads one source file, ISINs are encoded if an ISIN dictionary is used
+        and the columns are converted to lean dtypes if configured (without
+        removing repeated rows, see _drop_duplicates)
+
+        :param key: key of the source file
+        """
+        return self._prepare_source_data(self.s3_bucket_src.read_csv_to_df(key))
+
+    def _parse_source_file(self, content: bytes):
+        """
+        Parses the content of one source file like _read_source_file
+
+        :param content: bytes with the content of the source file
+        """
+        return self._prepare_source_data(pd.read_csv(BytesIO(content)))
+
+    def _prepare_source_data(self, data_frame: pd.DataFrame):
+        """
+        Validates the rows, encodes the ISINs and converts the columns to
+        lean dtypes if configured
+
+        :param data_frame: Pandas DataFrame with the rows of one source file
+        """
+        if self.validator is not None:
+            data_frame = self.validator.validate(data_frame)
+        if self.isin_dict is not None and not data_frame.empty:
+            # Rows without ISIN are removed by transform_report1 anyway
+            data_frame = data_frame.dropna(subset=[self.src_args.src_col_isin])
+            with self._isin_dict_lock:
+                data_frame[self.src_args.src_col_isin] = self.isin_dict.encode(
+                    data_frame[self.src_args.src_col_isin]
+                )
+        if self.run_args.run_lean_dtypes and not data_frame.empty:
+            data_frame = to_lean_dtypes(
+                data_frame, self.src_args, self.run_args.run_price_decimals
+            )
+        return data_frame
+
+    def _drop_duplicates(self, data_frame: pd.DataFrame):
+        """
+        Removes the repeated rows if run_dedup is set, the first row wins:
+        the source files have to be passed in the order of
+        _list_source_files, even if they are read concurrently
+
+        :param data_frame: Pandas DataFrame with the rows of one source file
+        """
+        if self.dedup is None:
+            return data_frame
+        return self.dedup.drop_duplicates(data_frame)
+
+    def decode_isins(self, data_frame: pd.DataFrame):
+        """
+        Replaces the ISIN codes by the ISIN strings
+
+        :param data_frame: Pandas DataFrame with encoded or plain ISINs
+
+        :returns:
+          data_frame: Pandas DataFrame with ISIN strings sorted by ISIN and date
+        """
+        isin_col = self.src_args.src_col_isin
+        if (
+            not self.isin_dict_key
+            # pyarrow Tables of the arrow engine contain plain ISINs
+            or isinstance(data_frame, pa.Table)
+            or data_frame.empty
+            or not is_integer_dtype(data_frame[isin_col])
+        ):
+            return data_frame
+        data_frame = data_frame.assign(
+            **{isin_col: self.isin_dict.decode(data_frame[isin_col])}
+        )
+        return data_frame.sort_values(
+            by=[isin_col, self.src_args.src_col_date], kind="stable", ignore_index=True
+        )
 
     def extract(self):
         """
         Read the source data and concatenates them to one Pandas DataFrame
+        (one pyarrow Table with the source columns for engines consuming Arrow,
+        the list of the raw file contents for engines scanning the csv files)
 
         :returns:
           data_frame: Pandas DataFrame with the extracted data
         """
         self._logger.info("Extracting Xetra source files started...")
-        files = [
-            key
-            for date in self.extract_date_list
-            for key in self.s3_bucket_src.list_files_in_prefix(date)
-        ]
+        files = list(self._list_source_files())
         if not files:
             data_frame = pd.DataFrame()
+        elif self.engine.source_format == SourceFormats.ARROW.value:
+            # Dates and times are kept as strings like in pandas
+            column_types = {
+                self.src_args.src_col_date: pa.string(),
+                self.src_args.src_col_time: pa.string(),
+            }
+            data_frame = pa.concat_tables(
+                [
+                    self.s3_bucket_src.read_csv_to_arrow(
+                        file, self.src_args.src_columns, column_types
+                    )
+                    for file in files
+                ],
+                promote_options="permissive",
+            )
+        elif self.engine.source_format == SourceFormats.CSV.value:
+            data_frame = [
+                self.s3_bucket_src.read_object(file, decompress=True) for file in files
+            ]
+        elif self.run_args.run_lean_dtypes:
+            frames = [
+                self._drop_duplicates(self._read_source_file(file)) for file in files
+            ]
+            frames = [frame for frame in frames if not frame.empty]
+            data_frame = concat_lean(frames) if frames else pd.DataFrame()
         else:
             data_frame = pd.concat(
-                [self.s3_bucket_src.read_csv_to_df(file) for file in files],
+                [self._drop_duplicates(self._read_source_file(file)) for file in files],
                 ignore_index=True,
             )
         self._logger.info("Extracting Xetra source files finished.")
@@ -128,117 +398,374 @@ class XetraETL:
         """
         Applies the necessary transformation to create report 1
 
-        :param data_frame: Pandas DataFrame as Input
+        :param data_frame: Pandas DataFrame (or pyarrow Table) as Input
 
         :returns:
-          data_frame: Transformed Pandas DataFrame as Output
+          data_frame: Transformed Pandas DataFrame (or pyarrow Table) as Output
         """
-        if data_frame.empty:
+        if len(data_frame) == 0:
             self._logger.info(
                 "The dataframe is empty. No transformations will be applied."
             )
-            return data_frame
+            return pd.DataFrame()
         self._logger.info(
             "Applying transformations to Xetra source data for report 1 started..."
         )
-        # Filtering necessary source columns
-        data_frame = data_frame.loc[:, self.src_args.src_columns]
-        # Removing rows with missing values
-        data_frame.dropna(inplace=True)
-        # Calculating opening price per ISIN and day
-        data_frame[self.trg_args.trg_col_op_price] = (
-            data_frame.sort_values(by=[self.src_args.src_col_time])
-            .groupby([self.src_args.src_col_isin, self.src_args.src_col_date])[
-                self.src_args.src_col_start_price
-            ]
-            .transform("first")
-        )
-        # Calculating closing price per ISIN and day
-        data_frame[self.trg_args.trg_col_clos_price] = (
-            data_frame.sort_values(by=[self.src_args.src_col_time])
-            .groupby([self.src_args.src_col_isin, self.src_args.src_col_date])[
-                self.src_args.src_col_start_price
-            ]
-            .transform("last")
-        )
-        # Renaming columns
-        data_frame.rename(
-            columns={
-                self.src_args.src_col_min_price: self.trg_args.trg_col_min_price,
-                self.src_args.src_col_max_price: self.trg_args.trg_col_max_price,
-                self.src_args.src_col_traded_vol: self.trg_args.trg_col_dail_trad_vol,
-            },
-            inplace=True,
-        )
-        # Aggregating per ISIN and day -> opening price, closing price,
-        # minimum price, maximum price, traded volume
-        data_frame = data_frame.groupby(
-            [self.src_args.src_col_isin, self.src_args.src_col_date], as_index=False
-        ).agg(
-            {
-                self.trg_args.trg_col_op_price: "min",
-                self.trg_args.trg_col_clos_price: "min",
-                self.trg_args.trg_col_min_price: "min",
-                self.trg_args.trg_col_max_price: "max",
-                self.trg_args.trg_col_dail_trad_vol: "sum",
-            }
-        )
-        # Change of current day's closing price compared to the
-        # previous trading day's closing price in %
-        data_frame[self.trg_args.trg_col_ch_prev_clos] = (
-            data_frame.sort_values(by=[self.src_args.src_col_date])
-            .groupby([self.src_args.src_col_isin])[self.trg_args.trg_col_op_price]
-            .shift(1)
+        data_frame = self.engine.transform_report1(data_frame, self.extract_date)
+        self._logger.info("Applying transformations to Xetra source data finished...")
+        return data_frame
+
+    def transform_report1_out_of_core(self):
+        """
+        Extracts the source data into day partitions spilled to local
+        parquet files and creates report 1 one day at a time, so only the
+        spill memory budget and one day of source data have to fit in memory
+
+        :returns:
+          data_frame: Transformed Pandas DataFrame as Output
+        """
+        pandas_engine = PandasEngine(self.src_args, self.trg_args, self.run_args)
+        self._logger.info(
+            "Extracting Xetra source files to %s started...",
+            self.run_args.run_spill_dir,
         )
-        data_frame[self.trg_args.trg_col_ch_prev_clos] = (
-            (
-                data_frame[self.trg_args.trg_col_op_price]
-                - data_frame[self.trg_args.trg_col_ch_prev_clos]
+        with SpillStore(
+            self.run_args.run_spill_dir,
+            self.run_args.run_spill_memory_mb,
+            self.src_args.src_col_date,
+            [self.src_args.src_col_isin, self.src_args.src_col_time],
+        ) as spill_store:
+            for key in self._list_source_files():
+                data_frame = self._drop_duplicates(self._read_source_file(key))
+                if not data_frame.empty:
+                    spill_store.append(
+                        data_frame.loc[:, self.src_args.src_columns].dropna()
+                    )
+            spill_store.flush()
+            self._logger.info("Extracting Xetra source files finished.")
+            if not spill_store.partitions():
+                self._logger.info(
+                    "The dataframe is empty. No transformations will be applied."
+                )
+                return pd.DataFrame()
+            self._logger.info(
+                "Applying transformations to Xetra source data for report 1 started..."
             )
-            / data_frame[self.trg_args.trg_col_ch_prev_clos]
-            * 100
-        )
-        # Rounding to 2 decimals
-        data_frame = data_frame.round(decimals=2)
-        # Removing the day before extract_date
-        data_frame = data_frame[data_frame.Date >= self.extract_date].reset_index(
-            drop=True
+            # Merging the spilled runs of one day at a time
+            data_frame = pd.concat(
+                [
+                    pandas_engine.aggregate_report1(
+                        spill_store.read_partition(partition)
+                    )
+                    for partition in spill_store.partitions()
+                ],
+                ignore_index=True,
+            )
+        data_frame = data_frame.sort_values(
+            by=[self.src_args.src_col_isin, self.src_args.src_col_date],
+            kind="stable",
+            ignore_index=True,
         )
+        data_frame = pandas_engine.finalize_report1(data_frame, self.extract_date)
         self._logger.info("Applying transformations to Xetra source data finished...")
         return data_frame
 
+    def _write_report(self, data_frame: pd.DataFrame, target_key: str):
+        """
+        Writes the report, pyarrow Tables are written without pandas
+
+        :param data_frame: Pandas DataFrame or pyarrow Table
+        :param target_key: key of the report file
+        """
+        if isinstance(data_frame, pa.Table):
+            return self.s3_bucket_trg.write_table_to_s3(
+                data_frame,
+                target_key,
+                self.trg_args.trg_format,
+                self.trg_args.trg_compression,
+            )
+        return self.s3_bucket_trg.write_df_to_s3(
+            data_frame,
+            target_key,
+            self.trg_args.trg_format,
+            self.trg_args.trg_compression,
+        )
+
+    def _write_new_report(self, data_frame: pd.DataFrame, target_key: str):
+        """
+        Writes the report if the manifest has no report with the same
+        content hash and adds the written report to the manifest, a
+        report with the same content becomes the latest report again
+
+        :param data_frame: Pandas DataFrame or pyarrow Table
+        :param target_key: key of the report file
+
+        :returns:
+          written: True if the report was written, False if it was unchanged
+        """
+        if isinstance(data_frame, pa.Table):
+            content = self.s3_bucket_trg.table_to_bytes(
+                data_frame,
+                self.trg_args.trg_format,
+                compression=self.trg_args.trg_compression,
+            )
+        else:
+            content = self.s3_bucket_trg.df_to_bytes(
+                data_frame, self.trg_args.trg_format, self.trg_args.trg_compression
+            )
+        content_hash = ReportManifest.content_hash(content)
+        manifest = ReportManifest.read(self.manifest_key, self.s3_bucket_trg)
+        report = manifest.find(content_hash)
+        if report is not None:
+            self._logger.info(
+                "Xetra target data unchanged (same content as %s). No file written.",
+                report[ReportManifestFormat.MANIFEST_KEY.value],
+            )
+            # Later reports with other content must not win over this one
+            manifest.refresh_report(report)
+            manifest.write(self.manifest_key, self.s3_bucket_trg)
+            return False
+        self.s3_bucket_trg.write_object(content, target_key)
+        self._logger.info("Xetra target data successfully written.")
+        manifest.add_report(
+            target_key,
+            content_hash,
+            len(content),
+            ReportManifest.report_stats(
+                data_frame, self.src_args.src_col_date, self.src_args.src_col_isin
+            ),
+        )
+        manifest.write(self.manifest_key, self.s3_bucket_trg)
+        self._logger.info("Xetra report manifest successfully updated.")
+        return True
+
     def load(self, data_frame: pd.DataFrame):
         """
-        Saves a Pandas DataFrame to the target
+        Saves a Pandas DataFrame (or pyarrow Table) to the target
+
+        :param data_frame: Pandas DataFrame or pyarrow Table as Input
+        """
+        self._write_target(data_frame)
+        self.update_meta()
+        return True
 
-        :param data_frame: Pandas DataFrame as Input
+    def _write_target(self, data_frame: pd.DataFrame):
         """
+        Writes report 1 to the target
+
+        :param data_frame: Pandas DataFrame or pyarrow Table as Input
+        """
+        # Decoding ISIN codes
+        data_frame = self.decode_isins(data_frame)
         # Creating target key
         target_key = (
             f"{self.trg_args.trg_key}"
             f"{datetime.today().strftime(self.trg_args.trg_key_date_format)}."
-            f"{self.trg_args.trg_format}"
+            f"{file_extension(self.trg_args.trg_format, self.trg_args.trg_compression)}"
         )
         # Writing to target
+        if self.manifest_key and len(data_frame) > 0:
+            self._write_new_report(data_frame, target_key)
+        else:
+            self._write_report(data_frame, target_key)
+            self._logger.info("Xetra target data successfully written.")
+
+    def write_quarantine(self):
+        """
+        Logs the counts of the validation rules and writes the rejected rows
+        """
+        self.validator.log_counts()
+        data_frame = self.validator.quarantine()
+        if not self.run_args.run_quarantine_key or data_frame.empty:
+            return
+        quarantine_key = (
+            f"{self.run_args.run_quarantine_key}"
+            f"{datetime.today().strftime(self.trg_args.trg_key_date_format)}."
+            f"{S3FileTypes.PARQUET.value}"
+        )
         self.s3_bucket_trg.write_df_to_s3(
-            data_frame, target_key, self.trg_args.trg_format
+            data_frame,
+            quarantine_key,
+            S3FileTypes.PARQUET.value,
+            S3Compressions.ZSTD.value,
         )
-        self._logger.info("Xetra target data successfully written.")
+        self._logger.info("Rejected Xetra source rows written to quarantine.")
+
+    def update_meta(self):
+        """
+        Updates the meta file and the ISIN dictionary after report 1 is written
+        """
         # Updating meta file
         MetaProcess.update_meta_file(
             self.meta_update_list, self.meta_key, self.s3_bucket_trg
         )
         self._logger.info("Xetra meta file successfully updated.")
-        return True
+        # Updating ISIN dictionary (a dictionary never read has no new ISINs)
+        if self._isin_dict is not None and self._isin_dict.is_modified:
+            self.isin_dict.write(self.isin_dict_key, self.s3_bucket_trg)
+            self._logger.info("Xetra ISIN dictionary successfully updated.")
+
+    def transform_report1_pipelined(self):
+        """
+        Downloads, parses and aggregates the source files concurrently:
+        every stage has its own workers and a bounded input queue, so the
+        network, the csv parser and the aggregation are busy at the same time
+
+        :returns:
+          data_frame: Transformed Pandas DataFrame as Output
+        """
+        pandas_engine = PandasEngine(self.src_args, self.trg_args, self.run_args)
+        files = list(self._list_source_files())
+        stages = [
+            PipelineStage(
+                "download",
+                lambda key: self.s3_bucket_src.read_object(key, decompress=True),
+                self.run_args.run_download_workers,
+                self.run_args.run_queue_size,
+            ),
+            PipelineStage(
+                "parse",
+                self._parse_source_file,
+                self.run_args.run_parse_workers,
+                self.run_args.run_queue_size,
+            ),
+            PipelineStage(
+                "aggregate",
+                lambda data_frame: (
+                    pandas_engine.aggregate_report1(data_frame, partial=True)
+                    if not data_frame.empty
+                    else data_frame
+                ),
+                self.run_args.run_aggregate_workers,
+                self.run_args.run_queue_size,
+            ),
+        ]
+        if self.dedup is not None:
+            # Repeated rows are removed in the order of the source files
+            stages.insert(
+                2,
+                PipelineStage(
+                    "dedup",
+                    self._drop_duplicates,
+                    queue_size=self.run_args.run_queue_size,
+                    ordered=True,
+                ),
+            )
+        self._logger.info("Xetra source file pipeline started...")
+        partials = run_pipeline(files, stages)
+        self._logger.info("Xetra source file pipeline finished.")
+        # Partial aggregates are merged in the order of the source files
+        data_frame = pandas_engine.merge_report1_partials(partials)
+        if data_frame.empty:
+            self._logger.info(
+                "The dataframe is empty. No transformations will be applied."
+            )
+            return pd.DataFrame()
+        return pandas_engine.finalize_report1(data_frame, self.extract_date)
+
+    def transform_report1_batched(self):
+        """
+        Extracts and aggregates the source files in batches that fit into
+        run_max_memory_mb: the batches are sized by the file sizes of the
+        listing and the expansion ratio observed while parsing, so they
+        shrink or grow during the run; the workers only read as many
+        file bytes at the same time as fit into run_max_memory_mb
+
+        :returns:
+          data_frame: Transformed Pandas DataFrame as Output
+        """
+        pandas_engine = PandasEngine(self.src_args, self.trg_args, self.run_args)
+        files = self._list_source_files()
+        batcher = AdaptiveBatcher(self.run_args.run_max_memory_mb)
+        in_flight = InFlightBytes(batcher.read_bytes())
+        partials = []
+
+        def read_source_file(key: str):
+            with in_flight.reserve(files[key]):
+                return self._read_source_file(key)
+
+        self._logger.info("Extracting Xetra source files in batches started...")
+        # The workers only read the files of the current batch
+        with ThreadPoolExecutor(self.run_args.run_download_workers) as executor:
+            for batch in batcher.batches(files):
+                in_flight.limit = batcher.read_bytes()
+                frames = []
+                # Repeated rows are removed in the order of the batch files
+                for key, data_frame in zip(
+                    batch, executor.map(read_source_file, batch)
+                ):
+                    batcher.observe(
+                        files[key], int(data_frame.memory_usage(deep=True).sum())
+                    )
+                    data_frame = self._drop_duplicates(data_frame)
+                    if not data_frame.empty:
+                        frames.append(data_frame)
+                if not frames:
+                    continue
+                data_frame = (
+                    concat_lean(frames)
+                    if self.run_args.run_lean_dtypes
+                    else pd.concat(frames, ignore_index=True)
+                )
+                partial = pandas_engine.aggregate_report1(data_frame, partial=True)
+                # The aggregates are kept until all batches are read
+                batcher.hold(int(partial.memory_usage(deep=True).sum()))
+                partials.append(partial)
+        self._logger.info("Extracting Xetra source files in batches finished.")
+        data_frame = pandas_engine.merge_report1_partials(partials)
+        if data_frame.empty:
+            self._logger.info(
+                "The dataframe is empty. No transformations will be applied."
+            )
+            return pd.DataFrame()
+        return pandas_engine.finalize_report1(data_frame, self.extract_date)
+
+    def _stage(self, name: str):
+        """
+        Context manager profiling a stage of etl_report1 if a profiler is set
+
+        :param name: name of the stage
+        """
+        return self.profiler.stage(name) if self.profiler else nullcontext()
 
     def etl_report1(self):
         """
         Extract, transform and load to create report 1
         """
-        # Extraction
-        data_frame = self.extract()
-        # Transformation
-        data_frame = self.transform_report1(data_frame)
+        if self.run_args.run_spill_dir:
+            # Extraction and transformation with spilling to disk
+            with self._stage("transform_report1_out_of_core"):
+                data_frame = self.transform_report1_out_of_core()
+        elif self.run_args.run_max_memory_mb:
+            # Extraction and transformation in batches under a memory budget
+            with self._stage("transform_report1_batched"):
+                data_frame = self.transform_report1_batched()
+        elif self.run_args.run_pipeline:
+            # Extraction and transformation overlapping in a pipeline
+            with self._stage("transform_report1_pipelined"):
+                data_frame = self.transform_report1_pipelined()
+        else:
+            # Extraction
+            with self._stage("extract"):
+                data_frame = self.extract()
+            # Transformation
+            with self._stage("transform_report1"):
+                data_frame = self.transform_report1(data_frame)
         # Load
-        self.load(data_frame)
+        with self._stage("load"):
+            data_frame = self.decode_isins(data_frame)
+            self._write_target(data_frame)
+        if self.dedup is not None:
+            self.dedup.log_counts()
+        if self.validator is not None:
+            with self._stage("quarantine"):
+                self.write_quarantine()
+        with self._stage("update_meta"):
+            self.update_meta()
+        # Reports derived from report 1 are created with pandas
+        if self.derived_reports and isinstance(data_frame, pa.Table):
+            data_frame = data_frame.to_pandas()
+        for report in self.derived_reports:
+            with self._stage(type(report).__name__):
+                report.run(data_frame)
         return True